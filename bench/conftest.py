@@ -0,0 +1,5 @@
+import sys
+import os
+
+project_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_dir)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic configurations for the benchmarks, every function returns the
+text of an INI file in the StdConfigParser format.
+"""
+
+
+def many_sections(sections=5000, options=5):
+    """Many small sections."""
+    lines = []
+    for s in range(sections):
+        lines.append("[section %d]" % s)
+        for o in range(options):
+            lines.append("option%d = value %d/%d" % (o, s, o))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def multiline(sections=100, values=5, lines=50):
+    """Long multi line values with comments and empty lines inside."""
+    result = []
+    for s in range(sections):
+        result.append("[section %d]" % s)
+        for v in range(values):
+            result.append("value%d =" % v)
+            for line in range(lines):
+                if line % 10 == 5:
+                    result.append("    # comment")
+                elif line % 10 == 9:
+                    result.append("")
+                else:
+                    result.append("    line %d of value %d" % (line, v))
+        result.append("")
+    return "\n".join(result)
+
+
+def chain(depth=200, sections=10):
+    """Deep chains of ${} references, every option refers to the previous
+    one, the first option of a section to the last one of the previous
+    section.
+    """
+    lines = ["[section 0]", "option0 = start"]
+    for s in range(sections):
+        if s:
+            lines.append("[section %d]" % s)
+            lines.append("option0 = ${section %d:option%d}/0"
+                         % (s - 1, depth - 1))
+        for o in range(1, depth):
+            lines.append("option%d = ${option%d}/%d" % (o, o - 1, o))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def large_default(defaults=2000, sections=50, options=5):
+    """A big DEFAULT section merged into every section."""
+    lines = ["[DEFAULT]"]
+    for d in range(defaults):
+        lines.append("default%d = default value %d" % (d, d))
+    lines.append("")
+    for s in range(sections):
+        lines.append("[section %d]" % s)
+        for o in range(options):
+            lines.append("option%d = value %d/%d" % (o, s, o))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def commented(sections=2000, options=10):
+    """A DEFAULT section and sections with a comment, options and a multi
+    line value with an empty line inside.
+    """
+    lines = ["[DEFAULT]", "base = /srv", ""]
+    for s in range(sections):
+        lines.append("[section %d]" % s)
+        lines.append("# comment for section %d" % s)
+        for o in range(options):
+            lines.append("option%d = value %d/%d" % (o, s, o))
+        lines.append("multi = first line")
+        lines.append("    second line")
+        lines.append("")
+        lines.append("    third line")
+        lines.append("")
+    return "\n".join(lines)
+
+
+CONFIGS = {
+    "many_sections": many_sections,
+    "multiline": multiline,
+    "chain": chain,
+    "large_default": large_default,
+    "commented": commented,
+}
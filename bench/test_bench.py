@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the hot paths of StdConfigParser, run with ``do.py bench``.
+Needs the pytest-benchmark plugin.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pickle
+import pytest
+import threading
+from io import StringIO
+
+from stdconfigparser import (StdConfigParser, MAX_INTERPOLATION_DEPTH,
+                             ReloadableConfig, LayeredConfig, Schema,
+                             ConfigParser, Interpolation)
+from generators import (CONFIGS, chain, commented, large_default,
+                        many_sections)
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _parser(text, interpolate=False):
+    parser = StdConfigParser(interpolate=interpolate)
+    parser.read_string(text)
+    return parser
+
+
+@pytest.mark.parametrize("config", sorted(CONFIGS))
+def test_read(benchmark, config):
+    text = CONFIGS[config]()
+    benchmark(_parser, text)
+
+
+@pytest.mark.parametrize("implementation", ["configparser",
+                                            "stdconfigparser"])
+def test_read_configparser(benchmark, implementation):
+    # the same dialect read by the tokenizer of StdConfigParser and by
+    # configparser, which matches every line with several expressions
+    text = commented()
+
+    def read():
+        if implementation == "configparser":
+            parser = ConfigParser(comment_prefixes=("#", ),
+                                  inline_comment_prefixes=None,
+                                  interpolation=Interpolation())
+        else:
+            parser = StdConfigParser()
+        parser.read_string(text)
+        return parser.get("section 1999", "multi")
+    assert benchmark(read) == "first line\nsecond line\n\nthird line"
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_cache(benchmark, tmpdir, cache):
+    ini = tmpdir.join("bench.ini")
+    ini.write(commented())
+    cache_dir = str(tmpdir.join("cache")) if cache else None
+
+    def read():
+        parser = StdConfigParser(cache_dir=cache_dir)
+        parser.read(str(ini))
+        return parser
+    # fill the cache outside of the measured rounds
+    read()
+    assert benchmark(read).has_section("section 1999")
+
+
+def test_read_lazy(benchmark):
+    text = many_sections()
+
+    def read():
+        parser = StdConfigParser(lazy=True)
+        parser.read_string(text)
+        return parser["section 2500"]["option1"]
+    assert benchmark(read) == "value 2500/1"
+
+
+def test_get(benchmark):
+    parser = _parser(many_sections())
+    keys = [("section %d" % s, "option%d" % (s % 5)) for s in range(5000)]
+
+    def get():
+        for section, option in keys:
+            parser.get(section, option)
+    benchmark(get)
+
+
+def test_get_default(benchmark):
+    parser = _parser(large_default())
+    keys = [("section %d" % (d % 50), "default%d" % d) for d in range(2000)]
+
+    def get():
+        for section, option in keys:
+            parser.get(section, option)
+    benchmark(get)
+
+
+def test_section_proxy(benchmark):
+    parser = _parser(many_sections())
+
+    def get():
+        for s in range(5000):
+            parser["section %d" % s].get("option0")
+    benchmark(get)
+
+
+def test_interpolate_chain(benchmark):
+    # get() is limited to MAX_INTERPOLATION_DEPTH nested references
+    parser = _parser(chain(depth=MAX_INTERPOLATION_DEPTH, sections=1),
+                     interpolate=True)
+    option = "option%d" % (MAX_INTERPOLATION_DEPTH - 1)
+
+    def get():
+        # every round starts without the interpolation cache
+        parser._clear_caches()
+        return parser.get("section 0", option)
+    assert benchmark(get).startswith("start/")
+
+
+def test_resolve_all(benchmark):
+    parser = _parser(chain(), interpolate=True)
+
+    def resolve():
+        parser._clear_caches()
+        return parser.resolve_all()
+    benchmark(resolve)
+
+
+@pytest.mark.parametrize("config", ["many_sections", "multiline"])
+def test_write(benchmark, config):
+    parser = _parser(CONFIGS[config]())
+    benchmark(lambda: parser.write(StringIO()))
+
+
+@pytest.mark.parametrize("fsync", [False, True])
+def test_write_file(benchmark, tmpdir, fsync):
+    parser = _parser(many_sections(20000))      # 100000 options
+    ini = str(tmpdir.join("bench.ini"))
+    benchmark(parser.write_file, ini, fsync=fsync)
+
+
+def test_reload(benchmark, tmpdir):
+    ini = tmpdir.join("bench.ini")
+    ini.write(many_sections())
+    config = ReloadableConfig(str(ini))
+    benchmark(config.reload)
+
+
+@pytest.mark.parametrize("access", ["parser", "reloadable"])
+def test_reload_reader(benchmark, tmpdir, access):
+    ini = tmpdir.join("bench.ini")
+    ini.write(many_sections())
+    config = ReloadableConfig(str(ini))
+    keys = [("section %d" % s, "option%d" % (s % 5)) for s in range(5000)]
+
+    def get_parser():
+        # the recommended way, one parser for a unit of work
+        parser = config.parser
+        for section, option in keys:
+            parser.get(section, option)
+
+    def get_reloadable():
+        for section, option in keys:
+            config.get(section, option)
+    benchmark(get_parser if access == "parser" else get_reloadable)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pickle(benchmark, lazy):
+    # 10000 options, the pickle size is stored in extra_info
+    parser = StdConfigParser(lazy=lazy)
+    parser.read_string(many_sections(2000))
+
+    def round_trip():
+        data = pickle.dumps(parser, pickle.HIGHEST_PROTOCOL)
+        return len(data), pickle.loads(data)
+    size, copy = benchmark(round_trip)
+    benchmark.extra_info["size"] = size
+    assert copy.sections() == parser.sections()
+
+
+@pytest.mark.parametrize("threads", [1, 8, 32])
+@pytest.mark.parametrize("threadsafe", [False, True])
+def test_threads(benchmark, threads, threadsafe):
+    parser = StdConfigParser(threadsafe=threadsafe)
+    parser.read_string(many_sections(500))
+    keys = [("section %d" % s, "option%d" % (s % 5)) for s in range(500)] * 4
+
+    def read():
+        for section, option in keys:
+            parser.get(section, option)
+
+    def write():
+        for i in range(10):
+            parser.set("section 0", "option0", str(i))
+
+    def run():
+        pool = [threading.Thread(target=read) for _ in range(threads)]
+        pool.append(threading.Thread(target=write))
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    benchmark(run)
+
+
+@pytest.mark.parametrize("swap", ["read_all", "set_layer"])
+def test_layered_reload(benchmark, swap):
+    # four layers, the small env layer changes on each reload
+    texts = [many_sections(2000), many_sections(500), many_sections(50)]
+    layers = [("vendor", _parser(texts[0])), ("site", _parser(texts[1])),
+              ("host", _parser(texts[2]))]
+    env = "[section 1]\noption1 = env\n"
+    config = LayeredConfig(layers + [("env", _parser(env))])
+
+    def reload():
+        if swap == "read_all":
+            parser = StdConfigParser()
+            for text in texts + [env]:
+                parser.read_string(text)
+            return parser.get("section 1", "option1")
+        config.set_layer("env", _parser(env))
+        return config.get("section 1", "option1")
+    assert benchmark(reload) == "env"
+
+
+@pytest.mark.parametrize("layered", [False, True])
+def test_layered_get(benchmark, layered):
+    texts = [many_sections(), many_sections(500), many_sections(50)]
+    if layered:
+        parser = LayeredConfig((str(i), _parser(text))
+                               for i, text in enumerate(texts))
+    else:
+        parser = StdConfigParser()
+        for text in texts:
+            parser.read_string(text)
+    keys = [("section %d" % s, "option%d" % (s % 5)) for s in range(5000)]
+
+    def get():
+        for section, option in keys:
+            parser.get(section, option)
+    benchmark(get)
+
+
+@pytest.mark.parametrize("overlay", [False, True])
+def test_environ(benchmark, overlay):
+    # 10000 environment variables, 20 of them override options
+    environ = dict(("VAR%d" % i, str(i)) for i in range(10000))
+    for s in range(20):
+        environ["APP__SECTION_%d__OPTION0" % s] = "env"
+    parser = _parser(many_sections(500))
+    keys = [("section %d" % s, "option0") for s in range(20)]
+
+    def startup():
+        if overlay:
+            parser.overlay_environ("APP", environ)
+        else:
+            for name, value in environ.items():
+                parts = name.split("__")
+                if len(parts) == 3 and parts[0] == "APP":
+                    parser.set(parts[1].lower().replace("_", " "),
+                               parts[2].lower(), value)
+        return [parser.get(section, option) for section, option in keys]
+    assert benchmark(startup) == ["env"] * 20
+
+
+@pytest.mark.parametrize("schema", [False, True])
+def test_schema(benchmark, schema):
+    # 500 options read with getint()
+    parser = _parser("".join("[section %d]\n%s" % (s, "".join(
+        "option%d = %d\n" % (o, o) for o in range(5))) for s in range(100)))
+    compiled = Schema(dict(
+        ("section %d" % s, dict(("option%d" % o, "int") for o in range(5)))
+        for s in range(100)))
+
+    def startup():
+        if schema:
+            return compiled.validate(parser).section_99.option4
+        values = {}
+        for section in parser.sections():
+            for option in parser.options(section):
+                values[section, option] = parser.getint(section, option)
+        return values["section 99", "option4"]
+    assert benchmark(startup) == 4
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_sections_under(benchmark, index):
+    # 10 of 10000 sections named service:N:M
+    parser = StdConfigParser()
+    parser.read_dict(dict(("service:%d:%d" % (n, m), {})
+                          for n in range(1000) for m in range(10)))
+
+    def find():
+        if index:
+            return parser.sections_under("service:500")
+        return [section for section in parser.sections()
+                if section.startswith("service:500:")]
+    assert len(benchmark(find)) == 10
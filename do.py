@@ -15,6 +15,10 @@ from pathlib import Path
 CURRENTDIR = Path(__file__).parent
 VENVDIR = CURRENTDIR / "venv"
 PYTHON = VENVDIR / "py35" / "bin" / "python"
+# saved benchmark runs, the baselines are machine specific
+BENCHSTORAGE = CURRENTDIR / "bench" / ".benchmarks"
+# a benchmark fails if its median is slower than the baseline by more
+BENCHTHRESHOLD = "median:15%"
 
 
 def invalid():
@@ -31,6 +35,20 @@ def test():
         call([str(py), "-m", "pytest", "test"])
 
 
+def bench():
+    """Run the benchmarks and compare them with the last saved baseline."""
+    call([str(PYTHON), "-m", "pytest", "bench",
+          "--benchmark-storage", str(BENCHSTORAGE),
+          "--benchmark-compare", "--benchmark-compare-fail", BENCHTHRESHOLD])
+
+
+def benchsave():
+    """Run the benchmarks and save them as new baseline."""
+    call([str(PYTHON), "-m", "pytest", "bench",
+          "--benchmark-storage", str(BENCHSTORAGE),
+          "--benchmark-save", "baseline"])
+
+
 def teststyle():
     call([str(PYTHON), "-m", "flake8", "stdconfigparser.py"])
 
@@ -41,6 +59,8 @@ def dist():
 
 commands = {
     "test": test,
+    "bench": bench,
+    "benchsave": benchsave,
     "docu": docu,
     "teststyle": teststyle,
     "dist": dist,
@@ -1,1570 +1,4597 @@
-# -*- coding: utf-8 -*-
-# Copyright (c) 2016 - 2017 Wolfgang Langner
-#
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-# of this software and associated documentation files (the "Software"), to deal
-# in the Software without restriction, including without limitation the rights
-# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-# copies of the Software, and to permit persons to whom the Software is
-# furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all
-# copies or substantial portions of the Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-# SOFTWARE.
-
-"A standard INI style configuration parser."
-
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
-
-__version__ = "1.1"
-_is_release = all(int(v) for v in __version__.split("."))
-
-__all__ = ["NoSectionError", "DuplicateOptionError", "DuplicateSectionError",
-           "NoOptionError", "InterpolationError", "InterpolationDepthError",
-           "InterpolationMissingOptionError", "InterpolationSyntaxError",
-           "ParsingError", "MissingSectionHeaderError",
-           "ConfigParser", "SafeConfigParser", "RawConfigParser",
-           "Interpolation", "BasicInterpolation", "ExtendedInterpolation",
-           "LegacyInterpolation", "SectionProxy", "ConverterMapping",
-           "DEFAULTSECT", "MAX_INTERPOLATION_DEPTH",
-           "StdConfigParser"]
-
-
-import sys
-
-
-PY2 = sys.version_info[0] == 2
-PY33 = sys.version_info[:2] == (3, 3)
-PY34 = sys.version_info[:2] == (3, 4)
-
-
-def from_none(exc):
-    """raise from_none(ValueError('a')) == raise ValueError('a') from None"""
-    exc.__cause__ = None
-    exc.__suppress_context__ = True
-    return exc
-
-
-# whole Python 2 implementation based on the backport of configparser
-# lot of stuff copied also from Python standard library implementation
-if PY2:
-
-    from collections import MutableMapping
-    try:
-        from collections import OrderedDict
-    except ImportError:
-        from ordereddict import OrderedDict
-
-    from io import open
-    try:
-        from thread import get_ident
-    except ImportError:
-        try:
-            from _thread import get_ident
-        except ImportError:
-            from _dummy_thread import get_ident
-
-
-    # stuff from backports helpers
-
-    str = type('str') # same as str = unicode because of __future__.unicode_literals
-
-    # constants
-    DEFAULTSECT = "DEFAULT"
-
-    MAX_INTERPOLATION_DEPTH = 10
-
-    # Used in parser getters to indicate the default behaviour when a specific
-    # option is not found it to raise an exception. Created to enable `None' as
-    # a valid fallback value.
-    _UNSET = object()
-
-
-    # from reprlib 3.2.1
-    def recursive_repr(fillvalue='...'):
-        'Decorator to make a repr function return fillvalue for a recursive call'
-
-        def decorating_function(user_function):
-            repr_running = set()
-
-            def wrapper(self):
-                key = id(self), get_ident()
-                if key in repr_running:
-                    return fillvalue
-                repr_running.add(key)
-                try:
-                    result = user_function(self)
-                finally:
-                    repr_running.discard(key)
-                return result
-
-            # Can't use functools.wraps() here because of bootstrap issues
-            wrapper.__module__ = getattr(user_function, '__module__')
-            wrapper.__doc__ = getattr(user_function, '__doc__')
-            wrapper.__name__ = getattr(user_function, '__name__')
-            wrapper.__annotations__ = getattr(user_function, '__annotations__', {})
-            return wrapper
-
-        return decorating_function
-
-    # from collections 3.2.1
-    class ChainMap(MutableMapping):
-        ''' A ChainMap groups multiple dicts (or other mappings) together
-        to create a single, updateable view.
-
-        The underlying mappings are stored in a list.  That list is public and can
-        accessed or updated using the *maps* attribute.  There is no other state.
-
-        Lookups search the underlying mappings successively until a key is found.
-        In contrast, writes, updates, and deletions only operate on the first
-        mapping.
-
-        '''
-
-        def __init__(self, *maps):
-            '''Initialize a ChainMap by setting *maps* to the given mappings.
-            If no mappings are provided, a single empty dictionary is used.
-
-            '''
-            self.maps = list(maps) or [{}]          # always at least one map
-
-        def __missing__(self, key):
-            raise KeyError(key)
-
-        def __getitem__(self, key):
-            for mapping in self.maps:
-                try:
-                    return mapping[key]             # can't use 'key in mapping' with defaultdict
-                except KeyError:
-                    pass
-            return self.__missing__(key)            # support subclasses that define __missing__
-
-        def get(self, key, default=None):
-            return self[key] if key in self else default
-
-        def __len__(self):
-            return len(set().union(*self.maps))     # reuses stored hash values if possible
-
-        def __iter__(self):
-            return iter(set().union(*self.maps))
-
-        def __contains__(self, key):
-            return any(key in m for m in self.maps)
-
-        @recursive_repr()
-        def __repr__(self):
-            return '{0.__class__.__name__}({1})'.format(
-                self, ', '.join(map(repr, self.maps)))
-
-        @classmethod
-        def fromkeys(cls, iterable, *args):
-            'Create a ChainMap with a single dict created from the iterable.'
-            return cls(dict.fromkeys(iterable, *args))
-
-        def copy(self):
-            'New ChainMap or subclass with a new copy of maps[0] and refs to maps[1:]'
-            return self.__class__(self.maps[0].copy(), *self.maps[1:])
-
-        __copy__ = copy
-
-        def new_child(self):                        # like Django's Context.push()
-            'New ChainMap with a new dict followed by all previous maps.'
-            return self.__class__({}, *self.maps)
-
-        @property
-        def parents(self):                          # like Django's Context.pop()
-            'New ChainMap from maps[1:].'
-            return self.__class__(*self.maps[1:])
-
-        def __setitem__(self, key, value):
-            self.maps[0][key] = value
-
-        def __delitem__(self, key):
-            try:
-                del self.maps[0][key]
-            except KeyError:
-                raise KeyError('Key not found in the first mapping: {!r}'.format(key))
-
-        def popitem(self):
-            'Remove and return an item pair from maps[0]. Raise KeyError is maps[0] is empty.'
-            try:
-                return self.maps[0].popitem()
-            except KeyError:
-                raise KeyError('No keys found in the first mapping.')
-
-        def pop(self, key, *args):
-            'Remove *key* from maps[0] and return its value. Raise KeyError if *key* not in maps[0].'
-            try:
-                return self.maps[0].pop(key, *args)
-            except KeyError:
-                raise KeyError('Key not found in the first mapping: {!r}'.format(key))
-
-        def clear(self):
-            'Clear maps[0], leaving maps[1:] intact.'
-            self.maps[0].clear()
-
-if PY33 or PY34:
-
-    from reprlib import recursive_repr
-    from collections import ChainMap, MutableMapping, OrderedDict  # noqa
-    from configparser import _UNSET, DEFAULTSECT, MAX_INTERPOLATION_DEPTH
-
-if PY2 or PY33 or PY34:
-
-    import functools
-    from io import StringIO
-    import itertools
-    import re
-    import warnings
-
-
-    # exception classes
-    class Error(Exception):
-        """Base class for ConfigParser exceptions."""
-
-        def __init__(self, msg=''):
-            self.message = msg
-            Exception.__init__(self, msg)
-
-        def __repr__(self):
-            return self.message
-
-        __str__ = __repr__
-
-
-    class NoSectionError(Error):
-        """Raised when no section matches a requested option."""
-
-        def __init__(self, section):
-            Error.__init__(self, 'No section: %r' % (section,))
-            self.section = section
-            self.args = (section, )
-
-
-    class DuplicateSectionError(Error):
-        """Raised when a section is repeated in an input source.
-
-        Possible repetitions that raise this exception are: multiple creation
-        using the API or in strict parsers when a section is found more than once
-        in a single input file, string or dictionary.
-        """
-
-        def __init__(self, section, source=None, lineno=None):
-            msg = [repr(section), " already exists"]
-            if source is not None:
-                message = ["While reading from ", repr(source)]
-                if lineno is not None:
-                    message.append(" [line {0:2d}]".format(lineno))
-                message.append(": section ")
-                message.extend(msg)
-                msg = message
-            else:
-                msg.insert(0, "Section ")
-            Error.__init__(self, "".join(msg))
-            self.section = section
-            self.source = source
-            self.lineno = lineno
-            self.args = (section, source, lineno)
-
-
-    class DuplicateOptionError(Error):
-        """Raised by strict parsers when an option is repeated in an input source.
-
-        Current implementation raises this exception only when an option is found
-        more than once in a single file, string or dictionary.
-        """
-
-        def __init__(self, section, option, source=None, lineno=None):
-            msg = [repr(option), " in section ", repr(section),
-                   " already exists"]
-            if source is not None:
-                message = ["While reading from ", repr(source)]
-                if lineno is not None:
-                    message.append(" [line {0:2d}]".format(lineno))
-                message.append(": option ")
-                message.extend(msg)
-                msg = message
-            else:
-                msg.insert(0, "Option ")
-            Error.__init__(self, "".join(msg))
-            self.section = section
-            self.option = option
-            self.source = source
-            self.lineno = lineno
-            self.args = (section, option, source, lineno)
-
-
-    class NoOptionError(Error):
-        """A requested option was not found."""
-
-        def __init__(self, option, section):
-            Error.__init__(self, "No option %r in section: %r" %
-                           (option, section))
-            self.option = option
-            self.section = section
-            self.args = (option, section)
-
-
-    class InterpolationError(Error):
-        """Base class for interpolation-related exceptions."""
-
-        def __init__(self, option, section, msg):
-            Error.__init__(self, msg)
-            self.option = option
-            self.section = section
-            self.args = (option, section, msg)
-
-
-    class InterpolationMissingOptionError(InterpolationError):
-        """A string substitution required a setting which was not available."""
-
-        def __init__(self, option, section, rawval, reference):
-            msg = ("Bad value substitution: option {0!r} in section {1!r} contains "
-                   "an interpolation key {2!r} which is not a valid option name. "
-                   "Raw value: {3!r}".format(option, section, reference, rawval))
-            InterpolationError.__init__(self, option, section, msg)
-            self.reference = reference
-            self.args = (option, section, rawval, reference)
-
-
-    class InterpolationSyntaxError(InterpolationError):
-        """Raised when the source text contains invalid syntax.
-
-        Current implementation raises this exception when the source text into
-        which substitutions are made does not conform to the required syntax.
-        """
-
-
-    class InterpolationDepthError(InterpolationError):
-        """Raised when substitutions are nested too deeply."""
-
-        def __init__(self, option, section, rawval):
-            msg = ("Recursion limit exceeded in value substitution: option {0!r} "
-                   "in section {1!r} contains an interpolation key which "
-                   "cannot be substituted in {2} steps. Raw value: {3!r}"
-                   "".format(option, section, MAX_INTERPOLATION_DEPTH,
-                             rawval))
-            InterpolationError.__init__(self, option, section, msg)
-            self.args = (option, section, rawval)
-
-
-    class ParsingError(Error):
-        """Raised when a configuration file does not follow legal syntax."""
-
-        def __init__(self, source=None, filename=None):
-            # Exactly one of `source'/`filename' arguments has to be given.
-            # `filename' kept for compatibility.
-            if filename and source:
-                raise ValueError("Cannot specify both `filename' and `source'. "
-                                 "Use `source'.")
-            elif not filename and not source:
-                raise ValueError("Required argument `source' not given.")
-            elif filename:
-                source = filename
-            Error.__init__(self, 'Source contains parsing errors: %r' % source)
-            self.source = source
-            self.errors = []
-            self.args = (source, )
-
-        @property
-        def filename(self):
-            """Deprecated, use `source'."""
-            warnings.warn(
-                "The 'filename' attribute will be removed in future versions.  "
-                "Use 'source' instead.",
-                DeprecationWarning, stacklevel=2
-            )
-            return self.source
-
-        @filename.setter
-        def filename(self, value):
-            """Deprecated, user `source'."""
-            warnings.warn(
-                "The 'filename' attribute will be removed in future versions.  "
-                "Use 'source' instead.",
-                DeprecationWarning, stacklevel=2
-            )
-            self.source = value
-
-        def append(self, lineno, line):
-            self.errors.append((lineno, line))
-            self.message += '\n\t[line %2d]: %s' % (lineno, line)
-
-
-    class MissingSectionHeaderError(ParsingError):
-        """Raised when a key-value pair is found before any section header."""
-
-        def __init__(self, filename, lineno, line):
-            Error.__init__(
-                self,
-                'File contains no section headers.\nfile: %r, line: %d\n%r' %
-                (filename, lineno, line))
-            self.source = filename
-            self.lineno = lineno
-            self.line = line
-            self.args = (filename, lineno, line)
-
-
-
-    class Interpolation(object):
-        """Dummy interpolation that passes the value through with no changes."""
-
-        def before_get(self, parser, section, option, value, defaults):
-            return value
-
-        def before_set(self, parser, section, option, value):
-            return value
-
-        def before_read(self, parser, section, option, value):
-            return value
-
-        def before_write(self, parser, section, option, value):
-            return value
-
-
-    class BasicInterpolation(Interpolation):
-        """Interpolation as implemented in the classic ConfigParser.
-
-        The option values can contain format strings which refer to other values in
-        the same section, or values in the special default section.
-
-        For example:
-
-            something: %(dir)s/whatever
-
-        would resolve the "%(dir)s" to the value of dir.  All reference
-        expansions are done late, on demand. If a user needs to use a bare % in
-        a configuration file, she can escape it by writing %%. Other % usage
-        is considered a user error and raises `InterpolationSyntaxError'."""
-
-        _KEYCRE = re.compile(r"%\(([^)]+)\)s")
-
-        def before_get(self, parser, section, option, value, defaults):
-            L = []
-            self._interpolate_some(parser, option, L, value, section, defaults, 1)
-            return ''.join(L)
-
-        def before_set(self, parser, section, option, value):
-            tmp_value = value.replace('%%', '') # escaped percent signs
-            tmp_value = self._KEYCRE.sub('', tmp_value) # valid syntax
-            if '%' in tmp_value:
-                raise ValueError("invalid interpolation syntax in %r at "
-                                 "position %d" % (value, tmp_value.find('%')))
-            return value
-
-        def _interpolate_some(self, parser, option, accum, rest, section, map,
-                              depth):
-            rawval = parser.get(section, option, raw=True, fallback=rest)
-            if depth > MAX_INTERPOLATION_DEPTH:
-                raise InterpolationDepthError(option, section, rawval)
-            while rest:
-                p = rest.find("%")
-                if p < 0:
-                    accum.append(rest)
-                    return
-                if p > 0:
-                    accum.append(rest[:p])
-                    rest = rest[p:]
-                # p is no longer used
-                c = rest[1:2]
-                if c == "%":
-                    accum.append("%")
-                    rest = rest[2:]
-                elif c == "(":
-                    m = self._KEYCRE.match(rest)
-                    if m is None:
-                        raise InterpolationSyntaxError(option, section,
-                              "bad interpolation variable reference %r" % rest)
-                    var = parser.optionxform(m.group(1))
-                    rest = rest[m.end():]
-                    try:
-                        v = map[var]
-                    except KeyError:
-                        raise from_none(InterpolationMissingOptionError(
-                            option, section, rawval, var))
-                    if "%" in v:
-                        self._interpolate_some(parser, option, accum, v,
-                                               section, map, depth + 1)
-                    else:
-                        accum.append(v)
-                else:
-                    raise InterpolationSyntaxError(
-                        option, section,
-                        "'%%' must be followed by '%%' or '(', "
-                        "found: %r" % (rest,))
-
-
-    class ExtendedInterpolation(Interpolation):
-        """Advanced variant of interpolation, supports the syntax used by
-        `zc.buildout'. Enables interpolation between sections."""
-
-        _KEYCRE = re.compile(r"\$\{([^}]+)\}")
-
-        def before_get(self, parser, section, option, value, defaults):
-            L = []
-            self._interpolate_some(parser, option, L, value, section, defaults, 1)
-            return ''.join(L)
-
-        def before_set(self, parser, section, option, value):
-            tmp_value = value.replace('$$', '') # escaped dollar signs
-            tmp_value = self._KEYCRE.sub('', tmp_value) # valid syntax
-            if '$' in tmp_value:
-                raise ValueError("invalid interpolation syntax in %r at "
-                                 "position %d" % (value, tmp_value.find('$')))
-            return value
-
-        def _interpolate_some(self, parser, option, accum, rest, section, map,
-                              depth):
-            rawval = parser.get(section, option, raw=True, fallback=rest)
-            if depth > MAX_INTERPOLATION_DEPTH:
-                raise InterpolationDepthError(option, section, rawval)
-            while rest:
-                p = rest.find("$")
-                if p < 0:
-                    accum.append(rest)
-                    return
-                if p > 0:
-                    accum.append(rest[:p])
-                    rest = rest[p:]
-                # p is no longer used
-                c = rest[1:2]
-                if c == "$":
-                    accum.append("$")
-                    rest = rest[2:]
-                elif c == "{":
-                    m = self._KEYCRE.match(rest)
-                    if m is None:
-                        raise InterpolationSyntaxError(option, section,
-                              "bad interpolation variable reference %r" % rest)
-                    path = m.group(1).split(':')
-                    rest = rest[m.end():]
-                    sect = section
-                    opt = option
-                    try:
-                        if len(path) == 1:
-                            opt = parser.optionxform(path[0])
-                            v = map[opt]
-                        elif len(path) == 2:
-                            sect = path[0]
-                            opt = parser.optionxform(path[1])
-                            v = parser.get(sect, opt, raw=True)
-                        else:
-                            raise InterpolationSyntaxError(
-                                option, section,
-                                "More than one ':' found: %r" % (rest,))
-                    except (KeyError, NoSectionError, NoOptionError):
-                        raise from_none(InterpolationMissingOptionError(
-                            option, section, rawval, ":".join(path)))
-                    if "$" in v:
-                        self._interpolate_some(parser, opt, accum, v, sect,
-                                               dict(parser.items(sect, raw=True)),
-                                               depth + 1)
-                    else:
-                        accum.append(v)
-                else:
-                    raise InterpolationSyntaxError(
-                        option, section,
-                        "'$' must be followed by '$' or '{', "
-                        "found: %r" % (rest,))
-
-
-    class LegacyInterpolation(Interpolation):
-        """Deprecated interpolation used in old versions of ConfigParser.
-        Use BasicInterpolation or ExtendedInterpolation instead."""
-
-        _KEYCRE = re.compile(r"%\(([^)]*)\)s|.")
-
-        def before_get(self, parser, section, option, value, vars):
-            rawval = value
-            depth = MAX_INTERPOLATION_DEPTH
-            while depth:                    # Loop through this until it's done
-                depth -= 1
-                if value and "%(" in value:
-                    replace = functools.partial(self._interpolation_replace,
-                                                parser=parser)
-                    value = self._KEYCRE.sub(replace, value)
-                    try:
-                        value = value % vars
-                    except KeyError as e:
-                        raise from_none(InterpolationMissingOptionError(
-                            option, section, rawval, e.args[0]))
-                else:
-                    break
-            if value and "%(" in value:
-                raise InterpolationDepthError(option, section, rawval)
-            return value
-
-        def before_set(self, parser, section, option, value):
-            return value
-
-        @staticmethod
-        def _interpolation_replace(match, parser):
-            s = match.group(1)
-            if s is None:
-                return match.group()
-            else:
-                return "%%(%s)s" % parser.optionxform(s)
-
-
-    class RawConfigParser(MutableMapping):
-        """ConfigParser that does not do interpolation."""
-
-        # Regular expressions for parsing section headers and options
-        _SECT_TMPL = r"""
-            \[                                 # [
-            (?P<header>[^]]+)                  # very permissive!
-            \]                                 # ]
-            """
-        _OPT_TMPL = r"""
-            (?P<option>.*?)                    # very permissive!
-            \s*(?P<vi>{delim})\s*              # any number of space/tab,
-                                               # followed by any of the
-                                               # allowed delimiters,
-                                               # followed by any space/tab
-            (?P<value>.*)$                     # everything up to eol
-            """
-        _OPT_NV_TMPL = r"""
-            (?P<option>.*?)                    # very permissive!
-            \s*(?:                             # any number of space/tab,
-            (?P<vi>{delim})\s*                 # optionally followed by
-                                               # any of the allowed
-                                               # delimiters, followed by any
-                                               # space/tab
-            (?P<value>.*))?$                   # everything up to eol
-            """
-        # Interpolation algorithm to be used if the user does not specify another
-        _DEFAULT_INTERPOLATION = Interpolation()
-        # Compiled regular expression for matching sections
-        SECTCRE = re.compile(_SECT_TMPL, re.VERBOSE)
-        # Compiled regular expression for matching options with typical separators
-        OPTCRE = re.compile(_OPT_TMPL.format(delim="=|:"), re.VERBOSE)
-        # Compiled regular expression for matching options with optional values
-        # delimited using typical separators
-        OPTCRE_NV = re.compile(_OPT_NV_TMPL.format(delim="=|:"), re.VERBOSE)
-        # Compiled regular expression for matching leading whitespace in a line
-        NONSPACECRE = re.compile(r"\S")
-        # Possible boolean values in the configuration.
-        BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
-                          '0': False, 'no': False, 'false': False, 'off': False}
-
-        def __init__(self, defaults=None, dict_type=OrderedDict,
-                     allow_no_value=False, **kwargs):
-
-            # keyword-only arguments
-            delimiters = kwargs.get('delimiters', ('=', ':'))
-            comment_prefixes = kwargs.get('comment_prefixes', ('#', ';'))
-            inline_comment_prefixes = kwargs.get('inline_comment_prefixes', None)
-            strict = kwargs.get('strict', True)
-            empty_lines_in_values = kwargs.get('empty_lines_in_values', True)
-            default_section = kwargs.get('default_section', DEFAULTSECT)
-            interpolation = kwargs.get('interpolation', _UNSET)
-            converters = kwargs.get('converters', _UNSET)
-
-            self._dict = dict_type
-            self._sections = self._dict()
-            self._defaults = self._dict()
-            self._converters = ConverterMapping(self)
-            self._proxies = self._dict()
-            self._proxies[default_section] = SectionProxy(self, default_section)
-            if defaults:
-                for key, value in defaults.items():
-                    self._defaults[self.optionxform(key)] = value
-            self._delimiters = tuple(delimiters)
-            if delimiters == ('=', ':'):
-                self._optcre = self.OPTCRE_NV if allow_no_value else self.OPTCRE
-            else:
-                d = "|".join(re.escape(d) for d in delimiters)
-                if allow_no_value:
-                    self._optcre = re.compile(self._OPT_NV_TMPL.format(delim=d),
-                                              re.VERBOSE)
-                else:
-                    self._optcre = re.compile(self._OPT_TMPL.format(delim=d),
-                                              re.VERBOSE)
-            self._comment_prefixes = tuple(comment_prefixes or ())
-            self._inline_comment_prefixes = tuple(inline_comment_prefixes or ())
-            self._strict = strict
-            self._allow_no_value = allow_no_value
-            self._empty_lines_in_values = empty_lines_in_values
-            self.default_section = default_section
-            self._interpolation = interpolation
-            if self._interpolation is _UNSET:
-                self._interpolation = self._DEFAULT_INTERPOLATION
-            if self._interpolation is None:
-                self._interpolation = Interpolation()
-            if converters is not _UNSET:
-                self._converters.update(converters)
-
-        def defaults(self):
-            return self._defaults
-
-        def sections(self):
-            """Return a list of section names, excluding [DEFAULT]"""
-            # self._sections will never have [DEFAULT] in it
-            return list(self._sections.keys())
-
-        def add_section(self, section):
-            """Create a new section in the configuration.
-
-            Raise DuplicateSectionError if a section by the specified name
-            already exists. Raise ValueError if name is DEFAULT.
-            """
-            if section == self.default_section:
-                raise ValueError('Invalid section name: %r' % section)
-
-            if section in self._sections:
-                raise DuplicateSectionError(section)
-            self._sections[section] = self._dict()
-            self._proxies[section] = SectionProxy(self, section)
-
-        def has_section(self, section):
-            """Indicate whether the named section is present in the configuration.
-
-            The DEFAULT section is not acknowledged.
-            """
-            return section in self._sections
-
-        def options(self, section):
-            """Return a list of option names for the given section name."""
-            try:
-                opts = self._sections[section].copy()
-            except KeyError:
-                raise from_none(NoSectionError(section))
-            opts.update(self._defaults)
-            return list(opts.keys())
-
-        def read(self, filenames, encoding=None):
-            """Read and parse a filename or a list of filenames.
-
-            Files that cannot be opened are silently ignored; this is
-            designed so that you can specify a list of potential
-            configuration file locations (e.g. current directory, user's
-            home directory, systemwide directory), and all existing
-            configuration files in the list will be read.  A single
-            filename may also be given.
-
-            Return list of successfully read files.
-            """
-            if isinstance(filenames, (str, bytes)):
-                filenames = [filenames]
-            read_ok = []
-            for filename in filenames:
-                try:
-                    with open(filename, encoding=encoding) as fp:
-                        self._read(fp, filename)
-                except IOError:
-                    continue
-                read_ok.append(filename)
-            return read_ok
-
-        def read_file(self, f, source=None):
-            """Like read() but the argument must be a file-like object.
-
-            The `f' argument must be iterable, returning one line at a time.
-            Optional second argument is the `source' specifying the name of the
-            file being read. If not given, it is taken from f.name. If `f' has no
-            `name' attribute, `<???>' is used.
-            """
-            if source is None:
-                try:
-                    source = f.name
-                except AttributeError:
-                    source = '<???>'
-            self._read(f, source)
-
-        def read_string(self, string, source='<string>'):
-            """Read configuration from a given string."""
-            sfile = StringIO(string)
-            self.read_file(sfile, source)
-
-        def read_dict(self, dictionary, source='<dict>'):
-            """Read configuration from a dictionary.
-
-            Keys are section names, values are dictionaries with keys and values
-            that should be present in the section. If the used dictionary type
-            preserves order, sections and their keys will be added in order.
-
-            All types held in the dictionary are converted to strings during
-            reading, including section names, option names and keys.
-
-            Optional second argument is the `source' specifying the name of the
-            dictionary being read.
-            """
-            elements_added = set()
-            for section, keys in dictionary.items():
-                section = str(section)
-                try:
-                    self.add_section(section)
-                except (DuplicateSectionError, ValueError):
-                    if self._strict and section in elements_added:
-                        raise
-                elements_added.add(section)
-                for key, value in keys.items():
-                    key = self.optionxform(str(key))
-                    if value is not None:
-                        value = str(value)
-                    if self._strict and (section, key) in elements_added:
-                        raise DuplicateOptionError(section, key, source)
-                    elements_added.add((section, key))
-                    self.set(section, key, value)
-
-        def readfp(self, fp, filename=None):
-            """Deprecated, use read_file instead."""
-            warnings.warn(
-                "This method will be removed in future versions.  "
-                "Use 'parser.read_file()' instead.",
-                DeprecationWarning, stacklevel=2
-            )
-            self.read_file(fp, source=filename)
-
-        def get(self, section, option, **kwargs):
-            """Get an option value for a given section.
-
-            If `vars' is provided, it must be a dictionary. The option is looked up
-            in `vars' (if provided), `section', and in `DEFAULTSECT' in that order.
-            If the key is not found and `fallback' is provided, it is used as
-            a fallback value. `None' can be provided as a `fallback' value.
-
-            If interpolation is enabled and the optional argument `raw' is False,
-            all interpolations are expanded in the return values.
-
-            Arguments `raw', `vars', and `fallback' are keyword only.
-
-            The section DEFAULT is special.
-            """
-            # keyword-only arguments
-            raw = kwargs.get('raw', False)
-            vars = kwargs.get('vars', None)
-            fallback = kwargs.get('fallback', _UNSET)
-
-            try:
-                d = self._unify_values(section, vars)
-            except NoSectionError:
-                if fallback is _UNSET:
-                    raise
-                else:
-                    return fallback
-            option = self.optionxform(option)
-            try:
-                value = d[option]
-            except KeyError:
-                if fallback is _UNSET:
-                    raise NoOptionError(option, section)
-                else:
-                    return fallback
-
-            if raw or value is None:
-                return value
-            else:
-                return self._interpolation.before_get(self, section, option, value,
-                                                      d)
-
-        def _get(self, section, conv, option, **kwargs):
-            return conv(self.get(section, option, **kwargs))
-
-        def _get_conv(self, section, option, conv, **kwargs):
-            # keyword-only arguments
-            kwargs.setdefault('raw', False)
-            kwargs.setdefault('vars', None)
-            fallback = kwargs.pop('fallback', _UNSET)
-            try:
-                return self._get(section, conv, option, **kwargs)
-            except (NoSectionError, NoOptionError):
-                if fallback is _UNSET:
-                    raise
-                return fallback
-
-        # getint, getfloat and getboolean provided directly for backwards compat
-        def getint(self, section, option, **kwargs):
-            # keyword-only arguments
-            kwargs.setdefault('raw', False)
-            kwargs.setdefault('vars', None)
-            kwargs.setdefault('fallback', _UNSET)
-            return self._get_conv(section, option, int, **kwargs)
-
-        def getfloat(self, section, option, **kwargs):
-            # keyword-only arguments
-            kwargs.setdefault('raw', False)
-            kwargs.setdefault('vars', None)
-            kwargs.setdefault('fallback', _UNSET)
-            return self._get_conv(section, option, float, **kwargs)
-
-        def getboolean(self, section, option, **kwargs):
-            # keyword-only arguments
-            kwargs.setdefault('raw', False)
-            kwargs.setdefault('vars', None)
-            kwargs.setdefault('fallback', _UNSET)
-            return self._get_conv(section, option, self._convert_to_boolean,
-                                  **kwargs)
-
-        def items(self, section=_UNSET, raw=False, vars=None):
-            """Return a list of (name, value) tuples for each option in a section.
-
-            All % interpolations are expanded in the return values, based on the
-            defaults passed into the constructor, unless the optional argument
-            `raw' is true.  Additional substitutions may be provided using the
-            `vars' argument, which must be a dictionary whose contents overrides
-            any pre-existing defaults.
-
-            The section DEFAULT is special.
-            """
-            if section is _UNSET:
-                return super(RawConfigParser, self).items()
-            d = self._defaults.copy()
-            try:
-                d.update(self._sections[section])
-            except KeyError:
-                if section != self.default_section:
-                    raise NoSectionError(section)
-            # Update with the entry specific variables
-            if vars:
-                for key, value in vars.items():
-                    d[self.optionxform(key)] = value
-            value_getter = lambda option: self._interpolation.before_get(self,
-                                          section, option, d[option], d)
-            if raw:
-                value_getter = lambda option: d[option]
-            return [(option, value_getter(option)) for option in d.keys()]
-
-        def popitem(self):
-            """Remove a section from the parser and return it as
-            a (section_name, section_proxy) tuple. If no section is present, raise
-            KeyError.
-
-            The section DEFAULT is never returned because it cannot be removed.
-            """
-            for key in self.sections():
-                value = self[key]
-                del self[key]
-                return key, value
-            raise KeyError
-
-        def optionxform(self, optionstr):
-            return optionstr.lower()
-
-        def has_option(self, section, option):
-            """Check for the existence of a given option in a given section.
-            If the specified `section' is None or an empty string, DEFAULT is
-            assumed. If the specified `section' does not exist, returns False."""
-            if not section or section == self.default_section:
-                option = self.optionxform(option)
-                return option in self._defaults
-            elif section not in self._sections:
-                return False
-            else:
-                option = self.optionxform(option)
-                return (option in self._sections[section]
-                        or option in self._defaults)
-
-        def set(self, section, option, value=None):
-            """Set an option."""
-            if value:
-                value = self._interpolation.before_set(self, section, option,
-                                                       value)
-            if not section or section == self.default_section:
-                sectdict = self._defaults
-            else:
-                try:
-                    sectdict = self._sections[section]
-                except KeyError:
-                    raise from_none(NoSectionError(section))
-            sectdict[self.optionxform(option)] = value
-
-        def write(self, fp, space_around_delimiters=True):
-            """Write an .ini-format representation of the configuration state.
-
-            If `space_around_delimiters' is True (the default), delimiters
-            between keys and values are surrounded by spaces.
-            """
-            if space_around_delimiters:
-                d = " {0} ".format(self._delimiters[0])
-            else:
-                d = self._delimiters[0]
-            if self._defaults:
-                self._write_section(fp, self.default_section,
-                                    self._defaults.items(), d)
-            for section in self._sections:
-                self._write_section(fp, section,
-                                    self._sections[section].items(), d)
-
-        def _write_section(self, fp, section_name, section_items, delimiter):
-            """Write a single section to the specified `fp'."""
-            fp.write("[{0}]\n".format(section_name))
-            for key, value in section_items:
-                value = self._interpolation.before_write(self, section_name, key,
-                                                         value)
-                if value is not None or not self._allow_no_value:
-                    value = delimiter + str(value).replace('\n', '\n\t')
-                else:
-                    value = ""
-                fp.write("{0}{1}\n".format(key, value))
-            fp.write("\n")
-
-        def remove_option(self, section, option):
-            """Remove an option."""
-            if not section or section == self.default_section:
-                sectdict = self._defaults
-            else:
-                try:
-                    sectdict = self._sections[section]
-                except KeyError:
-                    raise from_none(NoSectionError(section))
-            option = self.optionxform(option)
-            existed = option in sectdict
-            if existed:
-                del sectdict[option]
-            return existed
-
-        def remove_section(self, section):
-            """Remove a file section."""
-            existed = section in self._sections
-            if existed:
-                del self._sections[section]
-                del self._proxies[section]
-            return existed
-
-        def __getitem__(self, key):
-            if key != self.default_section and not self.has_section(key):
-                raise KeyError(key)
-            return self._proxies[key]
-
-        def __setitem__(self, key, value):
-            # To conform with the mapping protocol, overwrites existing values in
-            # the section.
-
-            # XXX this is not atomic if read_dict fails at any point. Then again,
-            # no update method in configparser is atomic in this implementation.
-            if key == self.default_section:
-                self._defaults.clear()
-            elif key in self._sections:
-                self._sections[key].clear()
-            self.read_dict({key: value})
-
-        def __delitem__(self, key):
-            if key == self.default_section:
-                raise ValueError("Cannot remove the default section.")
-            if not self.has_section(key):
-                raise KeyError(key)
-            self.remove_section(key)
-
-        def __contains__(self, key):
-            return key == self.default_section or self.has_section(key)
-
-        def __len__(self):
-            return len(self._sections) + 1 # the default section
-
-        def __iter__(self):
-            # XXX does it break when underlying container state changed?
-            return itertools.chain((self.default_section,), self._sections.keys())
-
-        def _read(self, fp, fpname):
-            """Parse a sectioned configuration file.
-
-            Each section in a configuration file contains a header, indicated by
-            a name in square brackets (`[]'), plus key/value options, indicated by
-            `name' and `value' delimited with a specific substring (`=' or `:' by
-            default).
-
-            Values can span multiple lines, as long as they are indented deeper
-            than the first line of the value. Depending on the parser's mode, blank
-            lines may be treated as parts of multiline values or ignored.
-
-            Configuration files may include comments, prefixed by specific
-            characters (`#' and `;' by default). Comments may appear on their own
-            in an otherwise empty line or may be entered in lines holding values or
-            section names.
-            """
-            elements_added = set()
-            cursect = None                        # None, or a dictionary
-            sectname = None
-            optname = None
-            lineno = 0
-            indent_level = 0
-            e = None                              # None, or an exception
-            for lineno, line in enumerate(fp, start=1):
-                comment_start = sys.maxsize
-                # strip inline comments
-                inline_prefixes = dict(
-                    (p, -1) for p in self._inline_comment_prefixes)
-                while comment_start == sys.maxsize and inline_prefixes:
-                    next_prefixes = {}
-                    for prefix, index in inline_prefixes.items():
-                        index = line.find(prefix, index + 1)
-                        if index == -1:
-                            continue
-                        next_prefixes[prefix] = index
-                        if index == 0 or (index > 0 and line[index - 1].isspace()):
-                            comment_start = min(comment_start, index)
-                    inline_prefixes = next_prefixes
-                # strip full line comments
-                for prefix in self._comment_prefixes:
-                    if line.strip().startswith(prefix):
-                        comment_start = 0
-                        break
-                if comment_start == sys.maxsize:
-                    comment_start = None
-                value = line[:comment_start].strip()
-                if not value:
-                    if self._empty_lines_in_values:
-                        # add empty line to the value, but only if there was no
-                        # comment on the line
-                        if (comment_start is None and
-                                cursect is not None and
-                                optname and
-                                cursect[optname] is not None):
-                            cursect[optname].append('') # newlines added at join
-                    else:
-                        # empty line marks end of value
-                        indent_level = sys.maxsize
-                    continue
-                # continuation line?
-                first_nonspace = self.NONSPACECRE.search(line)
-                cur_indent_level = first_nonspace.start() if first_nonspace else 0
-                if (cursect is not None and optname and
-                        cur_indent_level > indent_level):
-                    cursect[optname].append(value)
-                # a section header or option header?
-                else:
-                    indent_level = cur_indent_level
-                    # is it a section header?
-                    mo = self.SECTCRE.match(value)
-                    if mo:
-                        sectname = mo.group('header')
-                        if sectname in self._sections:
-                            if self._strict and sectname in elements_added:
-                                raise DuplicateSectionError(sectname, fpname,
-                                                            lineno)
-                            cursect = self._sections[sectname]
-                            elements_added.add(sectname)
-                        elif sectname == self.default_section:
-                            cursect = self._defaults
-                        else:
-                            cursect = self._dict()
-                            self._sections[sectname] = cursect
-                            self._proxies[sectname] = SectionProxy(self, sectname)
-                            elements_added.add(sectname)
-                        # So sections can't start with a continuation line
-                        optname = None
-                    # no section header in the file?
-                    elif cursect is None:
-                        raise MissingSectionHeaderError(fpname, lineno, line)
-                    # an option line?
-                    else:
-                        mo = self._optcre.match(value)
-                        if mo:
-                            optname, vi, optval = mo.group('option', 'vi', 'value')
-                            if not optname:
-                                e = self._handle_error(e, fpname, lineno, line)
-                            optname = self.optionxform(optname.rstrip())
-                            if (self._strict and
-                                    (sectname, optname) in elements_added):
-                                raise DuplicateOptionError(sectname, optname,
-                                                           fpname, lineno)
-                            elements_added.add((sectname, optname))
-                            # This check is fine because the OPTCRE cannot
-                            # match if it would set optval to None
-                            if optval is not None:
-                                optval = optval.strip()
-                                cursect[optname] = [optval]
-                            else:
-                                # valueless option handling
-                                cursect[optname] = None
-                        else:
-                            # a non-fatal parsing error occurred. set up the
-                            # exception but keep going. the exception will be
-                            # raised at the end of the file and will contain a
-                            # list of all bogus lines
-                            e = self._handle_error(e, fpname, lineno, line)
-            self._join_multiline_values()
-            # if any parsing errors occurred, raise an exception
-            if e:
-                raise e
-
-        def _join_multiline_values(self):
-            defaults = self.default_section, self._defaults
-            all_sections = itertools.chain((defaults,),
-                                           self._sections.items())
-            for section, options in all_sections:
-                for name, val in options.items():
-                    if isinstance(val, list):
-                        val = '\n'.join(val).rstrip()
-                    options[name] = self._interpolation.before_read(self,
-                                                                    section,
-                                                                    name, val)
-
-        def _handle_error(self, exc, fpname, lineno, line):
-            if not exc:
-                exc = ParsingError(fpname)
-            exc.append(lineno, repr(line))
-            return exc
-
-        def _unify_values(self, section, vars):
-            """Create a sequence of lookups with 'vars' taking priority over
-            the 'section' which takes priority over the DEFAULTSECT.
-
-            """
-            sectiondict = {}
-            try:
-                sectiondict = self._sections[section]
-            except KeyError:
-                if section != self.default_section:
-                    raise NoSectionError(section)
-            # Update with the entry specific variables
-            vardict = {}
-            if vars:
-                for key, value in vars.items():
-                    if value is not None:
-                        value = str(value)
-                    vardict[self.optionxform(key)] = value
-            return ChainMap(vardict, sectiondict, self._defaults)
-
-        def _convert_to_boolean(self, value):
-            """Return a boolean value translating from other types if necessary.
-            """
-            if value.lower() not in self.BOOLEAN_STATES:
-                raise ValueError('Not a boolean: %s' % value)
-            return self.BOOLEAN_STATES[value.lower()]
-
-        def _validate_value_types(self, **kwargs):
-            """Raises a TypeError for non-string values.
-
-            The only legal non-string value if we allow valueless
-            options is None, so we need to check if the value is a
-            string if:
-            - we do not allow valueless options, or
-            - we allow valueless options but the value is not None
-
-            For compatibility reasons this method is not used in classic set()
-            for RawConfigParsers. It is invoked in every case for mapping protocol
-            access and in ConfigParser.set().
-            """
-            # keyword-only arguments
-            section = kwargs.get('section', "")
-            option = kwargs.get('option', "")
-            value = kwargs.get('value', "")
-
-            # Python2 stuff
-            if isinstance(section, bytes):
-                section = section.decode('utf8')
-            if isinstance(option, bytes):
-                option = option.decode('utf8')
-            if isinstance(value, bytes):
-                value = value.decode('utf8')
-
-            if not isinstance(section, str):
-                raise TypeError("section names must be strings")
-            if not isinstance(option, str):
-                raise TypeError("option keys must be strings")
-            if not self._allow_no_value or value:
-                if not isinstance(value, str):
-                    raise TypeError("option values must be strings")
-
-            return section, option, value
-
-        @property
-        def converters(self):
-            return self._converters
-
-
-    class ConfigParser(RawConfigParser):
-        """ConfigParser implementing interpolation."""
-
-        _DEFAULT_INTERPOLATION = BasicInterpolation()
-
-        def set(self, section, option, value=None):
-            """Set an option.  Extends RawConfigParser.set by validating type and
-            interpolation syntax on the value."""
-            _, option, value = self._validate_value_types(option=option, value=value)
-            super(ConfigParser, self).set(section, option, value)
-
-        def add_section(self, section):
-            """Create a new section in the configuration.  Extends
-            RawConfigParser.add_section by validating if the section name is
-            a string."""
-            section, _, _ = self._validate_value_types(section=section)
-            super(ConfigParser, self).add_section(section)
-
-
-    class SafeConfigParser(ConfigParser):
-        """ConfigParser alias for backwards compatibility purposes."""
-
-        def __init__(self, *args, **kwargs):
-            super(SafeConfigParser, self).__init__(*args, **kwargs)
-            warnings.warn(
-                "The SafeConfigParser class has been renamed to ConfigParser "
-                "in Python 3.2. This alias will be removed in future versions."
-                " Use ConfigParser directly instead.",
-                DeprecationWarning, stacklevel=2
-            )
-
-
-    class SectionProxy(MutableMapping):
-        """A proxy for a single section from a parser."""
-
-        def __init__(self, parser, name):
-            """Creates a view on a section of the specified `name` in `parser`."""
-            self._parser = parser
-            self._name = name
-            for conv in parser.converters:
-                key = 'get' + conv
-                getter = functools.partial(self.get, _impl=getattr(parser, key))
-                setattr(self, key, getter)
-
-        def __repr__(self):
-            return '<Section: {0}>'.format(self._name)
-
-        def __getitem__(self, key):
-            if not self._parser.has_option(self._name, key):
-                raise KeyError(key)
-            return self._parser.get(self._name, key)
-
-        def __setitem__(self, key, value):
-            _, key, value = self._parser._validate_value_types(option=key, value=value)
-            return self._parser.set(self._name, key, value)
-
-        def __delitem__(self, key):
-            if not (self._parser.has_option(self._name, key) and
-                    self._parser.remove_option(self._name, key)):
-                raise KeyError(key)
-
-        def __contains__(self, key):
-            return self._parser.has_option(self._name, key)
-
-        def __len__(self):
-            return len(self._options())
-
-        def __iter__(self):
-            return self._options().__iter__()
-
-        def _options(self):
-            if self._name != self._parser.default_section:
-                return self._parser.options(self._name)
-            else:
-                return self._parser.defaults()
-
-        @property
-        def parser(self):
-            # The parser object of the proxy is read-only.
-            return self._parser
-
-        @property
-        def name(self):
-            # The name of the section on a proxy is read-only.
-            return self._name
-
-        def get(self, option, fallback=None, **kwargs):
-            """Get an option value.
-
-            Unless `fallback` is provided, `None` will be returned if the option
-            is not found.
-
-            """
-            # keyword-only arguments
-            kwargs.setdefault('raw', False)
-            kwargs.setdefault('vars', None)
-            _impl = kwargs.pop('_impl', None)
-            # If `_impl` is provided, it should be a getter method on the parser
-            # object that provides the desired type conversion.
-            if not _impl:
-                _impl = self._parser.get
-            return _impl(self._name, option, fallback=fallback, **kwargs)
-
-
-    class ConverterMapping(MutableMapping):
-        """Enables reuse of get*() methods between the parser and section proxies.
-
-        If a parser class implements a getter directly, the value for the given
-        key will be ``None``. The presence of the converter name here enables
-        section proxies to find and use the implementation on the parser class.
-        """
-
-        GETTERCRE = re.compile(r"^get(?P<name>.+)$")
-
-        def __init__(self, parser):
-            self._parser = parser
-            self._data = {}
-            for getter in dir(self._parser):
-                m = self.GETTERCRE.match(getter)
-                if not m or not callable(getattr(self._parser, getter)):
-                    continue
-                self._data[m.group('name')] = None   # See class docstring.
-
-        def __getitem__(self, key):
-            return self._data[key]
-
-        def __setitem__(self, key, value):
-            try:
-                k = 'get' + key
-            except TypeError:
-                raise ValueError('Incompatible key: {} (type: {})'
-                                 ''.format(key, type(key)))
-            if k == 'get':
-                raise ValueError('Incompatible key: cannot use "" as a name')
-            self._data[key] = value
-            func = functools.partial(self._parser._get_conv, conv=value)
-            func.converter = value
-            setattr(self._parser, k, func)
-            for proxy in self._parser.values():
-                getter = functools.partial(proxy.get, _impl=func)
-                setattr(proxy, k, getter)
-
-        def __delitem__(self, key):
-            try:
-                k = 'get' + (key or None)
-            except TypeError:
-                raise KeyError(key)
-            del self._data[key]
-            for inst in itertools.chain((self._parser,), self._parser.values()):
-                try:
-                    delattr(inst, k)
-                except AttributeError:
-                    # don't raise since the entry was present in _data, silently
-                    # clean up
-                    continue
-
-        def __iter__(self):
-            return iter(self._data)
-
-        def __len__(self):
-            return len(self._data)
-
-
-# This is for Python 3, should work with 3.5 and above
-# yes it is short, because the Python 3.5 configparser module provides a lot
-else:
-    from configparser import *
-    from configparser import _UNSET, Error
-    from collections import OrderedDict
-
-
-# implementation for Python 3 and Python 2.7
-
-
-def _convert_lines(value):
-    """
-    Split string value into lines and return this list without empty lines.
-    """
-    lines = [line for line in value.splitlines() if line]
-    return lines
-
-
-def _convert_listing(value):
-    """
-    Split string values by ',' trim the values and return it as list.
-    """
-    listing = [e for e in (elem.strip() for elem in value.split(',')) if e]
-    return listing
-
-
-class StdInterpolation(ExtendedInterpolation):
-    """Interpolation based on the configparser.ExtendedInterpolation.
-
-    Adds only the feature to be more tolerant and support ':' also in the
-    section name.
-    """
-
-    def _interpolate_some(self, parser, option, accum, rest, section, map,
-                          depth):
-        rawval = parser.get(section, option, raw=True, fallback=rest)
-        if depth > MAX_INTERPOLATION_DEPTH:
-            raise InterpolationDepthError(option, section, rawval)
-        while rest:
-            p = rest.find("$")
-            if p < 0:
-                accum.append(rest)
-                return
-            if p > 0:
-                accum.append(rest[:p])
-                rest = rest[p:]
-            # p is no longer used
-            c = rest[1:2]
-            if c == "$":
-                accum.append("$")
-                rest = rest[2:]
-            elif c == "{":
-                m = self._KEYCRE.match(rest)
-                if m is None:
-                    raise InterpolationSyntaxError(option, section,
-                          "bad interpolation variable reference %r" % rest)
-                path = m.group(1).split(':')
-                rest = rest[m.end():]
-                sect = section
-                opt = option
-                try:
-                    if len(path) == 1:
-                        opt = parser.optionxform(path[0])
-                        v = map[opt]
-                    elif len(path) == 2:
-                        sect = path[0]
-                        opt = parser.optionxform(path[1])
-                        v = parser.get(sect, opt, raw=True)
-                    else:
-                        sect = ":".join(path[0:-1])
-                        opt = parser.optionxform(path[-1])
-                        v = parser.get(sect, opt, raw=True)
-                        # raise InterpolationSyntaxError(
-                        #     option, section,
-                        #     "More than one ':' found: %r" % (rest,))
-                except (KeyError, NoSectionError, NoOptionError):
-                    raise from_none(InterpolationMissingOptionError(
-                        option, section, rawval, ":".join(path)))
-                if "$" in v:
-                    self._interpolate_some(parser, opt, accum, v, sect,
-                                           dict(parser.items(sect, raw=True)),
-                                           depth + 1)
-                else:
-                    accum.append(v)
-            else:
-                raise InterpolationSyntaxError(
-                    option, section,
-                    "'$' must be followed by '$' or '{', "
-                    "found: %r" % (rest,))
-
-
-class StdConfigParser(ConfigParser):
-
-    def __init__(self, defaults=None, converters=None, interpolate=False):
-        _converters = {"lines": _convert_lines,
-                       "listing": _convert_listing}
-        if converters:
-            _converters.update(converters)
-        interpolation = StdInterpolation() if interpolate else Interpolation()
-        super(StdConfigParser, self).__init__(defaults=defaults,
-                                              dict_type=OrderedDict,
-                                              allow_no_value=False,
-                                              delimiters=('=', ':'),
-                                              comment_prefixes=('#', ),
-                                              inline_comment_prefixes=None,
-                                              strict=True,
-                                              empty_lines_in_values=True,
-                                              default_section=DEFAULTSECT,
-                                              interpolation=interpolation,
-                                              converters=_converters)
-
-    def read(self, filenames):
-        super(StdConfigParser, self).read(filenames, "utf-8")
-
-    # Needed for improved error messages if a converter fails
-    def _get_conv(self, section, option, conv, **kwargs):
-        try:
-            return super(StdConfigParser, self)._get_conv(section, option, conv, **kwargs)
-        except Exception as ex:
-            if hasattr(ex, "args"):
-                ex.args += ("This error occured by getting option %r in section %r"
-                            " with converter %r." % (option, section, conv.__name__), )
-            raise
-
-# If someone looks at this implementation,
-# yes the ConfigParser of Python 3 is very powerful, used with good defaults
-# and some useful converters you get a widely usable and powerful configuration
-# parsing class with only these lines of code.
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 - 2017 Wolfgang Langner
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"A standard INI style configuration parser."
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+
+__version__ = "1.1"
+_is_release = all(int(v) for v in __version__.split("."))
+
+__all__ = ["NoSectionError", "DuplicateOptionError", "DuplicateSectionError",
+           "NoOptionError", "InterpolationError", "InterpolationDepthError",
+           "InterpolationMissingOptionError", "InterpolationSyntaxError",
+           "ParsingError", "MissingSectionHeaderError",
+           "ConfigParser", "SafeConfigParser", "RawConfigParser",
+           "Interpolation", "BasicInterpolation", "ExtendedInterpolation",
+           "LegacyInterpolation", "SectionProxy", "ConverterMapping",
+           "DEFAULTSECT", "MAX_INTERPOLATION_DEPTH",
+           "InterpolationCycleError", "ResolveError", "FrozenConfig",
+           "iterparse", "ReloadableConfig", "SharedConfig",
+           "ConfigDocument", "LayeredConfig", "Schema", "SchemaError",
+           "StdConfigParser"]
+
+
+import sys
+
+
+PY2 = sys.version_info[0] == 2
+PY33 = sys.version_info[:2] == (3, 3)
+PY34 = sys.version_info[:2] == (3, 4)
+
+
+def from_none(exc):
+    """raise from_none(ValueError('a')) == raise ValueError('a') from None"""
+    exc.__cause__ = None
+    exc.__suppress_context__ = True
+    return exc
+
+
+# whole Python 2 implementation based on the backport of configparser
+# lot of stuff copied also from Python standard library implementation
+if PY2:
+
+    from collections import MutableMapping
+    try:
+        from collections import OrderedDict
+    except ImportError:
+        from ordereddict import OrderedDict
+
+    from io import open
+    try:
+        from thread import get_ident
+    except ImportError:
+        try:
+            from _thread import get_ident
+        except ImportError:
+            from _dummy_thread import get_ident
+
+
+    # stuff from backports helpers
+
+    str = type('str') # same as str = unicode because of __future__.unicode_literals
+
+    # constants
+    DEFAULTSECT = "DEFAULT"
+
+    MAX_INTERPOLATION_DEPTH = 10
+
+    # Used in parser getters to indicate the default behaviour when a specific
+    # option is not found it to raise an exception. Created to enable `None' as
+    # a valid fallback value.
+    _UNSET = object()
+
+
+    # from reprlib 3.2.1
+    def recursive_repr(fillvalue='...'):
+        'Decorator to make a repr function return fillvalue for a recursive call'
+
+        def decorating_function(user_function):
+            repr_running = set()
+
+            def wrapper(self):
+                key = id(self), get_ident()
+                if key in repr_running:
+                    return fillvalue
+                repr_running.add(key)
+                try:
+                    result = user_function(self)
+                finally:
+                    repr_running.discard(key)
+                return result
+
+            # Can't use functools.wraps() here because of bootstrap issues
+            wrapper.__module__ = getattr(user_function, '__module__')
+            wrapper.__doc__ = getattr(user_function, '__doc__')
+            wrapper.__name__ = getattr(user_function, '__name__')
+            wrapper.__annotations__ = getattr(user_function, '__annotations__', {})
+            return wrapper
+
+        return decorating_function
+
+    # from collections 3.2.1
+    class ChainMap(MutableMapping):
+        ''' A ChainMap groups multiple dicts (or other mappings) together
+        to create a single, updateable view.
+
+        The underlying mappings are stored in a list.  That list is public and can
+        accessed or updated using the *maps* attribute.  There is no other state.
+
+        Lookups search the underlying mappings successively until a key is found.
+        In contrast, writes, updates, and deletions only operate on the first
+        mapping.
+
+        '''
+
+        def __init__(self, *maps):
+            '''Initialize a ChainMap by setting *maps* to the given mappings.
+            If no mappings are provided, a single empty dictionary is used.
+
+            '''
+            self.maps = list(maps) or [{}]          # always at least one map
+
+        def __missing__(self, key):
+            raise KeyError(key)
+
+        def __getitem__(self, key):
+            for mapping in self.maps:
+                try:
+                    return mapping[key]             # can't use 'key in mapping' with defaultdict
+                except KeyError:
+                    pass
+            return self.__missing__(key)            # support subclasses that define __missing__
+
+        def get(self, key, default=None):
+            return self[key] if key in self else default
+
+        def __len__(self):
+            return len(set().union(*self.maps))     # reuses stored hash values if possible
+
+        def __iter__(self):
+            return iter(set().union(*self.maps))
+
+        def __contains__(self, key):
+            return any(key in m for m in self.maps)
+
+        @recursive_repr()
+        def __repr__(self):
+            return '{0.__class__.__name__}({1})'.format(
+                self, ', '.join(map(repr, self.maps)))
+
+        @classmethod
+        def fromkeys(cls, iterable, *args):
+            'Create a ChainMap with a single dict created from the iterable.'
+            return cls(dict.fromkeys(iterable, *args))
+
+        def copy(self):
+            'New ChainMap or subclass with a new copy of maps[0] and refs to maps[1:]'
+            return self.__class__(self.maps[0].copy(), *self.maps[1:])
+
+        __copy__ = copy
+
+        def new_child(self):                        # like Django's Context.push()
+            'New ChainMap with a new dict followed by all previous maps.'
+            return self.__class__({}, *self.maps)
+
+        @property
+        def parents(self):                          # like Django's Context.pop()
+            'New ChainMap from maps[1:].'
+            return self.__class__(*self.maps[1:])
+
+        def __setitem__(self, key, value):
+            self.maps[0][key] = value
+
+        def __delitem__(self, key):
+            try:
+                del self.maps[0][key]
+            except KeyError:
+                raise KeyError('Key not found in the first mapping: {!r}'.format(key))
+
+        def popitem(self):
+            'Remove and return an item pair from maps[0]. Raise KeyError is maps[0] is empty.'
+            try:
+                return self.maps[0].popitem()
+            except KeyError:
+                raise KeyError('No keys found in the first mapping.')
+
+        def pop(self, key, *args):
+            'Remove *key* from maps[0] and return its value. Raise KeyError if *key* not in maps[0].'
+            try:
+                return self.maps[0].pop(key, *args)
+            except KeyError:
+                raise KeyError('Key not found in the first mapping: {!r}'.format(key))
+
+        def clear(self):
+            'Clear maps[0], leaving maps[1:] intact.'
+            self.maps[0].clear()
+
+else:
+    from collections import ChainMap
+
+if PY33 or PY34:
+
+    from reprlib import recursive_repr
+    from collections import MutableMapping, OrderedDict  # noqa
+    from configparser import _UNSET, DEFAULTSECT, MAX_INTERPOLATION_DEPTH
+
+if PY2 or PY33 or PY34:
+
+    import functools
+    from io import StringIO
+    import itertools
+    import re
+    import warnings
+
+
+    # exception classes
+    class Error(Exception):
+        """Base class for ConfigParser exceptions."""
+
+        def __init__(self, msg=''):
+            self.message = msg
+            Exception.__init__(self, msg)
+
+        def __repr__(self):
+            return self.message
+
+        __str__ = __repr__
+
+
+    class NoSectionError(Error):
+        """Raised when no section matches a requested option."""
+
+        def __init__(self, section):
+            Error.__init__(self, 'No section: %r' % (section,))
+            self.section = section
+            self.args = (section, )
+
+
+    class DuplicateSectionError(Error):
+        """Raised when a section is repeated in an input source.
+
+        Possible repetitions that raise this exception are: multiple creation
+        using the API or in strict parsers when a section is found more than once
+        in a single input file, string or dictionary.
+        """
+
+        def __init__(self, section, source=None, lineno=None):
+            msg = [repr(section), " already exists"]
+            if source is not None:
+                message = ["While reading from ", repr(source)]
+                if lineno is not None:
+                    message.append(" [line {0:2d}]".format(lineno))
+                message.append(": section ")
+                message.extend(msg)
+                msg = message
+            else:
+                msg.insert(0, "Section ")
+            Error.__init__(self, "".join(msg))
+            self.section = section
+            self.source = source
+            self.lineno = lineno
+            self.args = (section, source, lineno)
+
+
+    class DuplicateOptionError(Error):
+        """Raised by strict parsers when an option is repeated in an input source.
+
+        Current implementation raises this exception only when an option is found
+        more than once in a single file, string or dictionary.
+        """
+
+        def __init__(self, section, option, source=None, lineno=None):
+            msg = [repr(option), " in section ", repr(section),
+                   " already exists"]
+            if source is not None:
+                message = ["While reading from ", repr(source)]
+                if lineno is not None:
+                    message.append(" [line {0:2d}]".format(lineno))
+                message.append(": option ")
+                message.extend(msg)
+                msg = message
+            else:
+                msg.insert(0, "Option ")
+            Error.__init__(self, "".join(msg))
+            self.section = section
+            self.option = option
+            self.source = source
+            self.lineno = lineno
+            self.args = (section, option, source, lineno)
+
+
+    class NoOptionError(Error):
+        """A requested option was not found."""
+
+        def __init__(self, option, section):
+            Error.__init__(self, "No option %r in section: %r" %
+                           (option, section))
+            self.option = option
+            self.section = section
+            self.args = (option, section)
+
+
+    class InterpolationError(Error):
+        """Base class for interpolation-related exceptions."""
+
+        def __init__(self, option, section, msg):
+            Error.__init__(self, msg)
+            self.option = option
+            self.section = section
+            self.args = (option, section, msg)
+
+
+    class InterpolationMissingOptionError(InterpolationError):
+        """A string substitution required a setting which was not available."""
+
+        def __init__(self, option, section, rawval, reference):
+            msg = ("Bad value substitution: option {0!r} in section {1!r} contains "
+                   "an interpolation key {2!r} which is not a valid option name. "
+                   "Raw value: {3!r}".format(option, section, reference, rawval))
+            InterpolationError.__init__(self, option, section, msg)
+            self.reference = reference
+            self.args = (option, section, rawval, reference)
+
+
+    class InterpolationSyntaxError(InterpolationError):
+        """Raised when the source text contains invalid syntax.
+
+        Current implementation raises this exception when the source text into
+        which substitutions are made does not conform to the required syntax.
+        """
+
+
+    class InterpolationDepthError(InterpolationError):
+        """Raised when substitutions are nested too deeply."""
+
+        def __init__(self, option, section, rawval):
+            msg = ("Recursion limit exceeded in value substitution: option {0!r} "
+                   "in section {1!r} contains an interpolation key which "
+                   "cannot be substituted in {2} steps. Raw value: {3!r}"
+                   "".format(option, section, MAX_INTERPOLATION_DEPTH,
+                             rawval))
+            InterpolationError.__init__(self, option, section, msg)
+            self.args = (option, section, rawval)
+
+
+    class ParsingError(Error):
+        """Raised when a configuration file does not follow legal syntax."""
+
+        def __init__(self, source=None, filename=None):
+            # Exactly one of `source'/`filename' arguments has to be given.
+            # `filename' kept for compatibility.
+            if filename and source:
+                raise ValueError("Cannot specify both `filename' and `source'. "
+                                 "Use `source'.")
+            elif not filename and not source:
+                raise ValueError("Required argument `source' not given.")
+            elif filename:
+                source = filename
+            Error.__init__(self, 'Source contains parsing errors: %r' % source)
+            self.source = source
+            self.errors = []
+            self.args = (source, )
+
+        @property
+        def filename(self):
+            """Deprecated, use `source'."""
+            warnings.warn(
+                "The 'filename' attribute will be removed in future versions.  "
+                "Use 'source' instead.",
+                DeprecationWarning, stacklevel=2
+            )
+            return self.source
+
+        @filename.setter
+        def filename(self, value):
+            """Deprecated, user `source'."""
+            warnings.warn(
+                "The 'filename' attribute will be removed in future versions.  "
+                "Use 'source' instead.",
+                DeprecationWarning, stacklevel=2
+            )
+            self.source = value
+
+        def append(self, lineno, line):
+            self.errors.append((lineno, line))
+            self.message += '\n\t[line %2d]: %s' % (lineno, line)
+
+
+    class MissingSectionHeaderError(ParsingError):
+        """Raised when a key-value pair is found before any section header."""
+
+        def __init__(self, filename, lineno, line):
+            Error.__init__(
+                self,
+                'File contains no section headers.\nfile: %r, line: %d\n%r' %
+                (filename, lineno, line))
+            self.source = filename
+            self.lineno = lineno
+            self.line = line
+            self.args = (filename, lineno, line)
+
+
+
+    class Interpolation(object):
+        """Dummy interpolation that passes the value through with no changes."""
+
+        def before_get(self, parser, section, option, value, defaults):
+            return value
+
+        def before_set(self, parser, section, option, value):
+            return value
+
+        def before_read(self, parser, section, option, value):
+            return value
+
+        def before_write(self, parser, section, option, value):
+            return value
+
+
+    class BasicInterpolation(Interpolation):
+        """Interpolation as implemented in the classic ConfigParser.
+
+        The option values can contain format strings which refer to other values in
+        the same section, or values in the special default section.
+
+        For example:
+
+            something: %(dir)s/whatever
+
+        would resolve the "%(dir)s" to the value of dir.  All reference
+        expansions are done late, on demand. If a user needs to use a bare % in
+        a configuration file, she can escape it by writing %%. Other % usage
+        is considered a user error and raises `InterpolationSyntaxError'."""
+
+        _KEYCRE = re.compile(r"%\(([^)]+)\)s")
+
+        def before_get(self, parser, section, option, value, defaults):
+            L = []
+            self._interpolate_some(parser, option, L, value, section, defaults, 1)
+            return ''.join(L)
+
+        def before_set(self, parser, section, option, value):
+            tmp_value = value.replace('%%', '') # escaped percent signs
+            tmp_value = self._KEYCRE.sub('', tmp_value) # valid syntax
+            if '%' in tmp_value:
+                raise ValueError("invalid interpolation syntax in %r at "
+                                 "position %d" % (value, tmp_value.find('%')))
+            return value
+
+        def _interpolate_some(self, parser, option, accum, rest, section, map,
+                              depth):
+            rawval = parser.get(section, option, raw=True, fallback=rest)
+            if depth > MAX_INTERPOLATION_DEPTH:
+                raise InterpolationDepthError(option, section, rawval)
+            while rest:
+                p = rest.find("%")
+                if p < 0:
+                    accum.append(rest)
+                    return
+                if p > 0:
+                    accum.append(rest[:p])
+                    rest = rest[p:]
+                # p is no longer used
+                c = rest[1:2]
+                if c == "%":
+                    accum.append("%")
+                    rest = rest[2:]
+                elif c == "(":
+                    m = self._KEYCRE.match(rest)
+                    if m is None:
+                        raise InterpolationSyntaxError(option, section,
+                              "bad interpolation variable reference %r" % rest)
+                    var = parser.optionxform(m.group(1))
+                    rest = rest[m.end():]
+                    try:
+                        v = map[var]
+                    except KeyError:
+                        raise from_none(InterpolationMissingOptionError(
+                            option, section, rawval, var))
+                    if "%" in v:
+                        self._interpolate_some(parser, option, accum, v,
+                                               section, map, depth + 1)
+                    else:
+                        accum.append(v)
+                else:
+                    raise InterpolationSyntaxError(
+                        option, section,
+                        "'%%' must be followed by '%%' or '(', "
+                        "found: %r" % (rest,))
+
+
+    class ExtendedInterpolation(Interpolation):
+        """Advanced variant of interpolation, supports the syntax used by
+        `zc.buildout'. Enables interpolation between sections."""
+
+        _KEYCRE = re.compile(r"\$\{([^}]+)\}")
+
+        def before_get(self, parser, section, option, value, defaults):
+            L = []
+            self._interpolate_some(parser, option, L, value, section, defaults, 1)
+            return ''.join(L)
+
+        def before_set(self, parser, section, option, value):
+            tmp_value = value.replace('$$', '') # escaped dollar signs
+            tmp_value = self._KEYCRE.sub('', tmp_value) # valid syntax
+            if '$' in tmp_value:
+                raise ValueError("invalid interpolation syntax in %r at "
+                                 "position %d" % (value, tmp_value.find('$')))
+            return value
+
+        def _interpolate_some(self, parser, option, accum, rest, section, map,
+                              depth):
+            rawval = parser.get(section, option, raw=True, fallback=rest)
+            if depth > MAX_INTERPOLATION_DEPTH:
+                raise InterpolationDepthError(option, section, rawval)
+            while rest:
+                p = rest.find("$")
+                if p < 0:
+                    accum.append(rest)
+                    return
+                if p > 0:
+                    accum.append(rest[:p])
+                    rest = rest[p:]
+                # p is no longer used
+                c = rest[1:2]
+                if c == "$":
+                    accum.append("$")
+                    rest = rest[2:]
+                elif c == "{":
+                    m = self._KEYCRE.match(rest)
+                    if m is None:
+                        raise InterpolationSyntaxError(option, section,
+                              "bad interpolation variable reference %r" % rest)
+                    path = m.group(1).split(':')
+                    rest = rest[m.end():]
+                    sect = section
+                    opt = option
+                    try:
+                        if len(path) == 1:
+                            opt = parser.optionxform(path[0])
+                            v = map[opt]
+                        elif len(path) == 2:
+                            sect = path[0]
+                            opt = parser.optionxform(path[1])
+                            v = parser.get(sect, opt, raw=True)
+                        else:
+                            raise InterpolationSyntaxError(
+                                option, section,
+                                "More than one ':' found: %r" % (rest,))
+                    except (KeyError, NoSectionError, NoOptionError):
+                        raise from_none(InterpolationMissingOptionError(
+                            option, section, rawval, ":".join(path)))
+                    if "$" in v:
+                        self._interpolate_some(parser, opt, accum, v, sect,
+                                               dict(parser.items(sect, raw=True)),
+                                               depth + 1)
+                    else:
+                        accum.append(v)
+                else:
+                    raise InterpolationSyntaxError(
+                        option, section,
+                        "'$' must be followed by '$' or '{', "
+                        "found: %r" % (rest,))
+
+
+    class LegacyInterpolation(Interpolation):
+        """Deprecated interpolation used in old versions of ConfigParser.
+        Use BasicInterpolation or ExtendedInterpolation instead."""
+
+        _KEYCRE = re.compile(r"%\(([^)]*)\)s|.")
+
+        def before_get(self, parser, section, option, value, vars):
+            rawval = value
+            depth = MAX_INTERPOLATION_DEPTH
+            while depth:                    # Loop through this until it's done
+                depth -= 1
+                if value and "%(" in value:
+                    replace = functools.partial(self._interpolation_replace,
+                                                parser=parser)
+                    value = self._KEYCRE.sub(replace, value)
+                    try:
+                        value = value % vars
+                    except KeyError as e:
+                        raise from_none(InterpolationMissingOptionError(
+                            option, section, rawval, e.args[0]))
+                else:
+                    break
+            if value and "%(" in value:
+                raise InterpolationDepthError(option, section, rawval)
+            return value
+
+        def before_set(self, parser, section, option, value):
+            return value
+
+        @staticmethod
+        def _interpolation_replace(match, parser):
+            s = match.group(1)
+            if s is None:
+                return match.group()
+            else:
+                return "%%(%s)s" % parser.optionxform(s)
+
+
+    class RawConfigParser(MutableMapping):
+        """ConfigParser that does not do interpolation."""
+
+        # Regular expressions for parsing section headers and options
+        _SECT_TMPL = r"""
+            \[                                 # [
+            (?P<header>[^]]+)                  # very permissive!
+            \]                                 # ]
+            """
+        _OPT_TMPL = r"""
+            (?P<option>.*?)                    # very permissive!
+            \s*(?P<vi>{delim})\s*              # any number of space/tab,
+                                               # followed by any of the
+                                               # allowed delimiters,
+                                               # followed by any space/tab
+            (?P<value>.*)$                     # everything up to eol
+            """
+        _OPT_NV_TMPL = r"""
+            (?P<option>.*?)                    # very permissive!
+            \s*(?:                             # any number of space/tab,
+            (?P<vi>{delim})\s*                 # optionally followed by
+                                               # any of the allowed
+                                               # delimiters, followed by any
+                                               # space/tab
+            (?P<value>.*))?$                   # everything up to eol
+            """
+        # Interpolation algorithm to be used if the user does not specify another
+        _DEFAULT_INTERPOLATION = Interpolation()
+        # Compiled regular expression for matching sections
+        SECTCRE = re.compile(_SECT_TMPL, re.VERBOSE)
+        # Compiled regular expression for matching options with typical separators
+        OPTCRE = re.compile(_OPT_TMPL.format(delim="=|:"), re.VERBOSE)
+        # Compiled regular expression for matching options with optional values
+        # delimited using typical separators
+        OPTCRE_NV = re.compile(_OPT_NV_TMPL.format(delim="=|:"), re.VERBOSE)
+        # Compiled regular expression for matching leading whitespace in a line
+        NONSPACECRE = re.compile(r"\S")
+        # Possible boolean values in the configuration.
+        BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                          '0': False, 'no': False, 'false': False, 'off': False}
+
+        def __init__(self, defaults=None, dict_type=OrderedDict,
+                     allow_no_value=False, **kwargs):
+
+            # keyword-only arguments
+            delimiters = kwargs.get('delimiters', ('=', ':'))
+            comment_prefixes = kwargs.get('comment_prefixes', ('#', ';'))
+            inline_comment_prefixes = kwargs.get('inline_comment_prefixes', None)
+            strict = kwargs.get('strict', True)
+            empty_lines_in_values = kwargs.get('empty_lines_in_values', True)
+            default_section = kwargs.get('default_section', DEFAULTSECT)
+            interpolation = kwargs.get('interpolation', _UNSET)
+            converters = kwargs.get('converters', _UNSET)
+
+            self._dict = dict_type
+            self._sections = self._dict()
+            self._defaults = self._dict()
+            self._converters = ConverterMapping(self)
+            self._proxies = self._dict()
+            self._proxies[default_section] = SectionProxy(self, default_section)
+            if defaults:
+                for key, value in defaults.items():
+                    self._defaults[self.optionxform(key)] = value
+            self._delimiters = tuple(delimiters)
+            if delimiters == ('=', ':'):
+                self._optcre = self.OPTCRE_NV if allow_no_value else self.OPTCRE
+            else:
+                d = "|".join(re.escape(d) for d in delimiters)
+                if allow_no_value:
+                    self._optcre = re.compile(self._OPT_NV_TMPL.format(delim=d),
+                                              re.VERBOSE)
+                else:
+                    self._optcre = re.compile(self._OPT_TMPL.format(delim=d),
+                                              re.VERBOSE)
+            self._comment_prefixes = tuple(comment_prefixes or ())
+            self._inline_comment_prefixes = tuple(inline_comment_prefixes or ())
+            self._strict = strict
+            self._allow_no_value = allow_no_value
+            self._empty_lines_in_values = empty_lines_in_values
+            self.default_section = default_section
+            self._interpolation = interpolation
+            if self._interpolation is _UNSET:
+                self._interpolation = self._DEFAULT_INTERPOLATION
+            if self._interpolation is None:
+                self._interpolation = Interpolation()
+            if converters is not _UNSET:
+                self._converters.update(converters)
+
+        def defaults(self):
+            return self._defaults
+
+        def sections(self):
+            """Return a list of section names, excluding [DEFAULT]"""
+            # self._sections will never have [DEFAULT] in it
+            return list(self._sections.keys())
+
+        def add_section(self, section):
+            """Create a new section in the configuration.
+
+            Raise DuplicateSectionError if a section by the specified name
+            already exists. Raise ValueError if name is DEFAULT.
+            """
+            if section == self.default_section:
+                raise ValueError('Invalid section name: %r' % section)
+
+            if section in self._sections:
+                raise DuplicateSectionError(section)
+            self._sections[section] = self._dict()
+            self._proxies[section] = SectionProxy(self, section)
+
+        def has_section(self, section):
+            """Indicate whether the named section is present in the configuration.
+
+            The DEFAULT section is not acknowledged.
+            """
+            return section in self._sections
+
+        def options(self, section):
+            """Return a list of option names for the given section name."""
+            try:
+                opts = self._sections[section].copy()
+            except KeyError:
+                raise from_none(NoSectionError(section))
+            opts.update(self._defaults)
+            return list(opts.keys())
+
+        def read(self, filenames, encoding=None):
+            """Read and parse a filename or a list of filenames.
+
+            Files that cannot be opened are silently ignored; this is
+            designed so that you can specify a list of potential
+            configuration file locations (e.g. current directory, user's
+            home directory, systemwide directory), and all existing
+            configuration files in the list will be read.  A single
+            filename may also be given.
+
+            Return list of successfully read files.
+            """
+            if isinstance(filenames, (str, bytes)):
+                filenames = [filenames]
+            read_ok = []
+            for filename in filenames:
+                try:
+                    with open(filename, encoding=encoding) as fp:
+                        self._read(fp, filename)
+                except IOError:
+                    continue
+                read_ok.append(filename)
+            return read_ok
+
+        def read_file(self, f, source=None):
+            """Like read() but the argument must be a file-like object.
+
+            The `f' argument must be iterable, returning one line at a time.
+            Optional second argument is the `source' specifying the name of the
+            file being read. If not given, it is taken from f.name. If `f' has no
+            `name' attribute, `<???>' is used.
+            """
+            if source is None:
+                try:
+                    source = f.name
+                except AttributeError:
+                    source = '<???>'
+            self._read(f, source)
+
+        def read_string(self, string, source='<string>'):
+            """Read configuration from a given string."""
+            sfile = StringIO(string)
+            self.read_file(sfile, source)
+
+        def read_dict(self, dictionary, source='<dict>'):
+            """Read configuration from a dictionary.
+
+            Keys are section names, values are dictionaries with keys and values
+            that should be present in the section. If the used dictionary type
+            preserves order, sections and their keys will be added in order.
+
+            All types held in the dictionary are converted to strings during
+            reading, including section names, option names and keys.
+
+            Optional second argument is the `source' specifying the name of the
+            dictionary being read.
+            """
+            elements_added = set()
+            for section, keys in dictionary.items():
+                section = str(section)
+                try:
+                    self.add_section(section)
+                except (DuplicateSectionError, ValueError):
+                    if self._strict and section in elements_added:
+                        raise
+                elements_added.add(section)
+                for key, value in keys.items():
+                    key = self.optionxform(str(key))
+                    if value is not None:
+                        value = str(value)
+                    if self._strict and (section, key) in elements_added:
+                        raise DuplicateOptionError(section, key, source)
+                    elements_added.add((section, key))
+                    self.set(section, key, value)
+
+        def readfp(self, fp, filename=None):
+            """Deprecated, use read_file instead."""
+            warnings.warn(
+                "This method will be removed in future versions.  "
+                "Use 'parser.read_file()' instead.",
+                DeprecationWarning, stacklevel=2
+            )
+            self.read_file(fp, source=filename)
+
+        def get(self, section, option, **kwargs):
+            """Get an option value for a given section.
+
+            If `vars' is provided, it must be a dictionary. The option is looked up
+            in `vars' (if provided), `section', and in `DEFAULTSECT' in that order.
+            If the key is not found and `fallback' is provided, it is used as
+            a fallback value. `None' can be provided as a `fallback' value.
+
+            If interpolation is enabled and the optional argument `raw' is False,
+            all interpolations are expanded in the return values.
+
+            Arguments `raw', `vars', and `fallback' are keyword only.
+
+            The section DEFAULT is special.
+            """
+            # keyword-only arguments
+            raw = kwargs.get('raw', False)
+            vars = kwargs.get('vars', None)
+            fallback = kwargs.get('fallback', _UNSET)
+
+            try:
+                d = self._unify_values(section, vars)
+            except NoSectionError:
+                if fallback is _UNSET:
+                    raise
+                else:
+                    return fallback
+            option = self.optionxform(option)
+            try:
+                value = d[option]
+            except KeyError:
+                if fallback is _UNSET:
+                    raise NoOptionError(option, section)
+                else:
+                    return fallback
+
+            if raw or value is None:
+                return value
+            else:
+                return self._interpolation.before_get(self, section, option, value,
+                                                      d)
+
+        def _get(self, section, conv, option, **kwargs):
+            return conv(self.get(section, option, **kwargs))
+
+        def _get_conv(self, section, option, conv, **kwargs):
+            # keyword-only arguments
+            kwargs.setdefault('raw', False)
+            kwargs.setdefault('vars', None)
+            fallback = kwargs.pop('fallback', _UNSET)
+            try:
+                return self._get(section, conv, option, **kwargs)
+            except (NoSectionError, NoOptionError):
+                if fallback is _UNSET:
+                    raise
+                return fallback
+
+        # getint, getfloat and getboolean provided directly for backwards compat
+        def getint(self, section, option, **kwargs):
+            # keyword-only arguments
+            kwargs.setdefault('raw', False)
+            kwargs.setdefault('vars', None)
+            kwargs.setdefault('fallback', _UNSET)
+            return self._get_conv(section, option, int, **kwargs)
+
+        def getfloat(self, section, option, **kwargs):
+            # keyword-only arguments
+            kwargs.setdefault('raw', False)
+            kwargs.setdefault('vars', None)
+            kwargs.setdefault('fallback', _UNSET)
+            return self._get_conv(section, option, float, **kwargs)
+
+        def getboolean(self, section, option, **kwargs):
+            # keyword-only arguments
+            kwargs.setdefault('raw', False)
+            kwargs.setdefault('vars', None)
+            kwargs.setdefault('fallback', _UNSET)
+            return self._get_conv(section, option, self._convert_to_boolean,
+                                  **kwargs)
+
+        def items(self, section=_UNSET, raw=False, vars=None):
+            """Return a list of (name, value) tuples for each option in a section.
+
+            All % interpolations are expanded in the return values, based on the
+            defaults passed into the constructor, unless the optional argument
+            `raw' is true.  Additional substitutions may be provided using the
+            `vars' argument, which must be a dictionary whose contents overrides
+            any pre-existing defaults.
+
+            The section DEFAULT is special.
+            """
+            if section is _UNSET:
+                return super(RawConfigParser, self).items()
+            d = self._defaults.copy()
+            try:
+                d.update(self._sections[section])
+            except KeyError:
+                if section != self.default_section:
+                    raise NoSectionError(section)
+            # Update with the entry specific variables
+            if vars:
+                for key, value in vars.items():
+                    d[self.optionxform(key)] = value
+            value_getter = lambda option: self._interpolation.before_get(self,
+                                          section, option, d[option], d)
+            if raw:
+                value_getter = lambda option: d[option]
+            return [(option, value_getter(option)) for option in d.keys()]
+
+        def popitem(self):
+            """Remove a section from the parser and return it as
+            a (section_name, section_proxy) tuple. If no section is present, raise
+            KeyError.
+
+            The section DEFAULT is never returned because it cannot be removed.
+            """
+            for key in self.sections():
+                value = self[key]
+                del self[key]
+                return key, value
+            raise KeyError
+
+        def optionxform(self, optionstr):
+            return optionstr.lower()
+
+        def has_option(self, section, option):
+            """Check for the existence of a given option in a given section.
+            If the specified `section' is None or an empty string, DEFAULT is
+            assumed. If the specified `section' does not exist, returns False."""
+            if not section or section == self.default_section:
+                option = self.optionxform(option)
+                return option in self._defaults
+            elif section not in self._sections:
+                return False
+            else:
+                option = self.optionxform(option)
+                return (option in self._sections[section]
+                        or option in self._defaults)
+
+        def set(self, section, option, value=None):
+            """Set an option."""
+            if value:
+                value = self._interpolation.before_set(self, section, option,
+                                                       value)
+            if not section or section == self.default_section:
+                sectdict = self._defaults
+            else:
+                try:
+                    sectdict = self._sections[section]
+                except KeyError:
+                    raise from_none(NoSectionError(section))
+            sectdict[self.optionxform(option)] = value
+
+        def write(self, fp, space_around_delimiters=True):
+            """Write an .ini-format representation of the configuration state.
+
+            If `space_around_delimiters' is True (the default), delimiters
+            between keys and values are surrounded by spaces.
+            """
+            if space_around_delimiters:
+                d = " {0} ".format(self._delimiters[0])
+            else:
+                d = self._delimiters[0]
+            if self._defaults:
+                self._write_section(fp, self.default_section,
+                                    self._defaults.items(), d)
+            for section in self._sections:
+                self._write_section(fp, section,
+                                    self._sections[section].items(), d)
+
+        def _write_section(self, fp, section_name, section_items, delimiter):
+            """Write a single section to the specified `fp'."""
+            fp.write("[{0}]\n".format(section_name))
+            for key, value in section_items:
+                value = self._interpolation.before_write(self, section_name, key,
+                                                         value)
+                if value is not None or not self._allow_no_value:
+                    value = delimiter + str(value).replace('\n', '\n\t')
+                else:
+                    value = ""
+                fp.write("{0}{1}\n".format(key, value))
+            fp.write("\n")
+
+        def remove_option(self, section, option):
+            """Remove an option."""
+            if not section or section == self.default_section:
+                sectdict = self._defaults
+            else:
+                try:
+                    sectdict = self._sections[section]
+                except KeyError:
+                    raise from_none(NoSectionError(section))
+            option = self.optionxform(option)
+            existed = option in sectdict
+            if existed:
+                del sectdict[option]
+            return existed
+
+        def remove_section(self, section):
+            """Remove a file section."""
+            existed = section in self._sections
+            if existed:
+                del self._sections[section]
+                del self._proxies[section]
+            return existed
+
+        def __getitem__(self, key):
+            if key != self.default_section and not self.has_section(key):
+                raise KeyError(key)
+            return self._proxies[key]
+
+        def __setitem__(self, key, value):
+            # To conform with the mapping protocol, overwrites existing values in
+            # the section.
+
+            # XXX this is not atomic if read_dict fails at any point. Then again,
+            # no update method in configparser is atomic in this implementation.
+            if key == self.default_section:
+                self._defaults.clear()
+            elif key in self._sections:
+                self._sections[key].clear()
+            self.read_dict({key: value})
+
+        def __delitem__(self, key):
+            if key == self.default_section:
+                raise ValueError("Cannot remove the default section.")
+            if not self.has_section(key):
+                raise KeyError(key)
+            self.remove_section(key)
+
+        def __contains__(self, key):
+            return key == self.default_section or self.has_section(key)
+
+        def __len__(self):
+            return len(self._sections) + 1 # the default section
+
+        def __iter__(self):
+            # XXX does it break when underlying container state changed?
+            return itertools.chain((self.default_section,), self._sections.keys())
+
+        def _read(self, fp, fpname):
+            """Parse a sectioned configuration file.
+
+            Each section in a configuration file contains a header, indicated by
+            a name in square brackets (`[]'), plus key/value options, indicated by
+            `name' and `value' delimited with a specific substring (`=' or `:' by
+            default).
+
+            Values can span multiple lines, as long as they are indented deeper
+            than the first line of the value. Depending on the parser's mode, blank
+            lines may be treated as parts of multiline values or ignored.
+
+            Configuration files may include comments, prefixed by specific
+            characters (`#' and `;' by default). Comments may appear on their own
+            in an otherwise empty line or may be entered in lines holding values or
+            section names.
+            """
+            elements_added = set()
+            cursect = None                        # None, or a dictionary
+            sectname = None
+            optname = None
+            lineno = 0
+            indent_level = 0
+            e = None                              # None, or an exception
+            for lineno, line in enumerate(fp, start=1):
+                comment_start = sys.maxsize
+                # strip inline comments
+                inline_prefixes = dict(
+                    (p, -1) for p in self._inline_comment_prefixes)
+                while comment_start == sys.maxsize and inline_prefixes:
+                    next_prefixes = {}
+                    for prefix, index in inline_prefixes.items():
+                        index = line.find(prefix, index + 1)
+                        if index == -1:
+                            continue
+                        next_prefixes[prefix] = index
+                        if index == 0 or (index > 0 and line[index - 1].isspace()):
+                            comment_start = min(comment_start, index)
+                    inline_prefixes = next_prefixes
+                # strip full line comments
+                for prefix in self._comment_prefixes:
+                    if line.strip().startswith(prefix):
+                        comment_start = 0
+                        break
+                if comment_start == sys.maxsize:
+                    comment_start = None
+                value = line[:comment_start].strip()
+                if not value:
+                    if self._empty_lines_in_values:
+                        # add empty line to the value, but only if there was no
+                        # comment on the line
+                        if (comment_start is None and
+                                cursect is not None and
+                                optname and
+                                cursect[optname] is not None):
+                            cursect[optname].append('') # newlines added at join
+                    else:
+                        # empty line marks end of value
+                        indent_level = sys.maxsize
+                    continue
+                # continuation line?
+                first_nonspace = self.NONSPACECRE.search(line)
+                cur_indent_level = first_nonspace.start() if first_nonspace else 0
+                if (cursect is not None and optname and
+                        cur_indent_level > indent_level):
+                    cursect[optname].append(value)
+                # a section header or option header?
+                else:
+                    indent_level = cur_indent_level
+                    # is it a section header?
+                    mo = self.SECTCRE.match(value)
+                    if mo:
+                        sectname = mo.group('header')
+                        if sectname in self._sections:
+                            if self._strict and sectname in elements_added:
+                                raise DuplicateSectionError(sectname, fpname,
+                                                            lineno)
+                            cursect = self._sections[sectname]
+                            elements_added.add(sectname)
+                        elif sectname == self.default_section:
+                            cursect = self._defaults
+                        else:
+                            cursect = self._dict()
+                            self._sections[sectname] = cursect
+                            self._proxies[sectname] = SectionProxy(self, sectname)
+                            elements_added.add(sectname)
+                        # So sections can't start with a continuation line
+                        optname = None
+                    # no section header in the file?
+                    elif cursect is None:
+                        raise MissingSectionHeaderError(fpname, lineno, line)
+                    # an option line?
+                    else:
+                        mo = self._optcre.match(value)
+                        if mo:
+                            optname, vi, optval = mo.group('option', 'vi', 'value')
+                            if not optname:
+                                e = self._handle_error(e, fpname, lineno, line)
+                            optname = self.optionxform(optname.rstrip())
+                            if (self._strict and
+                                    (sectname, optname) in elements_added):
+                                raise DuplicateOptionError(sectname, optname,
+                                                           fpname, lineno)
+                            elements_added.add((sectname, optname))
+                            # This check is fine because the OPTCRE cannot
+                            # match if it would set optval to None
+                            if optval is not None:
+                                optval = optval.strip()
+                                cursect[optname] = [optval]
+                            else:
+                                # valueless option handling
+                                cursect[optname] = None
+                        else:
+                            # a non-fatal parsing error occurred. set up the
+                            # exception but keep going. the exception will be
+                            # raised at the end of the file and will contain a
+                            # list of all bogus lines
+                            e = self._handle_error(e, fpname, lineno, line)
+            self._join_multiline_values()
+            # if any parsing errors occurred, raise an exception
+            if e:
+                raise e
+
+        def _join_multiline_values(self):
+            defaults = self.default_section, self._defaults
+            all_sections = itertools.chain((defaults,),
+                                           self._sections.items())
+            for section, options in all_sections:
+                for name, val in options.items():
+                    if isinstance(val, list):
+                        val = '\n'.join(val).rstrip()
+                    options[name] = self._interpolation.before_read(self,
+                                                                    section,
+                                                                    name, val)
+
+        def _handle_error(self, exc, fpname, lineno, line):
+            if not exc:
+                exc = ParsingError(fpname)
+            exc.append(lineno, repr(line))
+            return exc
+
+        def _unify_values(self, section, vars):
+            """Create a sequence of lookups with 'vars' taking priority over
+            the 'section' which takes priority over the DEFAULTSECT.
+
+            """
+            sectiondict = {}
+            try:
+                sectiondict = self._sections[section]
+            except KeyError:
+                if section != self.default_section:
+                    raise NoSectionError(section)
+            # Update with the entry specific variables
+            vardict = {}
+            if vars:
+                for key, value in vars.items():
+                    if value is not None:
+                        value = str(value)
+                    vardict[self.optionxform(key)] = value
+            return ChainMap(vardict, sectiondict, self._defaults)
+
+        def _convert_to_boolean(self, value):
+            """Return a boolean value translating from other types if necessary.
+            """
+            if value.lower() not in self.BOOLEAN_STATES:
+                raise ValueError('Not a boolean: %s' % value)
+            return self.BOOLEAN_STATES[value.lower()]
+
+        def _validate_value_types(self, **kwargs):
+            """Raises a TypeError for non-string values.
+
+            The only legal non-string value if we allow valueless
+            options is None, so we need to check if the value is a
+            string if:
+            - we do not allow valueless options, or
+            - we allow valueless options but the value is not None
+
+            For compatibility reasons this method is not used in classic set()
+            for RawConfigParsers. It is invoked in every case for mapping protocol
+            access and in ConfigParser.set().
+            """
+            # keyword-only arguments
+            section = kwargs.get('section', "")
+            option = kwargs.get('option', "")
+            value = kwargs.get('value', "")
+
+            # Python2 stuff
+            if isinstance(section, bytes):
+                section = section.decode('utf8')
+            if isinstance(option, bytes):
+                option = option.decode('utf8')
+            if isinstance(value, bytes):
+                value = value.decode('utf8')
+
+            if not isinstance(section, str):
+                raise TypeError("section names must be strings")
+            if not isinstance(option, str):
+                raise TypeError("option keys must be strings")
+            if not self._allow_no_value or value:
+                if not isinstance(value, str):
+                    raise TypeError("option values must be strings")
+
+            return section, option, value
+
+        @property
+        def converters(self):
+            return self._converters
+
+
+    class ConfigParser(RawConfigParser):
+        """ConfigParser implementing interpolation."""
+
+        _DEFAULT_INTERPOLATION = BasicInterpolation()
+
+        def set(self, section, option, value=None):
+            """Set an option.  Extends RawConfigParser.set by validating type and
+            interpolation syntax on the value."""
+            _, option, value = self._validate_value_types(option=option, value=value)
+            super(ConfigParser, self).set(section, option, value)
+
+        def add_section(self, section):
+            """Create a new section in the configuration.  Extends
+            RawConfigParser.add_section by validating if the section name is
+            a string."""
+            section, _, _ = self._validate_value_types(section=section)
+            super(ConfigParser, self).add_section(section)
+
+
+    class SafeConfigParser(ConfigParser):
+        """ConfigParser alias for backwards compatibility purposes."""
+
+        def __init__(self, *args, **kwargs):
+            super(SafeConfigParser, self).__init__(*args, **kwargs)
+            warnings.warn(
+                "The SafeConfigParser class has been renamed to ConfigParser "
+                "in Python 3.2. This alias will be removed in future versions."
+                " Use ConfigParser directly instead.",
+                DeprecationWarning, stacklevel=2
+            )
+
+
+    class SectionProxy(MutableMapping):
+        """A proxy for a single section from a parser."""
+
+        def __init__(self, parser, name):
+            """Creates a view on a section of the specified `name` in `parser`."""
+            self._parser = parser
+            self._name = name
+            for conv in parser.converters:
+                key = 'get' + conv
+                getter = functools.partial(self.get, _impl=getattr(parser, key))
+                setattr(self, key, getter)
+
+        def __repr__(self):
+            return '<Section: {0}>'.format(self._name)
+
+        def __getitem__(self, key):
+            if not self._parser.has_option(self._name, key):
+                raise KeyError(key)
+            return self._parser.get(self._name, key)
+
+        def __setitem__(self, key, value):
+            _, key, value = self._parser._validate_value_types(option=key, value=value)
+            return self._parser.set(self._name, key, value)
+
+        def __delitem__(self, key):
+            if not (self._parser.has_option(self._name, key) and
+                    self._parser.remove_option(self._name, key)):
+                raise KeyError(key)
+
+        def __contains__(self, key):
+            return self._parser.has_option(self._name, key)
+
+        def __len__(self):
+            return len(self._options())
+
+        def __iter__(self):
+            return self._options().__iter__()
+
+        def _options(self):
+            if self._name != self._parser.default_section:
+                return self._parser.options(self._name)
+            else:
+                return self._parser.defaults()
+
+        @property
+        def parser(self):
+            # The parser object of the proxy is read-only.
+            return self._parser
+
+        @property
+        def name(self):
+            # The name of the section on a proxy is read-only.
+            return self._name
+
+        def get(self, option, fallback=None, **kwargs):
+            """Get an option value.
+
+            Unless `fallback` is provided, `None` will be returned if the option
+            is not found.
+
+            """
+            # keyword-only arguments
+            kwargs.setdefault('raw', False)
+            kwargs.setdefault('vars', None)
+            _impl = kwargs.pop('_impl', None)
+            # If `_impl` is provided, it should be a getter method on the parser
+            # object that provides the desired type conversion.
+            if not _impl:
+                _impl = self._parser.get
+            return _impl(self._name, option, fallback=fallback, **kwargs)
+
+
+    class ConverterMapping(MutableMapping):
+        """Enables reuse of get*() methods between the parser and section proxies.
+
+        If a parser class implements a getter directly, the value for the given
+        key will be ``None``. The presence of the converter name here enables
+        section proxies to find and use the implementation on the parser class.
+        """
+
+        GETTERCRE = re.compile(r"^get(?P<name>.+)$")
+
+        def __init__(self, parser):
+            self._parser = parser
+            self._data = {}
+            for getter in dir(self._parser):
+                m = self.GETTERCRE.match(getter)
+                if not m or not callable(getattr(self._parser, getter)):
+                    continue
+                self._data[m.group('name')] = None   # See class docstring.
+
+        def __getitem__(self, key):
+            return self._data[key]
+
+        def __setitem__(self, key, value):
+            try:
+                k = 'get' + key
+            except TypeError:
+                raise ValueError('Incompatible key: {} (type: {})'
+                                 ''.format(key, type(key)))
+            if k == 'get':
+                raise ValueError('Incompatible key: cannot use "" as a name')
+            self._data[key] = value
+            func = functools.partial(self._parser._get_conv, conv=value)
+            func.converter = value
+            setattr(self._parser, k, func)
+            for proxy in self._parser.values():
+                getter = functools.partial(proxy.get, _impl=func)
+                setattr(proxy, k, getter)
+
+        def __delitem__(self, key):
+            try:
+                k = 'get' + (key or None)
+            except TypeError:
+                raise KeyError(key)
+            del self._data[key]
+            for inst in itertools.chain((self._parser,), self._parser.values()):
+                try:
+                    delattr(inst, k)
+                except AttributeError:
+                    # don't raise since the entry was present in _data, silently
+                    # clean up
+                    continue
+
+        def __iter__(self):
+            return iter(self._data)
+
+        def __len__(self):
+            return len(self._data)
+
+
+# This is for Python 3, should work with 3.5 and above
+# yes it is short, because the Python 3.5 configparser module provides a lot
+else:
+    import functools
+    import itertools
+    from configparser import *
+    from configparser import _UNSET, Error
+    from collections import OrderedDict
+    from io import StringIO
+
+
+# implementation for Python 3 and Python 2.7
+
+import codecs
+import fnmatch
+import hashlib
+import marshal
+import mmap
+import os
+import re
+import select
+import struct
+import sys
+import threading
+import zlib
+from io import TextIOWrapper
+from stat import S_IMODE, S_ISREG
+try:
+    from threading import get_ident as _get_ident
+except ImportError:
+    from thread import get_ident as _get_ident
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:
+    from collections import Mapping, MutableMapping
+try:
+    import asyncio
+    _get_running_loop = getattr(asyncio, "get_running_loop",
+                                asyncio.get_event_loop)
+except ImportError:  # Python 2
+    asyncio = None
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # before Python 3.8
+    shared_memory = None
+
+
+def _require_shared_memory():
+    if shared_memory is None:
+        raise NotImplementedError("Shared memory segments need the module "
+                                  "multiprocessing.shared_memory of Python "
+                                  "3.8 or later")
+
+
+# Version of the compiled configuration files written to cache_dir
+_CACHE_MAGIC = (1, tuple(sys.version_info[:2]))
+
+# Layout of a SharedConfig buffer: header, UTF-8 strings, hash table.
+# Header: magic, number of slots (a power of 2), offset of the table,
+# section names and default section name as (offset, length).
+# Slot: key, value and raw value as (offset, length), length -1 for None.
+# Keys are the section names, with the options of the section joined by
+# "\0" as value in the order of items() and as raw value in the order of
+# options(), and "section\0option" with the option values.
+_SHARED_MAGIC = b"StdCfg\x00\x02"
+_SHARED_HEADER = struct.Struct("<8sIIIIII")
+_SHARED_SLOT = struct.Struct("<IIIiIi")
+
+_PathLike = getattr(os, "PathLike", ())
+_replace = getattr(os, "replace", os.rename)
+
+
+def _convert_lines(value):
+    """
+    Split string value into lines and return this list without empty lines.
+    """
+    lines = [line for line in value.splitlines() if line]
+    return lines
+
+
+def _convert_listing(value):
+    """
+    Split string values by ',' trim the values and return it as list.
+    """
+    listing = [e for e in (elem.strip() for elem in value.split(',')) if e]
+    return listing
+
+
+def _iterevents(lines, fpname, tokenize, empty_lines_in_values=True,
+                allow_no_value=False):
+    """Generate the events of `lines', an iterable of (lineno, line) pairs.
+
+    Lines are classified by `tokenize', the match method of a line
+    tokenizer like StdConfigParser.LINECRE. If `tokenize' is None the lines
+    are matches already. Besides the events of iterparse an
+    ("error", lineno, None, line) event is generated for invalid lines.
+    """
+    in_section = False
+    optname = None                        # name of the current option
+    has_value = False
+    indent_level = 0
+    for lineno, line in lines:
+        match = line if tokenize is None else tokenize(line)
+        (indent, comment, text, header,
+         option, vi, value) = match.groups()
+        if not text:
+            if comment is not None:
+                yield "comment", lineno, None, match.group(0).strip()
+            if empty_lines_in_values:
+                # add empty line to the value, but only if there was
+                # no comment on the line
+                if comment is None and optname and has_value:
+                    yield "continuation", lineno, optname, ""
+            else:
+                # empty line marks end of value
+                indent_level = sys.maxsize
+            continue
+        # continuation line?
+        cur_indent_level = len(indent)
+        if optname and cur_indent_level > indent_level:
+            yield "continuation", lineno, optname, text
+            continue
+        indent_level = cur_indent_level
+        if header is not None:
+            in_section = True
+            # So sections can't start with a continuation line
+            optname = None
+            yield "section", lineno, header, None
+            continue
+        # no section header in the file?
+        if not in_section:
+            raise MissingSectionHeaderError(fpname, lineno, match.group(0))
+        elif option is None and not allow_no_value:
+            yield "error", lineno, None, match.group(0)
+        else:
+            if option is None:
+                # valueless option
+                option = text
+            optname = option.rstrip()
+            if not optname:
+                yield "error", lineno, None, match.group(0)
+            has_value = vi is not None
+            yield "option", lineno, optname, value if has_value else None
+
+
+def iterparse(fp, fpname=None):
+    """Parse the configuration file `fp' step by step.
+
+    Generates (event, lineno, name, value) tuples while reading, nothing
+    else is kept in memory. Same grammar as StdConfigParser. The events are:
+
+    - ("section", lineno, section name, None)
+    - ("option", lineno, option name, first line of the value)
+    - ("continuation", lineno, option name, next line of the value),
+      empty lines inside of a value are continuations with an empty value
+    - ("comment", lineno, None, comment line)
+
+    Option names are not transformed by optionxform. After the last event
+    a ParsingError is raised for invalid lines.
+    """
+    if fpname is None:
+        try:
+            fpname = fp.name
+        except AttributeError:
+            fpname = '<???>'
+    e = None
+    for event in _iterevents(enumerate(fp, start=1), fpname,
+                             StdConfigParser.LINECRE.match):
+        if event[0] == "error":
+            if not e:
+                e = ParsingError(fpname)
+            e.append(event[1], repr(event[3]))
+        else:
+            yield event
+    if e:
+        raise e
+
+
+class InterpolationCycleError(InterpolationError):
+    """Raised when substitutions reference each other in a cycle."""
+
+    def __init__(self, option, section, cycle):
+        path = " -> ".join("${%s:%s}" % node for node in cycle + cycle[:1])
+        msg = ("Interpolation cycle: option {0!r} in section {1!r} references "
+               "itself: {2}".format(option, section, path))
+        InterpolationError.__init__(self, option, section, msg)
+        self.cycle = cycle
+        self.args = (option, section, cycle)
+
+
+class ResolveError(Error):
+    """Raised by StdConfigParser.resolve_all() with all errors found."""
+
+    def __init__(self, errors):
+        msg = ["Interpolation failed for %d value(s):" % len(errors)]
+        msg.extend(str(error) for error in errors)
+        Error.__init__(self, "\n\t".join(msg))
+        self.errors = errors
+        self.args = (errors, )
+
+
+class SchemaError(Error):
+    """Raised by Schema.validate() with all errors found."""
+
+    def __init__(self, errors):
+        msg = ["Validation failed for %d value(s):" % len(errors)]
+        msg.extend(str(error) for error in errors)
+        Error.__init__(self, "\n\t".join(msg))
+        self.errors = errors
+        self.args = (errors, )
+
+
+class StdInterpolation(ExtendedInterpolation):
+    """Interpolation based on the configparser.ExtendedInterpolation.
+
+    Adds only the feature to be more tolerant and support ':' also in the
+    section name.
+
+    Interpolated values are cached per section and option. The parser
+    must call clear_cache() if the configuration changes.
+    """
+
+    def __init__(self):
+        # (section, option) -> (raw value, interpolated value)
+        self._cache = {}
+
+    def before_get(self, parser, section, option, value, defaults):
+        # only lookups without `vars' are cached, see _unify_values
+        if not isinstance(defaults, ChainMap) or defaults.maps[0]:
+            return super(StdInterpolation, self).before_get(
+                parser, section, option, value, defaults)
+        key = (section, option)
+        try:
+            rawval, result = self._cache[key]
+            if rawval == value:
+                return result
+        except KeyError:
+            pass
+        result = super(StdInterpolation, self).before_get(
+            parser, section, option, value, defaults)
+        self._cache[key] = (value, result)
+        return result
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def resolve_all(self, parser):
+        """Interpolate all values of all sections of `parser' at once.
+
+        A reference graph of the options is built and every value is
+        interpolated exactly once, in dependency order. There is no depth
+        limit, instead all missing references, syntax errors and cycles are
+        collected and raised together as ResolveError. Values nested deeper
+        than MAX_INTERPOLATION_DEPTH are not cached, get() rejects them.
+        """
+        failed = object()
+        results = {}                          # node -> value, or failed
+        references = {}                       # node -> parsed raw value
+        depths = {}                           # node -> depth of get()
+        errors = []
+        roots = []
+        for section in parser.sections():
+            roots.append((section, parser._raw_options(section)))
+        for section, options in roots:
+            for option in options:
+                stack = [(section, option)]
+                on_stack = set(stack)
+                while stack:
+                    node = stack[-1]
+                    if node in results:
+                        on_stack.discard(stack.pop())
+                        continue
+                    if node not in references:
+                        references[node] = self._parse_references(
+                            parser, node, errors)
+                    if references[node] is None:
+                        results[node] = failed
+                        continue
+                    for ref in references[node]:
+                        if not isinstance(ref, tuple) or ref in results:
+                            continue
+                        if ref in on_stack:
+                            cycle = stack[stack.index(ref):]
+                            errors.append(InterpolationCycleError(
+                                ref[1], ref[0], cycle))
+                            results[node] = failed
+                            break
+                        stack.append(ref)
+                        on_stack.add(ref)
+                        break
+                    else:
+                        parts = []
+                        # get() interpolates every value with a '$' one
+                        # level deeper than the value referencing it
+                        depth = 0
+                        for ref in references[node]:
+                            if isinstance(ref, tuple):
+                                if results[ref] is failed:
+                                    results[node] = failed
+                                    break
+                                depth = max(depth, depths[ref] + 1)
+                                ref = results[ref]
+                            elif "$" in ref:
+                                depth = max(depth, 1)
+                            parts.append(ref)
+                        else:
+                            results[node] = "".join(parts)
+                            depths[node] = depth
+                        on_stack.discard(stack.pop())
+        if errors:
+            raise ResolveError(errors)
+        resolved = OrderedDict()
+        for section, options in roots:
+            items = resolved[section] = OrderedDict()
+            for option, value in options.items():
+                items[option] = result = results[(section, option)]
+                if depths[(section, option)] <= MAX_INTERPOLATION_DEPTH:
+                    self._cache[(section, option)] = (value, result)
+        return resolved
+
+    def _parse_references(self, parser, node, errors):
+        """Split the raw value of `node' into text and referenced nodes.
+
+        Returns None if the value has errors, they are appended to `errors'.
+        """
+        section, option = node
+        value = rest = parser.get(section, option, raw=True)
+        parts = []
+        while rest:
+            p = rest.find("$")
+            if p < 0:
+                parts.append(rest)
+                break
+            if p > 0:
+                parts.append(rest[:p])
+                rest = rest[p:]
+            # p is no longer used
+            c = rest[1:2]
+            if c == "$":
+                parts.append("$")
+                rest = rest[2:]
+            elif c == "{":
+                m = self._KEYCRE.match(rest)
+                if m is None:
+                    errors.append(InterpolationSyntaxError(option, section,
+                                  "bad interpolation variable reference %r"
+                                  % rest))
+                    return None
+                path = m.group(1).rsplit(":", 1)
+                rest = rest[m.end():]
+                if len(path) == 1:
+                    ref = (section, parser.optionxform(path[0]))
+                else:
+                    ref = (path[0], parser.optionxform(path[1]))
+                if ref[0] not in parser or not parser.has_option(*ref):
+                    errors.append(InterpolationMissingOptionError(
+                        option, section, value, m.group(1)))
+                    return None
+                parts.append(ref)
+            else:
+                errors.append(InterpolationSyntaxError(
+                    option, section,
+                    "'$' must be followed by '$' or '{', "
+                    "found: %r" % (rest,)))
+                return None
+        return parts
+
+    def _interpolate_some(self, parser, option, accum, rest, section, map,
+                          depth):
+        rawval = parser.get(section, option, raw=True, fallback=rest)
+        if depth > MAX_INTERPOLATION_DEPTH:
+            raise InterpolationDepthError(option, section, rawval)
+        while rest:
+            p = rest.find("$")
+            if p < 0:
+                accum.append(rest)
+                return
+            if p > 0:
+                accum.append(rest[:p])
+                rest = rest[p:]
+            # p is no longer used
+            c = rest[1:2]
+            if c == "$":
+                accum.append("$")
+                rest = rest[2:]
+            elif c == "{":
+                m = self._KEYCRE.match(rest)
+                if m is None:
+                    raise InterpolationSyntaxError(option, section,
+                          "bad interpolation variable reference %r" % rest)
+                path = m.group(1).split(':')
+                rest = rest[m.end():]
+                sect = section
+                opt = option
+                try:
+                    if len(path) == 1:
+                        opt = parser.optionxform(path[0])
+                        v = map[opt]
+                    elif len(path) == 2:
+                        sect = path[0]
+                        opt = parser.optionxform(path[1])
+                        v = parser.get(sect, opt, raw=True)
+                    else:
+                        sect = ":".join(path[0:-1])
+                        opt = parser.optionxform(path[-1])
+                        v = parser.get(sect, opt, raw=True)
+                        # raise InterpolationSyntaxError(
+                        #     option, section,
+                        #     "More than one ':' found: %r" % (rest,))
+                except (KeyError, NoSectionError, NoOptionError):
+                    raise from_none(InterpolationMissingOptionError(
+                        option, section, rawval, ":".join(path)))
+                if "$" in v:
+                    self._interpolate_some(parser, opt, accum, v, sect,
+                                           dict(parser.items(sect, raw=True)),
+                                           depth + 1)
+                else:
+                    accum.append(v)
+            else:
+                raise InterpolationSyntaxError(
+                    option, section,
+                    "'$' must be followed by '$' or '{', "
+                    "found: %r" % (rest,))
+
+
+class _SectionIndex(object):
+    """Trie of section names split into segments at ':'.
+
+    A node is a list [children, name], children is an OrderedDict mapping
+    the next segment to a node, name is the section ending at the node or
+    None.
+    """
+
+    def __init__(self, names=()):
+        self._root = [OrderedDict(), None]
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        node = self._root
+        for segment in name.split(":"):
+            children = node[0]
+            try:
+                node = children[segment]
+            except KeyError:
+                node = children[segment] = [OrderedDict(), None]
+        node[1] = name
+
+    def discard(self, name):
+        segments = name.split(":")
+        path = [self._root]
+        for segment in segments:
+            node = path[-1][0].get(segment)
+            if node is None:
+                return
+            path.append(node)
+        path[-1][1] = None
+        # remove the nodes left without sections
+        for segment, parent, node in reversed(list(zip(segments, path,
+                                                       path[1:]))):
+            if node[0] or node[1] is not None:
+                break
+            del parent[0][segment]
+
+    def under(self, prefix):
+        """Return the sections below `prefix', depth first."""
+        node = self._root
+        for segment in prefix.split(":"):
+            node = node[0].get(segment)
+            if node is None:
+                return []
+        names = []
+        stack = list(node[0].values())[::-1]
+        while stack:
+            node = stack.pop()
+            if node[1] is not None:
+                names.append(node[1])
+            if node[0]:
+                stack.extend(list(node[0].values())[::-1])
+        return names
+
+    def match(self, pattern):
+        """Return the sections matching the glob `pattern' segment-wise."""
+        nodes = [self._root]
+        for segment in pattern.split(":"):
+            if any(c in segment for c in "*?["):
+                match = re.compile(fnmatch.translate(segment)).match
+                nodes = [child for node in nodes
+                         for key, child in node[0].items() if match(key)]
+            else:
+                nodes = [node[0][segment] for node in nodes
+                         if segment in node[0]]
+            if not nodes:
+                return []
+        return [node[1] for node in nodes if node[1] is not None]
+
+
+class _IndexedSections(OrderedDict):
+    """Sections of a StdConfigParser, with an index of their names.
+
+    The _SectionIndex is built by name_index() and then kept up to date by
+    every change of the sections.
+    """
+
+    def __init__(self):
+        super(_IndexedSections, self).__init__()
+        self._index = None
+
+    def __setitem__(self, key, value):
+        if self._index is not None and key not in self:
+            self._index.add(key)
+        OrderedDict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        OrderedDict.__delitem__(self, key)
+        if self._index is not None:
+            self._index.discard(key)
+
+    def pop(self, *args):
+        self._index = None
+        return OrderedDict.pop(self, *args)
+
+    def popitem(self, *args, **kwargs):
+        self._index = None
+        return OrderedDict.popitem(self, *args, **kwargs)
+
+    def clear(self):
+        self._index = None
+        OrderedDict.clear(self)
+
+    def name_index(self):
+        if self._index is None:
+            self._index = _SectionIndex(self)
+        return self._index
+
+
+class _LazySections(_IndexedSections):
+    """Sections of a lazy StdConfigParser.
+
+    Sections read in lazy mode are only indexed. Their text is parsed by the
+    parser the first time the section dictionary is accessed.
+    """
+
+    def __init__(self, parser):
+        super(_LazySections, self).__init__()
+        self._parser = parser
+        # section name -> list of (text, start, end, lineno, source) chunks
+        self._pending = {}
+
+    def __getitem__(self, key):
+        if self._pending:
+            chunks = self._pending.pop(key, None)
+            if chunks:
+                self._parser._read_chunks(chunks)
+        return OrderedDict.__getitem__(self, key)
+
+    def __delitem__(self, key):
+        self._pending.pop(key, None)
+        _IndexedSections.__delitem__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def add_chunk(self, key, chunk):
+        self._pending.setdefault(key, []).append(chunk)
+
+
+class _ConverterCache(object):
+    """Cache for converted values.
+
+    If `size' is None the cache is unbounded, otherwise the least recently
+    used values are evicted if more than `size' values are stored.
+    """
+
+    def __init__(self, size=None):
+        self._size = size
+        self._data = OrderedDict()
+
+    def get(self, key):
+        """Return the cached value for `key', raise KeyError if not cached."""
+        if self._size is None:
+            return self._data[key]
+        value = self._data.pop(key)
+        self._data[key] = value
+        return value
+
+    def set(self, key, value):
+        self._data[key] = value
+        if self._size is not None and len(self._data) > self._size:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                # evicted by another thread
+                pass
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _write_atomic(filename, chunks, fsync=True):
+    """Replace `filename' atomically by a file with the bytes `chunks'.
+
+    The mode of an existing file is kept. With `fsync' the file and the
+    directory are flushed to disk before returning.
+    """
+    tmpfile = "%s.%d.%d.tmp" % (filename, os.getpid(), _get_ident())
+    try:
+        with open(tmpfile, "wb") as fp:
+            for chunk in chunks:
+                fp.write(chunk)
+            try:
+                os.chmod(tmpfile, S_IMODE(os.stat(filename).st_mode))
+            except OSError:
+                pass
+            if fsync:
+                fp.flush()
+                os.fsync(fp.fileno())
+        _replace(tmpfile, filename)
+    except Exception:
+        try:
+            os.remove(tmpfile)
+        except OSError:
+            pass
+        raise
+    if fsync and os.name == "posix":
+        # the new directory entry
+        fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _annotate_conv_error(ex, section, option, conv):
+    """Add option, section and converter to the message of `ex'."""
+    if hasattr(ex, "args"):
+        ex.args += ("This error occured by getting option %r in section %r"
+                    " with converter %r." % (option, section, conv.__name__), )
+
+
+def _lower(optionstr):
+    return optionstr.lower()
+
+
+class _FrozenSection(Mapping):
+    """Read-only section of a FrozenConfig, the SectionProxy counterpart."""
+
+    __slots__ = ("_config", "_name", "_values")
+
+    def __init__(self, config, name, values):
+        self._config = config
+        self._name = name
+        self._values = values
+
+    def __repr__(self):
+        return '<Section: {0}>'.format(self._name)
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._config.optionxform(key)]
+        except KeyError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self._config.optionxform(key) in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def parser(self):
+        return self._config
+
+    @property
+    def name(self):
+        return self._name
+
+    def get(self, option, fallback=None, raw=False, vars=None, _impl=None,
+            **kwargs):
+        if not _impl:
+            _impl = self._config.get
+        return _impl(self._name, option, raw=raw, vars=vars,
+                     fallback=fallback, **kwargs)
+
+    def getint(self, option, fallback=None, raw=False, vars=None):
+        return self._config.getint(self._name, option, raw=raw, vars=vars,
+                                   fallback=fallback)
+
+    def getfloat(self, option, fallback=None, raw=False, vars=None):
+        return self._config.getfloat(self._name, option, raw=raw, vars=vars,
+                                     fallback=fallback)
+
+    def getboolean(self, option, fallback=None, raw=False, vars=None):
+        return self._config.getboolean(self._name, option, raw=raw,
+                                       vars=vars, fallback=fallback)
+
+    def __getattr__(self, name):
+        if not name.startswith("get"):
+            raise AttributeError(name)
+        getter = getattr(self._config, name)   # custom converters
+
+        def get(option, fallback=None, raw=False, vars=None):
+            return getter(self._name, option, raw=raw, vars=vars,
+                          fallback=fallback)
+        return get
+
+
+class FrozenConfig(Mapping):
+    """Read-only snapshot of a StdConfigParser, see StdConfigParser.freeze().
+
+    The options of every section are merged with the defaults and
+    interpolated when the snapshot is created, a lookup is a single
+    dictionary access. A snapshot is never changed, so it can be shared
+    between threads without locking.
+    """
+
+    __slots__ = ("default_section", "optionxform", "_values", "_raw",
+                 "_names", "_options", "_proxies", "_converters",
+                 "_boolean_states")
+
+    def __init__(self, parser):
+        self.default_section = default = parser.default_section
+        if (type(parser).optionxform is RawConfigParser.optionxform
+                and "optionxform" not in vars(parser)):
+            # do not keep the parser alive
+            self.optionxform = _lower
+        else:
+            self.optionxform = parser.optionxform
+        self._names = tuple(parser.sections())
+        # the options in the order of the parser, options() lists the
+        # options of the section first, items() the defaults
+        self._options = dict((section, tuple(parser.options(section)))
+                             for section in self._names)
+        raw = {}
+        for section in (default, ) + self._names:
+            raw[section] = parser._dict(parser._raw_options(section))
+        self._raw = raw
+        if isinstance(parser._interpolation, StdInterpolation):
+            values = {default: parser._dict(parser.items(default))}
+            for section, options in parser.resolve_all().items():
+                values[section] = parser._dict(options)
+            self._values = values
+        else:
+            self._values = raw
+        self._proxies = dict((section, _FrozenSection(self, section, options))
+                             for section, options in self._values.items())
+        self._boolean_states = dict(parser.BOOLEAN_STATES)
+        self._converters = {"int": int, "float": float,
+                            "boolean": self._convert_to_boolean}
+        for name, func in parser.converters.items():
+            if func is not None:
+                self._converters[name] = func
+
+    def __repr__(self):
+        return '<FrozenConfig: {0} sections>'.format(len(self._names))
+
+    def __getitem__(self, key):
+        return self._proxies[key]
+
+    def __contains__(self, key):
+        return key in self._proxies
+
+    def __iter__(self):
+        return itertools.chain((self.default_section, ), self._names)
+
+    def __len__(self):
+        return len(self._proxies)
+
+    def defaults(self):
+        return OrderedDict(self._values[self.default_section])
+
+    def sections(self):
+        return list(self._names)
+
+    def has_section(self, section):
+        return section != self.default_section and section in self._proxies
+
+    def options(self, section):
+        if not self.has_section(section):
+            raise NoSectionError(section)
+        return list(self._options[section])
+
+    def has_option(self, section, option):
+        options = self._values.get(section or self.default_section)
+        return options is not None and self.optionxform(option) in options
+
+    def get(self, section, option, raw=False, vars=None, fallback=_UNSET):
+        """Get an option value for a given section.
+
+        Same as ConfigParser.get(), but values given with `vars' are
+        returned as they are, without interpolation.
+        """
+        try:
+            options = (self._raw if raw else self._values)[section]
+        except KeyError:
+            if fallback is _UNSET:
+                raise NoSectionError(section)
+            return fallback
+        option = self.optionxform(option)
+        if vars:
+            for key, value in vars.items():
+                if self.optionxform(key) == option:
+                    return value
+        try:
+            return options[option]
+        except KeyError:
+            if fallback is _UNSET:
+                raise NoOptionError(option, section)
+            return fallback
+
+    def items(self, section=_UNSET, raw=False, vars=None):
+        if section is _UNSET:
+            return super(FrozenConfig, self).items()
+        try:
+            options = (self._raw if raw else self._values)[section]
+        except KeyError:
+            raise NoSectionError(section)
+        if vars:
+            options = OrderedDict(options)
+            for key, value in vars.items():
+                option = self.optionxform(key)
+                if option in options:
+                    options[option] = value
+        return list(options.items())
+
+    def getint(self, section, option, raw=False, vars=None, fallback=_UNSET):
+        return self._get_conv(section, option, int, raw=raw, vars=vars,
+                              fallback=fallback)
+
+    def getfloat(self, section, option, raw=False, vars=None,
+                 fallback=_UNSET):
+        return self._get_conv(section, option, float, raw=raw, vars=vars,
+                              fallback=fallback)
+
+    def getboolean(self, section, option, raw=False, vars=None,
+                   fallback=_UNSET):
+        return self._get_conv(section, option, self._convert_to_boolean,
+                              raw=raw, vars=vars, fallback=fallback)
+
+    def __getattr__(self, name):
+        if not name.startswith("get"):
+            raise AttributeError(name)
+        try:
+            conv = self._converters[name[3:]]
+        except KeyError:
+            raise AttributeError(name)
+
+        def get(section, option, raw=False, vars=None, fallback=_UNSET):
+            return self._get_conv(section, option, conv, raw=raw, vars=vars,
+                                  fallback=fallback)
+        return get
+
+    def _convert_to_boolean(self, value):
+        if value.lower() not in self._boolean_states:
+            raise ValueError('Not a boolean: %s' % value)
+        return self._boolean_states[value.lower()]
+
+    def _get_conv(self, section, option, conv, raw=False, vars=None,
+                  fallback=_UNSET):
+        try:
+            try:
+                value = self.get(section, option, raw=raw, vars=vars)
+            except (NoSectionError, NoOptionError):
+                if fallback is _UNSET:
+                    raise
+                return fallback
+            return conv(value)
+        except Exception as ex:
+            _annotate_conv_error(ex, section, option, conv)
+            raise
+
+
+def _pack_shared(frozen):
+    """Return the FrozenConfig `frozen' as SharedConfig buffer."""
+    data = bytearray(_SHARED_HEADER.size)
+    offsets = {}
+
+    def add(string):
+        if string is None:
+            return 0, -1
+        string = string.encode("utf-8")
+        if string not in offsets:
+            offsets[string] = len(data), len(string)
+            data.extend(string)
+        return offsets[string]
+
+    slots = []
+    for section in (frozen.default_section, ) + frozen._names:
+        values = frozen._values[section]
+        raw = frozen._raw[section]
+        slots.append((section, add(section) + add("\0".join(values))
+                      + add("\0".join(frozen._options.get(section, ())))))
+        for option, value in values.items():
+            key = section + "\0" + option
+            slots.append((key, add(key) + add(value) + add(raw[option])))
+    names = add("\0".join(frozen._names))
+    default = add(frozen.default_section)
+    data.extend(b"\0" * (-len(data) % 8))
+    table = len(data)
+    size = 8
+    while size < 2 * len(slots):
+        size *= 2
+    data.extend(b"\0" * (size * _SHARED_SLOT.size))
+    mask = size - 1
+    for key, slot in slots:
+        i = zlib.crc32(key.encode("utf-8")) & mask
+        while _SHARED_SLOT.unpack_from(data, table + i * _SHARED_SLOT.size)[0]:
+            i = (i + 1) & mask
+        _SHARED_SLOT.pack_into(data, table + i * _SHARED_SLOT.size, *slot)
+    _SHARED_HEADER.pack_into(data, 0, _SHARED_MAGIC, size, table,
+                             *(names + default))
+    return data
+
+
+class _SharedSections(Mapping):
+    """Sections of a SharedConfig, values or raw values by `index'."""
+
+    __slots__ = ("_config", "_index")
+
+    def __init__(self, config, index):
+        self._config = config
+        self._index = index
+
+    def __getitem__(self, key):
+        if key not in self._config:
+            raise KeyError(key)
+        return _SharedOptions(self._config, key, self._index)
+
+    def __iter__(self):
+        return iter(self._config)
+
+    def __len__(self):
+        return len(self._config)
+
+
+class _SharedOptions(Mapping):
+    """Options of a section of a SharedConfig, read from the buffer."""
+
+    __slots__ = ("_config", "_section", "_index")
+
+    def __init__(self, config, section, index):
+        self._config = config
+        self._section = section
+        self._index = index
+
+    def __getitem__(self, key):
+        slot = self._config._lookup(self._section + "\0" + key)
+        if slot is None:
+            raise KeyError(key)
+        return self._config._string(slot[self._index],
+                                    slot[self._index + 1])
+
+    def __iter__(self):
+        slot = self._config._lookup(self._section)
+        options = self._config._string(slot[2], slot[3])
+        return iter(options.split("\0") if options else ())
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class SharedConfig(FrozenConfig):
+    """FrozenConfig in a read-only buffer shared between processes.
+
+    Created by StdConfigParser.share() in a shared memory segment, other
+    processes use it with attach(). Sections and options are looked up in
+    the buffer and values are decoded on access, the processes do not keep
+    own copies of the configuration. `converters' and `optionxform' are
+    not stored in the buffer, they are given if not the defaults.
+    """
+
+    __slots__ = ("buffer", "name", "_shm", "_table", "_mask")
+
+    def __init__(self, buffer, converters=None, optionxform=None, _shm=None):
+        self.buffer = buf = memoryview(buffer)
+        (magic, size, self._table, names_offset, names_length, default_offset,
+         default_length) = _SHARED_HEADER.unpack_from(buf)
+        if magic != _SHARED_MAGIC:
+            raise ValueError("Not a SharedConfig buffer")
+        self._mask = size - 1
+        self._shm = _shm
+        self.name = _shm.name if _shm is not None else None
+        self.default_section = self._string(default_offset, default_length)
+        names = self._string(names_offset, names_length)
+        self._names = tuple(names.split("\0")) if names else ()
+        self.optionxform = optionxform or _lower
+        self._values = _SharedSections(self, 2)
+        self._raw = _SharedSections(self, 4)
+        self._proxies = None
+        self._boolean_states = dict(RawConfigParser.BOOLEAN_STATES)
+        self._converters = {"int": int, "float": float,
+                            "boolean": self._convert_to_boolean,
+                            "lines": _convert_lines,
+                            "listing": _convert_listing}
+        if converters:
+            self._converters.update(converters)
+
+    @classmethod
+    def attach(cls, name, converters=None, optionxform=None):
+        """Attach to the shared memory segment `name' of share()."""
+        _require_shared_memory()
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before Python 3.13 attaching registers the segment, it would
+            # be removed when this process exits
+            shm = shared_memory.SharedMemory(name=name)
+            if os.name == "posix":
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm.buf, converters, optionxform, _shm=shm)
+
+    def close(self):
+        """Close the shared memory segment, the config is not usable after."""
+        self.buffer.release()
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Remove the shared memory segment, call it once in one process."""
+        self._shm.unlink()
+
+    def __repr__(self):
+        return '<SharedConfig: {0} sections>'.format(len(self._names))
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return _FrozenSection(self, key, self._values[key])
+
+    def __contains__(self, key):
+        return "\0" not in key and self._lookup(key) is not None
+
+    def __len__(self):
+        return len(self._names) + 1
+
+    def has_section(self, section):
+        return section != self.default_section and section in self
+
+    def options(self, section):
+        if not self.has_section(section):
+            raise NoSectionError(section)
+        slot = self._lookup(section)
+        options = self._string(slot[4], slot[5])
+        return options.split("\0") if options else []
+
+    def get(self, section, option, raw=False, vars=None, fallback=_UNSET):
+        option = self.optionxform(option)
+        if vars:
+            for key, value in vars.items():
+                if self.optionxform(key) == option:
+                    return value
+        slot = self._lookup(section + "\0" + option)
+        if slot is not None:
+            if raw:
+                return self._string(slot[4], slot[5])
+            return self._string(slot[2], slot[3])
+        if fallback is not _UNSET:
+            return fallback
+        if section not in self:
+            raise NoSectionError(section)
+        raise NoOptionError(option, section)
+
+    def _lookup(self, key):
+        """Return the slot of `key' or None."""
+        key = key.encode("utf-8")
+        buf, mask, table = self.buffer, self._mask, self._table
+        unpack, size = _SHARED_SLOT.unpack_from, _SHARED_SLOT.size
+        i = zlib.crc32(key) & mask
+        while True:
+            slot = unpack(buf, table + i * size)
+            if not slot[0]:
+                return None
+            if slot[1] == len(key) and buf[slot[0]:slot[0] + slot[1]] == key:
+                return slot
+            i = (i + 1) & mask
+
+    def _string(self, offset, length):
+        if length < 0:
+            return None
+        return codecs.utf_8_decode(self.buffer[offset:offset + length])[0]
+
+
+class _NoLock(object):
+    """Context manager doing nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NOLOCK = _NoLock()
+
+
+class _RWLock(object):
+    """Readers-writer lock, readers do not block each other.
+
+    Readers take no lock, they register their thread in a dictionary,
+    relying on the atomic dictionary operations of CPython, and back off
+    while a thread writes. A writer waits until no other thread reads.
+    Both are reentrant, the writing thread may read.
+    """
+
+    def __init__(self):
+        self._readers = {}                # thread ident -> depth
+        self._writer = None               # ident of the writing thread
+        self._depth = 0                   # depth of the writer
+        self._lock = threading.RLock()    # serializes the writers
+        self._cond = threading.Condition(threading.Lock())
+
+    def acquire_read(self):
+        me = _get_ident()
+        depth = self._readers.get(me, 0)
+        self._readers[me] = depth + 1
+        if not depth and self._writer not in (None, me):
+            self._wait_for_writer(me)
+
+    def release_read(self):
+        me = _get_ident()
+        depth = self._readers[me] - 1
+        if depth:
+            self._readers[me] = depth
+        else:
+            del self._readers[me]
+            if self._writer is not None:
+                self._notify_writer()
+
+    def _wait_for_writer(self, me):
+        """Back off as reader until the writer is done, then register."""
+        readers = self._readers
+        while self._writer not in (None, me):
+            del readers[me]
+            self._notify_writer()
+            # the writer holds the lock while it waits for the readers
+            with self._lock:
+                pass
+            readers[me] = 1
+
+    def _notify_writer(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def acquire_write(self):
+        self._lock.acquire()
+        me = _get_ident()
+        if self._writer == me:
+            self._depth += 1
+            return
+        self._writer = me
+        self._depth = 1
+        with self._cond:
+            while [ident for ident in list(self._readers) if ident != me]:
+                self._cond.wait(0.01)
+
+    def release_write(self):
+        self._depth -= 1
+        if not self._depth:
+            self._writer = None
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire_write()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release_write()
+
+    def reading(self, func):
+        """Wrap `func' to be called as reader."""
+        # acquire_read() and release_read() inlined, it is the hot path
+        readers = self._readers
+
+        @functools.wraps(func)
+        def read(*args, **kwargs):
+            me = _get_ident()
+            depth = readers.get(me, 0)
+            readers[me] = depth + 1
+            if not depth and self._writer not in (None, me):
+                self._wait_for_writer(me)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if depth:
+                    readers[me] = depth
+                else:
+                    del readers[me]
+                    if self._writer is not None:
+                        self._notify_writer()
+        return read
+
+    def writing(self, func):
+        """Wrap `func' to be called as writer."""
+        acquire, release = self.acquire_write, self.release_write
+
+        @functools.wraps(func)
+        def write(*args, **kwargs):
+            acquire()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                release()
+        return write
+
+
+class _StdSectionProxy(MutableMapping):
+    """SectionProxy without per section converter getters.
+
+    The getters of the converters (getint, getlines, ...) are looked up on
+    access, creating a proxy only stores the parser and the section name.
+    The abstract base classes of Python 2 have no __slots__, the proxies
+    have a __dict__ there.
+    """
+
+    __slots__ = ("_parser", "_name")
+
+    def __init__(self, parser, name):
+        self._parser = parser
+        self._name = name
+
+    def __repr__(self):
+        return '<Section: {0}>'.format(self._name)
+
+    def __getitem__(self, key):
+        # one lookup instead of has_option() and get()
+        try:
+            return self._parser.get(self._name, key)
+        except (NoSectionError, NoOptionError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._parser._validate_value_types(option=key, value=value)
+        return self._parser.set(self._name, key, value)
+
+    def __delitem__(self, key):
+        if not (self._parser.has_option(self._name, key)
+                and self._parser.remove_option(self._name, key)):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self._parser.has_option(self._name, key)
+
+    def __len__(self):
+        return len(self._options())
+
+    def __iter__(self):
+        return self._options().__iter__()
+
+    def __getattr__(self, name):
+        if not name.startswith("get") or name[3:] not in self._parser.converters:
+            raise AttributeError(name)
+        return functools.partial(self.get, _impl=getattr(self._parser, name))
+
+    def _options(self):
+        if self._name != self._parser.default_section:
+            return self._parser.options(self._name)
+        else:
+            return self._parser.defaults()
+
+    @property
+    def parser(self):
+        return self._parser
+
+    @property
+    def name(self):
+        return self._name
+
+    def get(self, option, fallback=None, raw=False, vars=None, _impl=None,
+            **kwargs):
+        if not _impl:
+            _impl = self._parser.get
+        return _impl(self._name, option, raw=raw, vars=vars,
+                     fallback=fallback, **kwargs)
+
+
+SectionProxy.register(_StdSectionProxy)
+
+
+class _SectionProxies(dict):
+    """Section proxies of a StdConfigParser, created on first access.
+
+    ConfigParser.__getitem__ checks the section before the proxy is
+    looked up, removed sections may have no proxy.
+    """
+
+    __slots__ = ("_parser", )
+
+    def __init__(self, parser):
+        super(_SectionProxies, self).__init__()
+        self._parser = parser
+
+    def __missing__(self, key):
+        proxy = self[key] = _StdSectionProxy(self._parser, key)
+        return proxy
+
+    def __delitem__(self, key):
+        self.pop(key, None)
+
+
+class _EnvironOverlay(object):
+    """Environment variables overriding the options of a parser.
+
+    The variable PREFIX__SECTION__OPTION overrides `option' of `section',
+    other characters than letters, digits and '_' of the names are
+    replaced by '_' and the names are upper case. A variable is only looked
+    up for an option read, its name is built once per section and option
+    and the value is kept until refresh(), the size of the environment
+    does not matter.
+    """
+
+    _NAMECRE = re.compile(r"[^0-9A-Za-z_]")
+
+    def __init__(self, prefix, environ):
+        self.prefix = prefix
+        self.environ = environ
+        # (section, option) -> value or None
+        self._values = {}
+        # section -> prefix and name part of the variables
+        self._sections = {}
+
+    def get(self, section, option):
+        """Return the value of the variable for `option', or None."""
+        key = (section, option)
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        try:
+            head = self._sections[section]
+        except KeyError:
+            head = self._sections[section] = "%s__%s__" % (
+                self.prefix, self._NAMECRE.sub("_", section).upper())
+        value = self._values[key] = self.environ.get(
+            head + self._NAMECRE.sub("_", option).upper())
+        return value
+
+    def refresh(self):
+        self._values.clear()
+
+
+class _EnvironSection(Mapping):
+    """The options of one section in an _EnvironOverlay, for ChainMap."""
+
+    __slots__ = ("_overlay", "_section")
+
+    def __init__(self, overlay, section):
+        self._overlay = overlay
+        self._section = section
+
+    def __getitem__(self, key):
+        value = self._overlay.get(self._section, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        # only the options looked up so far
+        section = self._section
+        return iter([option for (name, option), value
+                     in list(self._overlay._values.items())
+                     if name == section and value is not None])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
+class _StdConverterMapping(ConverterMapping):
+    """Converters of StdConfigParser, only the parser gets the getters.
+
+    The section proxies look them up on access, see _StdSectionProxy.
+    """
+
+    def __init__(self, parser, converters):
+        self._parser = parser
+        self._data = dict(converters)
+
+    def __setitem__(self, key, value):
+        try:
+            k = 'get' + key
+        except TypeError:
+            raise ValueError('Incompatible key: {0} (type: {1})'
+                             ''.format(key, type(key)))
+        if k == 'get':
+            raise ValueError('Incompatible key: cannot use "" as a name')
+        self._data[key] = value
+        func = functools.partial(self._parser._get_conv, conv=value)
+        func.converter = value
+        setattr(self._parser, k, func)
+
+    def __delitem__(self, key):
+        k = 'get' + (key or None)
+        del self._data[key]
+        try:
+            delattr(self._parser, k)
+        except AttributeError:
+            pass
+
+
+class StdConfigParser(ConfigParser):
+
+    # Template for the single pass line tokenizer used by _read. One match
+    # classifies a line as comment, section header, option or other (a
+    # continuation line, a valueless option or an error, depending on the
+    # parser state) and provides the stripped text of the line.
+    _LINE_TMPL = r"""
+        (?P<indent>\s*)                    # leading whitespace
+        (?:
+        (?P<comment>{comment}).*           # full line comment
+        |
+        (?P<text>
+        {sect}(?:.*\S)?                    # section header
+        |
+        (?P<option>{name})                 # everything up to a delimiter
+        (?P<vi>{delim})                    # any of the allowed delimiters
+        (?:\s*(?=\S))?                      # space/tab before a value
+        (?P<value>(?:.*\S)?)               # everything up to trailing space
+        |
+        (?:.*\S)?                          # anything else
+        )
+        \s*$)
+        """
+    # Compiled tokenizer for the delimiters and comment prefixes used by
+    # StdConfigParser
+    LINECRE = re.compile(_LINE_TMPL.format(sect=ConfigParser._SECT_TMPL,
+                                           comment=r"\#", name=r"[^=:]*",
+                                           delim="=|:"),
+                         re.VERBOSE | re.UNICODE)
+    # Variant of LINECRE for the mmap mode, every match of it in the whole
+    # text of a file is one line, including the line break
+    _MAPPEDCRE = re.compile(
+        (r"(?!\Z)" + _LINE_TMPL.replace(r"\s", r"[^\S\n]") + r"\n?").format(
+            sect=ConfigParser._SECT_TMPL, comment=r"\#", name=r"[^=:\n]*",
+            delim="=|:"),
+        re.VERBOSE | re.MULTILINE | re.UNICODE)
+    # Methods called with the readers-writer lock in the threadsafe mode,
+    # the other methods use these
+    # the same reader converts a value and stores it in the cache, a writer
+    # clears the cache only before or after
+    _READ_METHODS = ("get", "items", "options", "has_option", "has_section",
+                     "sections", "sections_under", "sections_matching",
+                     "defaults", "resolve_all", "freeze", "share",
+                     "write", "write_file", "_get_conv", "_getstate")
+    _WRITE_METHODS = ("set", "remove_option", "remove_section", "add_section",
+                      "read", "read_file", "read_string", "read_dict",
+                      "read_dir", "_merge_files", "overlay_environ",
+                      "refresh_environ")
+    # Lines possibly holding a section header, used by the lazy mode to
+    # index sections without parsing their options
+    _HEADERCRE = re.compile(r"^([^\S\n]*)\[", re.MULTILINE | re.UNICODE)
+
+    def __init__(self, defaults=None, converters=None, interpolate=False,
+                 lazy=False, cache_size=0, cache_dir=None, mmap=False,
+                 threadsafe=False):
+        _converters = {"lines": _convert_lines,
+                       "listing": _convert_listing}
+        if converters:
+            _converters.update(converters)
+        interpolation = StdInterpolation() if interpolate else Interpolation()
+        # section -> lookup mapping for interpolation, see get()
+        self._lookups = {}
+        # converted values, see _get_conv()
+        self._converted = None
+        # readers-writer lock of the threadsafe mode
+        self._rwlock = None
+        # environment variables overriding options, see overlay_environ()
+        self._environ = None
+        if cache_size != 0:
+            self._converted = _ConverterCache(cache_size)
+        super(StdConfigParser, self).__init__(defaults=defaults,
+                                              dict_type=OrderedDict,
+                                              allow_no_value=False,
+                                              delimiters=('=', ':'),
+                                              comment_prefixes=('#', ),
+                                              inline_comment_prefixes=None,
+                                              strict=True,
+                                              empty_lines_in_values=True,
+                                              default_section=DEFAULTSECT,
+                                              interpolation=interpolation,
+                                              converters=_converters)
+        if (self._delimiters == ('=', ':')
+                and self._comment_prefixes == ('#', )):
+            self._linecre = self.LINECRE
+        else:
+            comment = "|".join(re.escape(p) for p in self._comment_prefixes)
+            delim = "|".join(re.escape(d) for d in self._delimiters)
+            self._linecre = re.compile(
+                self._LINE_TMPL.format(sect=self._SECT_TMPL,
+                                       comment=comment or "(?!)",
+                                       name="(?:(?!{0}).)*".format(delim),
+                                       delim=delim),
+                re.VERBOSE | re.UNICODE)
+        self._converters = _StdConverterMapping(self, self._converters)
+        self._proxies = _SectionProxies(self)
+        # the lazy mode changes the sections while reading
+        self._lazy = lazy and not threadsafe
+        if self._lazy:
+            self._sections = _LazySections(self)
+        else:
+            self._sections = _IndexedSections()
+        self._cache_dir = cache_dir
+        # (directory, pattern) -> {filename: (stamp, sections, error)}, the
+        # configuration before the first call and after the last rebuild
+        # without the changes made since, see read_dir()
+        self._dirs = OrderedDict()
+        self._dir_base = None
+        self._dir_state = None
+        if threadsafe:
+            self._rwlock = _RWLock()
+            for name in self._READ_METHODS:
+                setattr(self, name, self._rwlock.reading(getattr(self, name)))
+            for name in self._WRITE_METHODS:
+                setattr(self, name, self._rwlock.writing(getattr(self, name)))
+            # the getters of the converters are bound to _get_conv
+            for name, func in list(self._converters.items()):
+                if func is not None:
+                    self._converters[name] = func
+        self._mmap = mmap
+
+    def read(self, filenames, executor=None):
+        """Read and parse a filename or an iterable of filenames.
+
+        Same as ConfigParser.read() with UTF-8 encoding. With `executor', a
+        concurrent.futures.Executor, the files are parsed in parallel and
+        added in the given order, like reading them one after another.
+        """
+        mapped = self._mmap and not self._lazy
+        if self._cache_dir is None and not mapped and executor is None:
+            super(StdConfigParser, self).read(filenames, "utf-8")
+            return
+        if isinstance(filenames, (str, bytes, _PathLike)):
+            filenames = [filenames]
+        if executor is not None:
+            self._read_parallel(filenames, executor)
+            return
+        try:
+            for filename in filenames:
+                try:
+                    if self._cache_dir is not None:
+                        with open(filename, encoding="utf-8") as fp:
+                            self._read_cached(fp, filename)
+                    else:
+                        with open(filename, "rb") as fp:
+                            self._read_mapped(fp, filename)
+                except IOError:
+                    continue
+        finally:
+            self._clear_caches()
+
+    def aread(self, filenames, executor=None):
+        """Read and parse files without blocking the asyncio event loop.
+
+        Returns an awaitable with the same result as read(). The files are
+        opened and parsed concurrently by `executor', default the executor
+        of the running loop, and added in the given order in the loop.
+        """
+        loop = _get_running_loop()
+        if isinstance(filenames, (str, bytes, _PathLike)):
+            filenames = [filenames]
+        settings = self._settings()
+        gathered = asyncio.gather(
+            *[loop.run_in_executor(executor, _parse_file, type(self),
+                                   settings, filename)
+              for filename in filenames], return_exceptions=True)
+        result = asyncio.Future(loop=loop)
+
+        def merge(gathered):
+            if result.cancelled():
+                return
+            try:
+                self._merge_files(gathered.result())
+            except Exception as ex:
+                result.set_exception(ex)
+            else:
+                result.set_result(None)
+
+        def cancel(result):
+            if result.cancelled():
+                gathered.cancel()
+        gathered.add_done_callback(merge)
+        result.add_done_callback(cancel)
+        return result
+
+    def get(self, section, option, raw=False, vars=None, fallback=_UNSET):
+        """Get an option value for a given section.
+
+        Same as ConfigParser.get(). Without `vars' the option is looked up
+        directly in the section and the defaults, nothing is allocated.
+        """
+        if vars:
+            return super(StdConfigParser, self).get(section, option, raw=raw,
+                                                    vars=vars,
+                                                    fallback=fallback)
+        try:
+            sectiondict = self._sections[section]
+        except KeyError:
+            if section != self.default_section:
+                if fallback is _UNSET:
+                    raise NoSectionError(section)
+                return fallback
+            sectiondict = self._defaults
+        option = self.optionxform(option)
+        try:
+            if self._environ is None:
+                try:
+                    value = sectiondict[option]
+                except KeyError:
+                    value = self._defaults[option]
+            else:
+                value = self._lookup(section, sectiondict)[option]
+        except KeyError:
+            if fallback is _UNSET:
+                raise NoOptionError(option, section)
+            return fallback
+        if raw or value is None:
+            return value
+        try:
+            lookup = self._lookups[section]
+        except KeyError:
+            lookup = self._lookup(section, sectiondict)
+        return self._interpolation.before_get(self, section, option, value,
+                                              lookup)
+
+    def _lookup(self, section, sectiondict):
+        """Return the cached lookup mapping of `section', see get()."""
+        try:
+            return self._lookups[section]
+        except KeyError:
+            pass
+        # same lookup order as _unify_values() without vars
+        if self._environ is None:
+            lookup = ChainMap({}, sectiondict, self._defaults)
+        else:
+            lookup = ChainMap({}, _EnvironSection(self._environ, section),
+                              sectiondict,
+                              _EnvironSection(self._environ,
+                                              self.default_section),
+                              self._defaults)
+        self._lookups[section] = lookup
+        return lookup
+
+    def _raw_options(self, section):
+        """Return the raw values of `section' merged with the defaults.
+
+        Used by resolve_all() and freeze(), the values of overlay_environ()
+        replace the values of the configuration like in get().
+        """
+        options = self._dict(self._defaults)
+        if section == self.default_section:
+            sectiondict = self._defaults
+        else:
+            sectiondict = self._sections[section]
+            options.update(sectiondict)
+        if self._environ is not None:
+            lookup = self._lookup(section, sectiondict)
+            for option in list(options):
+                options[option] = lookup[option]
+        return options
+
+    def items(self, section=_UNSET, raw=False, vars=None):
+        """Return the (name, value) pairs of `section', or of all sections.
+
+        Same as ConfigParser.items(), with the values of overlay_environ().
+        """
+        if section is _UNSET:
+            return super(StdConfigParser, self).items()
+        if self._environ is None:
+            return super(StdConfigParser, self).items(section, raw=raw,
+                                                      vars=vars)
+        options = self._defaults.copy()
+        if section != self.default_section:
+            try:
+                options.update(self._sections[section])
+            except KeyError:
+                raise NoSectionError(section)
+        if vars:
+            for key in vars:
+                options[self.optionxform(key)] = None
+        return [(option, self.get(section, option, raw=raw, vars=vars))
+                for option in options]
+
+    def _unify_values(self, section, vars):
+        lookup = super(StdConfigParser, self)._unify_values(section, vars)
+        if self._environ is None:
+            return lookup
+        vardict, sectiondict, defaults = lookup.maps
+        return ChainMap(vardict, _EnvironSection(self._environ, section),
+                        sectiondict,
+                        _EnvironSection(self._environ, self.default_section),
+                        defaults)
+
+    def overlay_environ(self, prefix, environ=None):
+        """Let environment variables override the options.
+
+        The variable `prefix'__SECTION__OPTION overrides `option' of
+        `section', the names are upper case with other characters than
+        letters, digits and '_' replaced by '_', e.g. APP__SERVICE_DB__PORT
+        for the option port of the section service:db. A variable with
+        DEFAULT as section overrides a default. All methods reading values
+        use the variables, also resolve_all() and freeze(), but the values
+        are not copied into the sections and not written by write().
+        `environ' is os.environ by default, a prefix of None removes the
+        overlay.
+        """
+        if prefix is None:
+            self._environ = None
+        else:
+            self._environ = _EnvironOverlay(
+                prefix, os.environ if environ is None else environ)
+        self._clear_caches()
+
+    def refresh_environ(self):
+        """Look up the environment variables of overlay_environ() again."""
+        if self._environ is not None:
+            self._environ.refresh()
+        self._clear_caches()
+
+    def sections_under(self, prefix):
+        """Return the sections below `prefix' in the hierarchy of names.
+
+        Section names are split into segments at ':', e.g. the sections
+        under "service:db" are "service:db:primary" and
+        "service:db:primary:eu", but neither "service:db" nor
+        "service:dbx". The sections are returned depth first, siblings in
+        the order they were added. The names are looked up in an index kept
+        up to date with the sections, the time depends on the number of
+        sections found, not on all sections.
+        """
+        return self._sections.name_index().under(prefix)
+
+    def sections_matching(self, pattern):
+        """Return the sections matching the glob `pattern'.
+
+        The wildcards of fnmatch match within a segment of the name, e.g.
+        "service:*:primary" matches "service:db:primary", but "service:*"
+        does not match it. Matching is case-sensitive, see sections_under().
+        """
+        return self._sections.name_index().match(pattern)
+
+    def read_dir(self, path, pattern="*.ini"):
+        """Read the files in the directory `path' matching `pattern'.
+
+        The files are read in sorted order, like read() of the sorted list.
+        Modification time, size and inode of every file are remembered, if
+        called again only new and changed files are parsed. If any file
+        changed, was added or removed, the configuration is rebuilt from
+        the configuration before the first call of read_dir(), the files of
+        all directories read and, on top of them, the changes made with the
+        other methods since. Returns True if the configuration changed.
+        """
+        if self._dir_base is None:
+            self._dir_base = self._dir_state = self._dir_snapshot()
+        key = (os.path.abspath(path), pattern)
+        old = self._dirs.get(key)
+        changed = old is None
+        old = old or {}
+        files = OrderedDict()
+        for name in sorted(fnmatch.filter(os.listdir(path), pattern)):
+            filename = os.path.join(path, name)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                continue
+            if not S_ISREG(st.st_mode):
+                continue
+            stamp = (getattr(st, "st_mtime_ns", st.st_mtime), st.st_size,
+                     st.st_ino)
+            entry = old.get(filename)
+            if entry is None or entry[0] != stamp:
+                try:
+                    parsed, e = self._parse_file(filename)
+                except IOError:
+                    continue
+                # files with errors are parsed again on the next call
+                entry = (stamp if e is None else None, parsed, e)
+                changed = True
+            files[filename] = entry
+        changed = changed or list(files) != list(old)
+        self._dirs[key] = files
+        if changed:
+            self._rebuild_dirs()
+        return changed
+
+    def _rebuild_dirs(self):
+        """Set the configuration to the base and the files of read_dir().
+
+        The changes made since the last rebuild are kept, they are applied
+        again on top of the files.
+        """
+        removed, changed = self._dir_changes()
+        defaults, sections = self._dir_base
+        error = None
+        try:
+            self._defaults.clear()
+            self._defaults.update(defaults)
+            for section in self.sections():
+                del self._sections[section]
+                del self._proxies[section]
+            for section, options in sections:
+                self._sections[section] = self._dict(options)
+            for files in self._dirs.values():
+                for _, parsed, e in files.values():
+                    self._merge(parsed)
+                    if e:
+                        # raised after the changes are applied again
+                        error = e
+                        break
+                if error:
+                    break
+            self._dir_state = self._dir_snapshot()
+            for section in removed:
+                if section in self._sections:
+                    del self._sections[section]
+                    del self._proxies[section]
+            for section, options, dropped in changed:
+                if section == self.default_section:
+                    target = self._defaults
+                elif section in self._sections:
+                    target = self._sections[section]
+                else:
+                    target = self._sections[section] = self._dict()
+                target.update(options)
+                for option in dropped:
+                    target.pop(option, None)
+        finally:
+            self._clear_caches()
+        if error:
+            raise error
+
+    def _dir_snapshot(self):
+        """Return a copy of the defaults and the sections for read_dir()."""
+        return (self._dict(self._defaults),
+                [(section, self._dict(self._sections[section]))
+                 for section in self.sections()])
+
+    def _dir_changes(self):
+        """Return the changes made since the last rebuild of read_dir().
+
+        Returns the removed sections and (section, changed options,
+        removed options) tuples, the defaults as default_section.
+        """
+        defaults, sections = self._dir_state
+        sections = dict(sections)
+        removed = [section for section in sections
+                   if section not in self._sections]
+        changed = []
+        current = [(self.default_section, self._defaults, defaults)]
+        current.extend((section, self._sections[section],
+                        sections.get(section)) for section in self.sections())
+        for section, options, old in current:
+            if old is None:
+                changed.append((section, self._dict(options), []))
+                continue
+            values = self._dict((option, value)
+                                for option, value in options.items()
+                                if option not in old or old[option] != value)
+            dropped = [option for option in old if option not in options]
+            if values or dropped:
+                changed.append((section, values, dropped))
+        return removed, changed
+
+    def write(self, fp, space_around_delimiters=True):
+        """Write an .ini-format representation of the configuration state.
+
+        Same as ConfigParser.write(), but the text is built in chunks and
+        written with one call per chunk.
+        """
+        for chunk in self._write_chunks(space_around_delimiters):
+            fp.write(chunk)
+
+    def write_file(self, filename, space_around_delimiters=True, fsync=True):
+        """Write the configuration to `filename', replacing it atomically.
+
+        The text is written UTF-8 encoded to a temporary file in the same
+        directory, which replaces `filename' when complete. Readers see the
+        old or the new file, never a partially written one. With `fsync' the
+        file and the directory are flushed to disk before returning.
+        """
+        _write_atomic(filename, (chunk.encode("utf-8") for chunk in
+                                 self._write_chunks(space_around_delimiters)),
+                      fsync)
+
+    def _write_chunks(self, space_around_delimiters, lines_per_chunk=8192):
+        """Generate the text of write() in chunks of `lines_per_chunk'."""
+        delimiter = self._delimiters[0]
+        if space_around_delimiters:
+            delimiter = " {0} ".format(delimiter)
+        before_write = self._interpolation.before_write
+        if type(self._interpolation).before_write is Interpolation.before_write:
+            before_write = None
+        sections = [(section, self._sections[section])
+                    for section in self._sections]
+        if self._defaults:
+            sections.insert(0, (self.default_section, self._defaults))
+        lines = []
+        for section, options in sections:
+            lines.append("[{0}]\n".format(section))
+            for key, value in options.items():
+                if before_write is not None:
+                    value = before_write(self, section, key, value)
+                if value is not None or not self._allow_no_value:
+                    if "\n" in value:
+                        value = value.replace("\n", "\n\t")
+                    lines.append(key + delimiter + value + "\n")
+                else:
+                    lines.append(key + "\n")
+            lines.append("\n")
+            if len(lines) >= lines_per_chunk:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+    def __getstate__(self):
+        """Return the settings, defaults and sections to pickle.
+
+        Proxies, converter getters, caches and locks are not pickled, they
+        are created again by __setstate__(). Pending sections of the lazy
+        mode stay unparsed. An overlay of os.environ uses the environment
+        of the unpickling process, other mappings are pickled.
+        """
+        # _getstate is wrapped as reader in the threadsafe mode
+        return self._getstate()
+
+    def _getstate(self):
+        converters = dict((name, func)
+                          for name, func in self._converters.items()
+                          if func is not None
+                          and name not in ("int", "float", "boolean"))
+        if self._converted is None:
+            cache_size = 0
+        else:
+            cache_size = self._converted._size
+        state = {"settings": (converters,
+                              isinstance(self._interpolation,
+                                         StdInterpolation),
+                              self._lazy, cache_size, self._cache_dir,
+                              self._mmap, self._rwlock is not None),
+                 "defaults": list(self._defaults.items())}
+        # equal option names as one object, pickled once, and without
+        # parsing the pending sections of the lazy mode
+        names = {}
+        sections = self._sections
+        state["sections"] = [
+            (name, [(names.setdefault(option, option), value)
+                    for option, value in dict.__getitem__(sections,
+                                                          name).items()])
+            for name in sections]
+        if self._lazy and sections._pending:
+            state["pending"] = sections._pending
+        if "optionxform" in vars(self):
+            state["optionxform"] = self.optionxform
+        if self._dirs:
+            state["dirs"] = (self._dirs, self._dir_base, self._dir_state)
+        if self._environ is not None:
+            # os.environ of the unpickling process, other mappings pickled
+            environ = self._environ.environ
+            state["environ"] = (self._environ.prefix,
+                                None if environ is os.environ else environ)
+        return state
+
+    def __setstate__(self, state):
+        (converters, interpolate, lazy, cache_size, cache_dir, mmap,
+         threadsafe) = state["settings"]
+        StdConfigParser.__init__(self, converters=converters,
+                                 interpolate=interpolate, lazy=lazy,
+                                 cache_size=cache_size, cache_dir=cache_dir,
+                                 mmap=mmap, threadsafe=threadsafe)
+        if "optionxform" in state:
+            self.optionxform = state["optionxform"]
+        self._defaults.update(state["defaults"])
+        for name, options in state["sections"]:
+            self._sections[name] = self._dict(options)
+        if "pending" in state:
+            self._sections._pending = state["pending"]
+        if "dirs" in state:
+            self._dirs, self._dir_base, self._dir_state = state["dirs"]
+        if "environ" in state:
+            self.overlay_environ(*state["environ"])
+
+    def writelock(self):
+        """Context manager holding the writer lock in the threadsafe mode.
+
+        Readers of other threads wait until the block is left, use it to
+        change several values at once. Does nothing if not threadsafe.
+        """
+        if self._rwlock is None:
+            return _NOLOCK
+        return self._rwlock
+
+    def __iter__(self):
+        if self._rwlock is None:
+            return super(StdConfigParser, self).__iter__()
+        # the sections may change while iterating
+        return iter([self.default_section] + self.sections())
+
+    def add_section(self, section):
+        """Create a new section in the configuration.
+
+        Same as ConfigParser.add_section(), the section proxy is created on
+        first access.
+        """
+        self._validate_value_types(section=section)
+        if section == self.default_section:
+            raise ValueError('Invalid section name: %r' % section)
+        if section in self._sections:
+            raise DuplicateSectionError(section)
+        self._sections[section] = self._dict()
+
+    def set(self, section, option, value=None):
+        super(StdConfigParser, self).set(section, option, value)
+        self._clear_caches()
+
+    def remove_option(self, section, option):
+        existed = super(StdConfigParser, self).remove_option(section, option)
+        self._clear_caches()
+        return existed
+
+    def remove_section(self, section):
+        existed = super(StdConfigParser, self).remove_section(section)
+        self._clear_caches()
+        return existed
+
+    def __setitem__(self, key, value):
+        # clears the section and reads `value', both as one writer
+        with self.writelock():
+            try:
+                super(StdConfigParser, self).__setitem__(key, value)
+            finally:
+                self._clear_caches()
+
+    def __delitem__(self, key):
+        with self.writelock():
+            super(StdConfigParser, self).__delitem__(key)
+
+    def resolve_all(self):
+        """Return the values of all sections, interpolated in a single pass.
+
+        The result is a dictionary of section names, without the default
+        section, with dictionaries like items() of the section. All errors
+        are reported together by raising a ResolveError. Without
+        interpolation the raw values are returned.
+        """
+        if isinstance(self._interpolation, StdInterpolation):
+            return self._interpolation.resolve_all(self)
+        resolved = OrderedDict()
+        for section in self.sections():
+            resolved[section] = OrderedDict(self.items(section, raw=True))
+        return resolved
+
+    def freeze(self):
+        """Return a read-only FrozenConfig snapshot of the configuration.
+
+        All values are interpolated at once, errors are raised as
+        ResolveError. Later changes of the parser do not change the snapshot.
+        """
+        return FrozenConfig(self)
+
+    def share(self, name=None):
+        """Return a SharedConfig snapshot in a new shared memory segment.
+
+        Like freeze(), but the snapshot is stored in a shared memory segment
+        named `name', default a random name. Forked processes use the
+        returned SharedConfig, other processes SharedConfig.attach(name).
+        The segment is removed with unlink(). Needs Python 3.8 or later.
+        """
+        _require_shared_memory()
+        frozen = FrozenConfig(self)
+        data = _pack_shared(frozen)
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=len(data))
+        shm.buf[:len(data)] = data
+        converters = dict(frozen._converters)
+        del converters["boolean"]   # bound to frozen
+        config = SharedConfig(shm.buf, converters, frozen.optionxform,
+                              _shm=shm)
+        config._boolean_states = frozen._boolean_states
+        return config
+
+    def _clear_caches(self):
+        """Drop cached results, needed after every change of the values.
+
+        Changes made directly to the dictionary returned by defaults() are
+        not detected.
+        """
+        self._lookups.clear()
+        if self._converted is not None:
+            self._converted.clear()
+        if isinstance(self._interpolation, StdInterpolation):
+            self._interpolation.clear_cache()
+
+    def _read(self, fp, fpname):
+        """Parse a sectioned configuration file.
+
+        Same grammar and errors as the configparser implementation, but
+        every line is classified with one match of the compiled line
+        tokenizer instead of separate comment, section and option checks.
+        """
+        try:
+            if self._inline_comment_prefixes:
+                # not supported by the tokenizer
+                super(StdConfigParser, self)._read(fp, fpname)
+            elif self._lazy:
+                self._read_lazy(fp, fpname)
+            else:
+                self._read_lines(enumerate(fp, start=1), fpname)
+        finally:
+            self._clear_caches()
+
+    def _read_lines(self, lines, fpname):
+        """Parse `lines', an iterable of (lineno, line) pairs.
+
+        Returns the sections read, see _parse_lines.
+        """
+        parsed = []
+        try:
+            e = self._parse_lines(lines, fpname, parsed)
+        finally:
+            self._merge(parsed)
+        # if any parsing errors occurred, raise an exception
+        if e:
+            raise e
+        return parsed
+
+    def _parse_lines(self, lines, fpname, parsed, tokenize=_UNSET):
+        """Parse `lines', an iterable of (lineno, line) pairs.
+
+        The parser is not changed. `tokenize' is passed to _iterevents, by
+        default the lines are tokenized by _linecre. Every section found is appended to
+        `parsed' as (name, lineno, options, linenos) tuple. `options' maps
+        the option names to the values, `linenos' to their line numbers.
+        Returns a ParsingError for invalid lines, otherwise None.
+        """
+        optionxform = self.optionxform
+        strict = self._strict
+        elements_added = set()
+        cursect = None                        # None, or a dictionary
+        linenos = None
+        sectname = None
+        optname = None
+        e = None                              # None, or an exception
+        try:
+            if tokenize is _UNSET:
+                tokenize = self._linecre.match
+            for event, lineno, name, value in _iterevents(
+                    lines, fpname, tokenize, self._empty_lines_in_values,
+                    self._allow_no_value):
+                if event == "continuation":
+                    cursect[optname].append(value)
+                elif event == "option":
+                    optname = optionxform(name)
+                    if strict and (sectname, optname) in elements_added:
+                        raise DuplicateOptionError(sectname, optname,
+                                                   fpname, lineno)
+                    elements_added.add((sectname, optname))
+                    cursect[optname] = [value] if value is not None else None
+                    linenos[optname] = lineno
+                elif event == "section":
+                    sectname = name
+                    if sectname != self.default_section:
+                        if strict and sectname in elements_added:
+                            raise DuplicateSectionError(sectname, fpname,
+                                                        lineno)
+                        elements_added.add(sectname)
+                    cursect = self._dict()
+                    linenos = {}
+                    parsed.append((sectname, lineno, cursect, linenos))
+                elif event == "error":
+                    # a non-fatal parsing error, raised at the end of the file
+                    e = self._handle_error(e, fpname, lineno, value)
+        finally:
+            for _, _, options, _ in parsed:
+                for name, val in options.items():
+                    if isinstance(val, list):
+                        options[name] = '\n'.join(val).rstrip()
+        return e
+
+    def _merge(self, parsed):
+        """Add the sections returned by _parse_lines to the configuration."""
+        before_read = self._interpolation.before_read
+        for sectname, _, options, _ in parsed:
+            if sectname == self.default_section:
+                cursect = self._defaults
+            elif sectname in self._sections:
+                cursect = self._sections[sectname]
+            else:
+                cursect = self._dict()
+                self._sections[sectname] = cursect
+            for name, val in options.items():
+                cursect[name] = before_read(self, sectname, name, val)
+
+    def _read_parallel(self, filenames, executor):
+        """Parse `filenames' with `executor', see read()."""
+        settings = self._settings()
+        futures = [executor.submit(_parse_file, type(self), settings,
+                                   filename)
+                   for filename in filenames]
+        try:
+            self._merge_files(future.exception() or future.result()
+                              for future in futures)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _settings(self):
+        """Return the attributes used by _parse_file() as dictionary."""
+        # the parser is changed while the other files are parsed, and it
+        # is expensive to send to other processes
+        settings = dict((name, getattr(self, name))
+                        for name in ("_linecre", "_strict",
+                                     "_empty_lines_in_values",
+                                     "_allow_no_value", "default_section",
+                                     "_dict"))
+        if "optionxform" in vars(self):
+            settings["optionxform"] = self.optionxform
+        return settings
+
+    def _merge_files(self, results):
+        """Add the results of _parse_file() in order, like read().
+
+        A result is a tuple of _parse_file() or the exception raised by it.
+        """
+        try:
+            for result in results:
+                if isinstance(result, IOError):
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                parsed, e = result
+                self._merge(parsed)
+                if e:
+                    raise e
+        finally:
+            self._clear_caches()
+
+    def _parse_file(self, filename):
+        """Parse the file `filename' without changing the parser.
+
+        Returns the sections read, see _parse_lines, and None or the error
+        to raise after adding them. The executor of read() calls it on an
+        empty parser with only the settings used by _parse_lines, see the
+        module function _parse_file().
+        """
+        parsed = []
+        with open(filename, encoding="utf-8") as fp:
+            try:
+                e = self._parse_lines(enumerate(fp, start=1), filename, parsed)
+            except Exception as ex:
+                # raised after adding the sections read before, like read()
+                e = ex
+        return parsed, e
+
+    def _read_cached(self, fp, fpname):
+        """Read a configuration file using the compiled file in cache_dir.
+
+        Like a .pyc file the compiled file is only used if path, size and
+        modification time of the configuration file and the parser settings
+        match, otherwise the file is parsed and the compiled file written.
+        Files with errors are never cached.
+        """
+        stat = os.fstat(fp.fileno())
+        path = os.path.abspath(fpname)
+        key = (_CACHE_MAGIC, path, getattr(stat, "st_mtime_ns", stat.st_mtime),
+               stat.st_size, self._delimiters, self._comment_prefixes,
+               self._strict, self._empty_lines_in_values,
+               self._allow_no_value, self.default_section,
+               self.optionxform("Option_Name"))
+        name = hashlib.sha1(repr(path).encode("utf-8")).hexdigest()
+        cachefile = os.path.join(self._cache_dir, name + ".cfgc")
+        try:
+            with open(cachefile, "rb") as cache:
+                cached_key, sections = marshal.loads(cache.read())
+        except (IOError, EOFError, ValueError, TypeError):
+            cached_key = None
+        if cached_key == key:
+            self._merge([(sectname, lineno, self._dict(options), dict(linenos))
+                         for sectname, lineno, options, linenos in sections])
+            return
+        parsed = self._read_lines(enumerate(fp, start=1), fpname)
+        data = marshal.dumps((key, [(sectname, lineno, list(options.items()),
+                                     list(linenos.items()))
+                                    for sectname, lineno, options, linenos
+                                    in parsed]))
+        tmpfile = "%s.%d.tmp" % (cachefile, os.getpid())
+        try:
+            if not os.path.isdir(self._cache_dir):
+                os.makedirs(self._cache_dir)
+            with open(tmpfile, "wb") as cache:
+                cache.write(data)
+            _replace(tmpfile, cachefile)
+        except (IOError, OSError):
+            # like .pyc files, the cache is optional
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+
+    def _read_mapped(self, fp, fpname):
+        """Read the file `fp', opened in binary mode, with mmap.
+
+        The mapped file is decoded at once and tokenized as a whole, no
+        line objects are created. Falls back to reading the lines of the
+        text if mmap fails or for other delimiters and comment prefixes.
+        """
+        try:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            # empty files and some special files can not be mapped
+            data = None
+        if (data is None or self._linecre is not self.LINECRE
+                or self._inline_comment_prefixes):
+            if data is not None:
+                data.close()
+            text = TextIOWrapper(fp, encoding="utf-8")
+            self._read_lines(enumerate(text, start=1), fpname)
+            return
+        try:
+            text = codecs.utf_8_decode(data, "strict", True)[0]
+        finally:
+            data.close()
+        if "\r" in text:
+            # universal newlines, like reading a file in text mode
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        parsed = []
+        try:
+            e = self._parse_lines(enumerate(self._MAPPEDCRE.finditer(text),
+                                            start=1),
+                                  fpname, parsed, tokenize=None)
+        finally:
+            self._merge(parsed)
+        if e:
+            raise e
+
+    def _read_lazy(self, fp, fpname):
+        """Index the sections of a configuration file.
+
+        Only the positions of the section headers are searched. The options
+        of a section are parsed on first access of the section, so parsing
+        errors in a section body are raised at that point. The lines before
+        the first section and the DEFAULT section are parsed immediately.
+        """
+        text = "".join(fp)
+        tokenize = self._linecre.match
+        headers = []                          # (name, lineno, offset)
+        lineno = 1
+        pos = 0
+        # parser state to tell indented headers from continuation lines
+        scanned = 0
+        in_option = False
+        indent_level = 0
+        for mo in self._HEADERCRE.finditer(text):
+            start = mo.start()
+            lineno += text.count("\n", pos, start)
+            pos = start
+            end = text.find("\n", start) + 1 or len(text)
+            header = tokenize(text, start, end).group("header")
+            if header is None:
+                continue
+            indent = len(mo.group(1))
+            if indent:
+                for line in text[scanned:start].split("\n"):
+                    (cur_indent, _, value, sect,
+                     option, _, _) = tokenize(line).groups()
+                    if not value:
+                        if not self._empty_lines_in_values:
+                            indent_level = sys.maxsize
+                        continue
+                    if in_option and len(cur_indent) > indent_level:
+                        continue
+                    indent_level = len(cur_indent)
+                    if sect is not None:
+                        in_option = False
+                    elif option is not None:
+                        in_option = bool(option.rstrip())
+                    elif self._allow_no_value:
+                        in_option = True
+                scanned = start
+                if in_option and indent > indent_level:
+                    # continuation line of a value
+                    continue
+            headers.append((header, lineno, start))
+            scanned = end
+            in_option = False
+            indent_level = indent
+        first = headers[0][2] if headers else len(text)
+        # fails for options without a section header
+        self._read_lines(enumerate(StringIO(text[:first]), start=1), fpname)
+        defaults = []
+        elements_added = set()
+        ends = [start for _, _, start in headers[1:]] + [len(text)]
+        for (sectname, lineno, start), end in zip(headers, ends):
+            if sectname == self.default_section:
+                defaults.append(enumerate(StringIO(text[start:end]),
+                                          start=lineno))
+                continue
+            if self._strict and sectname in elements_added:
+                raise DuplicateSectionError(sectname, fpname, lineno)
+            elements_added.add(sectname)
+            if sectname not in self._sections:
+                self._sections[sectname] = self._dict()
+            self._sections.add_chunk(sectname,
+                                     (text, start, end, lineno, fpname))
+        if defaults:
+            self._read_lines(itertools.chain(*defaults), fpname)
+
+    def _read_chunks(self, chunks):
+        """Parse the sections indexed by _read_lazy."""
+        for text, start, end, lineno, fpname in chunks:
+            self._read_lines(enumerate(StringIO(text[start:end]),
+                                       start=lineno), fpname)
+
+    # Needed for improved error messages if a converter fails
+    def _get_conv(self, section, option, conv, raw=False, vars=None,
+                  fallback=_UNSET, **kwargs):
+        cache = None if vars else self._converted
+        if cache is not None:
+            key = (section, self.optionxform(option), conv, raw)
+            try:
+                return cache.get(key)
+            except KeyError:
+                pass
+        try:
+            try:
+                value = self.get(section, option, raw=raw, vars=vars, **kwargs)
+            except (NoSectionError, NoOptionError):
+                if fallback is _UNSET:
+                    raise
+                return fallback
+            value = conv(value)
+        except Exception as ex:
+            _annotate_conv_error(ex, section, option, conv)
+            raise
+        if cache is not None:
+            # cached values are shared, lists are returned as tuples
+            if isinstance(value, list):
+                value = tuple(value)
+            cache.set(key, value)
+        return value
+
+
+def _parse_file(cls, settings, filename):
+    """Parse `filename' with a parser of class `cls' with `settings'.
+
+    Module function for the executor of StdConfigParser.read(), process
+    pools pickle only the class, the settings and the filename.
+    """
+    parser = cls.__new__(cls)
+    vars(parser).update(settings)
+    return parser._parse_file(filename)
+
+
+def _stamp(filename):
+    """Modification time, size and inode of a file, None if it is missing."""
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return (getattr(st, "st_mtime_ns", st.st_mtime), st.st_size, st.st_ino)
+
+
+class _Inotify(object):
+    """Minimal ctypes binding of the Linux inotify API.
+
+    Watches the directories of files, so files replaced by a rename are
+    noticed too. Raises OSError or AttributeError if not available.
+    """
+
+    # IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+    # IN_DELETE
+    MASK = 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+    IN_CLOEXEC = 0o2000000
+
+    def __init__(self, filenames):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        dirnames = set(os.path.dirname(os.path.abspath(filename))
+                       for filename in filenames)
+        for dirname in dirnames:
+            if not isinstance(dirname, bytes):
+                dirname = dirname.encode(sys.getfilesystemencoding())
+            if libc.inotify_add_watch(self.fd, dirname, self.MASK) < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout, interrupt):
+        """Wait up to `timeout' seconds for events, or until the file
+        descriptor `interrupt' is readable. True if there were events.
+        """
+        if self.fd in select.select([self.fd, interrupt], [], [], timeout)[0]:
+            os.read(self.fd, 65536)
+            return True
+        return False
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ReloadableConfig(object):
+    """Configuration read from files, reloaded if they change.
+
+    `parser' is the current parser, created by `factory' and read from
+    `filenames'. A reload reads into a new parser and publishes it with one
+    assignment to `parser', readers never see a partially read
+    configuration. A reader should use the same parser for a unit of work,
+    e.g. ``parser = config.parser``. With `freeze' FrozenConfig snapshots
+    are published instead of the parsers.
+    """
+
+    def __init__(self, filenames, factory=StdConfigParser, freeze=False,
+                 interval=1.0):
+        if isinstance(filenames, (str, bytes, _PathLike)):
+            filenames = [filenames]
+        self.parser = None
+        self.filenames = list(filenames)
+        self.interval = interval
+        # last error of a reload in the background, None after a reload
+        self.error = None
+        self._factory = factory
+        self._freeze = freeze
+        self._stamps = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._interrupt = None                # pipe to wake up the thread
+        self.reload()
+
+    def __getitem__(self, key):
+        return self.parser[key]
+
+    def __getattr__(self, name):
+        # get(), getint(), sections(), ... of the current parser
+        return getattr(self.parser, name)
+
+    def reload(self):
+        """Read the files into a new parser and publish it.
+
+        Errors are raised and the current parser is kept, until the files
+        change again check() does not try again.
+        """
+        with self._lock:
+            self._stamps = [_stamp(filename) for filename in self.filenames]
+            parser = self._factory()
+            parser.read(self.filenames)
+            if self._freeze:
+                parser = parser.freeze()
+            self.parser = parser
+            self.error = None
+
+    def check(self):
+        """Reload if a file changed, was created or removed.
+
+        Returns True if the configuration was reloaded.
+        """
+        stamps = [_stamp(filename) for filename in self.filenames]
+        if stamps == self._stamps:
+            return False
+        self.reload()
+        return True
+
+    def areload(self, executor=None):
+        """reload() without blocking the asyncio event loop.
+
+        Returns an awaitable, the files are read by `executor', default the
+        executor of the running loop.
+        """
+        return _get_running_loop().run_in_executor(executor, self.reload)
+
+    def acheck(self, executor=None):
+        """check() without blocking the asyncio event loop, see areload()."""
+        return _get_running_loop().run_in_executor(executor, self.check)
+
+    def start(self):
+        """Watch the files in a daemon thread.
+
+        On Linux inotify notices changes at once, otherwise the files are
+        checked every `interval' seconds. Errors of reloads are stored in
+        `error'.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._interrupt = os.pipe()
+        self._thread = threading.Thread(target=self._watch,
+                                        name="ReloadableConfig")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        os.write(self._interrupt[1], b"x")
+        self._thread.join()
+        self._thread = None
+        for fd in self._interrupt:
+            os.close(fd)
+        self._interrupt = None
+
+    def _watch(self):
+        try:
+            inotify = _Inotify(self.filenames)
+        except (OSError, AttributeError):
+            inotify = None
+        try:
+            while not self._stop.is_set():
+                if inotify is None:
+                    self._stop.wait(self.interval)
+                else:
+                    inotify.wait(self.interval, self._interrupt[0])
+                if self._stop.is_set():
+                    break
+                try:
+                    self.check()
+                except Exception as ex:
+                    self.error = ex
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+class ConfigDocument(object):
+    """Configuration file kept line by line, edited without losing comments.
+
+    The values are read into `parser', a new StdConfigParser by default, its
+    reading methods (get, getint, sections, ...) are available on the
+    document. set(), remove_option(), add_section() and remove_section()
+    change the parser and replace only the lines of the option or section,
+    all other lines, comments and indentation are kept. save() writes the
+    file from the first changed line on.
+    """
+
+    def __init__(self, parser=None):
+        self.parser = StdConfigParser() if parser is None else parser
+        self.filename = None
+        self._lines = []
+        # section -> [first line, end line, {option: [first line, end line]}]
+        self._index = OrderedDict()
+        self._dirty = None                # first changed line
+        self._stamp = None                # of filename, read or saved
+        self._newline = "\n"
+
+    def __getattr__(self, name):
+        # get(), getint(), sections(), ... of the parser, changes are made
+        # by the methods of the document
+        if (name.startswith("_") or name == "parser"
+                or name in StdConfigParser._WRITE_METHODS):
+            raise AttributeError(name)
+        return getattr(self.parser, name)
+
+    def read(self, filename):
+        """Read the document from `filename', UTF-8 encoded."""
+        with open(filename, encoding="utf-8", newline="") as fp:
+            lines = fp.readlines()
+        self._load(lines, filename)
+        self.filename = filename
+        self._stamp = _stamp(filename)
+
+    def read_string(self, string, source="<string>"):
+        """Read the document from a string."""
+        self._load(StringIO(string).readlines(), source)
+
+    def write(self, fp):
+        """Write the lines of the document to the file object `fp'."""
+        fp.write("".join(self._lines))
+
+    def save(self, filename=None, fsync=True):
+        """Write the document to `filename', default the file read.
+
+        If `filename' is the file read and it was not changed since reading
+        or the last save, the text from the first changed line on is written
+        into the file. Otherwise the file is replaced atomically. With
+        `fsync' the data is flushed to disk before returning.
+        """
+        if filename is None:
+            filename = self.filename
+        if filename is None:
+            raise ValueError("No filename to save the document")
+        if filename == self.filename and _stamp(filename) == self._stamp:
+            if self._dirty is not None:
+                offset = sum(len(line.encode("utf-8"))
+                             for line in self._lines[:self._dirty])
+                with open(filename, "r+b") as fp:
+                    fp.seek(offset)
+                    fp.write("".join(self._lines[self._dirty:]).encode("utf-8"))
+                    fp.truncate()
+                    if fsync:
+                        fp.flush()
+                        os.fsync(fp.fileno())
+        else:
+            _write_atomic(filename, ["".join(self._lines).encode("utf-8")],
+                          fsync)
+        self.filename = filename
+        self._stamp = _stamp(filename)
+        self._dirty = None
+
+    def set(self, section, option, value):
+        """Set an option, only the lines of the option are changed."""
+        parser = self.parser
+        parser.set(section, option, value)
+        section = section or parser.default_section
+        options = self._section(section)[2]
+        key = parser.optionxform(option)
+        tokenize = parser._linecre.match
+        if key in options:
+            start, end = options[key]
+            match = tokenize(self._lines[start])
+            line = match.group(0)
+            if match.group("value"):
+                prefix = line[:match.start("value")]
+            elif match.group("vi"):
+                prefix = line[:match.end("vi")] + " "
+            else:
+                prefix = line.rstrip() + " = "
+            indent = match.group("indent") + "    "
+            for line in self._lines[start + 1:end]:
+                match = tokenize(line)
+                if match.group("text"):
+                    indent = match.group("indent")
+                    break
+            last = self._lines[end - 1]
+            ending = last[len(last.rstrip("\r\n")):]
+        else:
+            start = end = max([self._index[section][0] + 1]
+                              + [span[1] for span in options.values()])
+            indent = ""
+            if options:
+                first = next(iter(options.values()))[0]
+                indent = tokenize(self._lines[first]).group("indent")
+            prefix = indent + option + " = "
+            indent += "    "
+            ending = self._newline
+            self._end_line(start)
+        lines = self._format(prefix, value, indent, ending)
+        self._replace(start, end, lines)
+        options[key] = [start, start + len(lines)]
+
+    def remove_option(self, section, option):
+        """Remove an option and its lines, return True if it existed."""
+        existed = self.parser.remove_option(section, option)
+        if existed:
+            section = section or self.parser.default_section
+            options = self._index[section][2]
+            start, end = options.pop(self.parser.optionxform(option))
+            self._replace(start, end, [])
+        return existed
+
+    def add_section(self, section):
+        """Add a section at the end of the document."""
+        self.parser.add_section(section)
+        self._insert_section(section, len(self._lines))
+
+    def remove_section(self, section):
+        """Remove a section and its lines, return True if it existed."""
+        existed = self.parser.remove_section(section)
+        if existed:
+            start, end, _ = self._index.pop(section)
+            self._replace(start, end, [])
+        return existed
+
+    def _load(self, lines, source):
+        parser = self.parser
+        tokenize = parser._linecre.match
+        with parser.writelock():
+            try:
+                parsed = parser._read_lines(enumerate(lines, start=1), source)
+            finally:
+                parser._clear_caches()
+        index = OrderedDict()
+        ends = [lineno - 1 for _, lineno, _, _ in parsed[1:]] + [len(lines)]
+        for (name, lineno, _, linenos), end in zip(parsed, ends):
+            # DEFAULT may be in the file more than once
+            options = index.setdefault(name, [lineno - 1, end,
+                                              OrderedDict()])[2]
+            starts = sorted((start - 1, option)
+                            for option, start in linenos.items())
+            for i, (start, option) in enumerate(starts):
+                stop = starts[i + 1][0] if i + 1 < len(starts) else end
+                # without the empty and comment lines after the value
+                while (stop - 1 > start
+                       and not tokenize(lines[stop - 1]).group("text")):
+                    stop -= 1
+                options[option] = [start, stop]
+        self._lines = lines
+        self._index = index
+        self._dirty = None
+        if lines and lines[0].endswith("\r\n"):
+            self._newline = "\r\n"
+
+    def _section(self, section):
+        """Return the index of `section', add the lines of DEFAULT."""
+        try:
+            return self._index[section]
+        except KeyError:
+            # the default section is in the parser without a header
+            start = min([span[0] for span in self._index.values()]
+                        + [len(self._lines)])
+            return self._insert_section(section, start)
+
+    def _insert_section(self, section, start):
+        newline = self._newline
+        lines = ["[{0}]".format(section) + newline]
+        if start < len(self._lines):
+            lines.append(newline)
+        else:
+            self._end_line(start)
+            if self._lines and self._lines[-1].strip():
+                lines.insert(0, newline)
+        header = start + len(lines) - 1 if lines[0] == newline else start
+        self._replace(start, start, lines)
+        for span in self._index.values():
+            if span[0] < start and span[1] == start + len(lines):
+                # the section before ends at the new header
+                span[1] = header
+        span = self._index[section] = [header, start + len(lines),
+                                       OrderedDict()]
+        return span
+
+    def _end_line(self, end):
+        """Terminate the line before `end', if it is the last line."""
+        if end and not self._lines[end - 1].endswith("\n"):
+            self._replace(end - 1, end, [self._lines[end - 1] + self._newline])
+
+    def _format(self, prefix, value, indent, ending):
+        """Return the lines of an option with `value'."""
+        texts = value.split("\n")
+        lines = [prefix + texts[0] if texts[0] else prefix.rstrip()]
+        lines.extend(indent + text if text else "" for text in texts[1:])
+        return ([line + self._newline for line in lines[:-1]]
+                + [lines[-1] + ending])
+
+    def _replace(self, start, end, lines):
+        """Replace the lines start:end and move the spans after them."""
+        self._lines[start:end] = lines
+        if self._dirty is None or start < self._dirty:
+            self._dirty = start
+        delta = len(lines) - (end - start)
+        if not delta:
+            return
+        for span in self._index.values():
+            if span[0] >= end:
+                span[0] += delta
+            if span[1] >= end:
+                span[1] += delta
+            for option in span[2].values():
+                if option[0] >= end:
+                    option[0] += delta
+                    option[1] += delta
+
+
+class _LayerChain(ChainMap):
+    """ChainMap of the layers, the keys in the order of reading the layers.
+
+    Like the ChainMap of Python 3.7, older versions iterate a set.
+    """
+
+    def __iter__(self):
+        keys = OrderedDict()
+        for mapping in reversed(self.maps):
+            for key in mapping:
+                keys[key] = None
+        return iter(keys)
+
+
+class _LayeredSections(Mapping):
+    """The sections of a LayeredConfig.
+
+    A section is a _LayerChain of the section in every layer having it, the
+    highest priority first. The chains and the order of the section names
+    are built on first use and dropped by clear().
+    """
+
+    def __init__(self, config):
+        self._config = config
+        self._chains = {}
+        self._names = None
+        self._index = None
+
+    def __getitem__(self, key):
+        try:
+            return self._chains[key]
+        except KeyError:
+            pass
+        maps = [layer._sections[key]
+                for layer in reversed(self._config._layers.values())
+                if key in layer._sections]
+        if not maps:
+            raise KeyError(key)
+        chain = self._chains[key] = _LayerChain(*maps)
+        return chain
+
+    def __contains__(self, key):
+        return key in self._chains or any(
+            key in layer._sections for layer in self._config._layers.values())
+
+    def __iter__(self):
+        if self._names is None:
+            names = OrderedDict()
+            for layer in self._config._layers.values():
+                for name in layer._sections:
+                    names[name] = None
+            self._names = list(names)
+        return iter(self._names)
+
+    def __len__(self):
+        if self._names is None:
+            for name in self:
+                break
+        return len(self._names)
+
+    def clear(self):
+        self._chains.clear()
+        self._names = None
+        self._index = None
+
+    def name_index(self):
+        if self._index is None:
+            self._index = _SectionIndex(self)
+        return self._index
+
+
+class LayeredConfig(StdConfigParser):
+    """Read-only view of several parsers stacked as layers.
+
+    `layers' are (name, parser) pairs, or a mapping, in the order they
+    would be read: a later layer overrides the options of the earlier
+    ones. A value is looked up in the sections of the layers, the highest
+    priority first, then in their defaults, nothing is copied or merged.
+    The result is the same as reading all layers into one parser.
+
+    set_layer() replaces a layer without touching the others. A layer
+    changed in place must be set again, the view caches its lookups.
+    """
+
+    def __init__(self, layers, converters=None, interpolate=False,
+                 cache_size=0):
+        super(LayeredConfig, self).__init__(converters=converters,
+                                            interpolate=interpolate,
+                                            cache_size=cache_size)
+        self._layers = OrderedDict(layers)
+        self._sections = _LayeredSections(self)
+        self._defaults = _LayerChain(*[layer._defaults for layer in
+                                       reversed(self._layers.values())])
+        for name in self._WRITE_METHODS:
+            setattr(self, name, self._read_only)
+
+    def __repr__(self):
+        return '<LayeredConfig: {0}>'.format(", ".join(self._layers))
+
+    @property
+    def layers(self):
+        """The names of the layers, the lowest priority first."""
+        return list(self._layers)
+
+    def layer(self, name):
+        """Return the parser of the layer `name'."""
+        return self._layers[name]
+
+    def set_layer(self, name, parser):
+        """Replace the layer `name' by `parser'.
+
+        A new name is added as the layer of the highest priority. Only the
+        caches of the view are dropped, the other layers are kept as they
+        are.
+        """
+        self._layers[name] = parser
+        self._sections.clear()
+        self._defaults = _LayerChain(*[layer._defaults for layer in
+                                       reversed(self._layers.values())])
+        self._clear_caches()
+
+    def layer_of(self, section, option):
+        """Return the name of the layer the value of `option' comes from.
+
+        Raises NoSectionError or NoOptionError like get().
+        """
+        if section != self.default_section and section not in self._sections:
+            raise NoSectionError(section)
+        option = self.optionxform(option)
+        layers = list(reversed(self._layers.items()))
+        if section != self.default_section:
+            for name, layer in layers:
+                if (section in layer._sections
+                        and option in layer._sections[section]):
+                    return name
+        for name, layer in layers:
+            if option in layer._defaults:
+                return name
+        raise NoOptionError(option, section)
+
+    def __getstate__(self):
+        converters = dict((name, func)
+                          for name, func in self._converters.items()
+                          if func is not None
+                          and name not in ("int", "float", "boolean"))
+        if self._converted is None:
+            cache_size = 0
+        else:
+            cache_size = self._converted._size
+        return {"layers": list(self._layers.items()),
+                "settings": (converters,
+                             isinstance(self._interpolation,
+                                        StdInterpolation),
+                             cache_size)}
+
+    def __setstate__(self, state):
+        converters, interpolate, cache_size = state["settings"]
+        LayeredConfig.__init__(self, state["layers"], converters=converters,
+                               interpolate=interpolate,
+                               cache_size=cache_size)
+
+    def __setitem__(self, key, value):
+        # ConfigParser would clear the section of a layer before reading
+        self._read_only()
+
+    def __delitem__(self, key):
+        self._read_only()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("LayeredConfig is read-only, change a layer and "
+                        "call set_layer()")
+
+
+class _SchemaValues(object):
+    """Typed values of a Schema, the options or sections as attributes."""
+
+    __slots__ = ()
+
+    def __init__(self, values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "<{0}: {1}>".format(
+            type(self).__name__,
+            ", ".join("%s=%r" % (name, getattr(self, name))
+                      for name in self.__slots__))
+
+
+class Schema(object):
+    """Typed options of some sections, converted at once by validate().
+
+    `sections' maps the section names to mappings of the option names to
+    their type, or to (type, default) pairs. A type is the name of a
+    converter of the parser ("int", "boolean", "listing", ...) or a
+    callable like str. Options without a default are required, defaults
+    are used as they are. The sections and options are compiled to classes
+    with __slots__, their names with other characters than letters, digits
+    and '_' replaced by '_' are the attribute names. Python 2 allows only
+    ASCII letters and digits in attribute names.
+    """
+
+    if PY2:
+        _ATTRCRE = re.compile(r"[^a-zA-Z0-9_]|^(?=\d)")
+    else:
+        _ATTRCRE = re.compile(r"\W|^(?=\d)", re.UNICODE)
+
+    def __init__(self, sections):
+        # [(section, class, [(option, type, default)])]
+        self._sections = []
+        for section, options in sections.items():
+            compiled = []
+            for option, spec in options.items():
+                if isinstance(spec, tuple):
+                    conv, default = spec
+                else:
+                    conv, default = spec, _UNSET
+                compiled.append((option, conv, default))
+            cls = self._make_class(section,
+                                   [option for option, _, _ in compiled])
+            self._sections.append((section, cls, compiled))
+        self._class = self._make_class("Config", list(sections))
+
+    def _make_class(self, name, members):
+        attrs = [self._ATTRCRE.sub("_", member) for member in members]
+        if len(set(attrs)) != len(attrs):
+            raise ValueError("Names of %r are equal as attributes: %r"
+                             % (name, members))
+        name = self._ATTRCRE.sub("_", name)
+        if PY2:
+            # type() and __slots__ need native strings
+            name = name.encode("ascii")
+            attrs = [attr.encode("ascii") for attr in attrs]
+        return type(name, (_SchemaValues, ), {"__slots__": tuple(attrs)})
+
+    def validate(self, parser):
+        """Convert the options of `parser' and return them as object.
+
+        Every option is looked up once, missing sections and options,
+        interpolation and conversion errors are collected and raised
+        together as SchemaError.
+        """
+        converters = {"int": int, "float": float,
+                      "boolean": parser._convert_to_boolean}
+        for name, func in parser._converters.items():
+            if func is not None:
+                converters[name] = func
+        missing = object()
+        errors = []
+        sections = []
+        for section, cls, options in self._sections:
+            exists = (section == parser.default_section
+                      or parser.has_section(section))
+            reported = False
+            values = []
+            for option, conv, default in options:
+                value = None
+                try:
+                    if not callable(conv):
+                        try:
+                            conv = converters[conv]
+                        except KeyError:
+                            raise ValueError("Unknown converter %r" % conv)
+                    value = parser.get(section, option, fallback=missing)
+                    if value is missing:
+                        if default is not _UNSET:
+                            value = default
+                        elif exists:
+                            raise NoOptionError(option, section)
+                        elif not reported:
+                            reported = True
+                            raise NoSectionError(section)
+                    else:
+                        try:
+                            value = conv(value)
+                        except Exception as ex:
+                            _annotate_conv_error(ex, section, option, conv)
+                            raise
+                except Exception as ex:
+                    errors.append(ex)
+                values.append(value)
+            sections.append(cls(values))
+        if errors:
+            raise SchemaError(errors)
+        return self._class(sections)
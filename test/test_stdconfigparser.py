@@ -7,10 +7,33 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import pytest
+import copy
 import json
+import os
+import pickle
+import itertools
+import time
+import threading
+from collections import OrderedDict
+from io import StringIO
 
+import stdconfigparser
 from stdconfigparser import (StdConfigParser, InterpolationMissingOptionError,
-                             ParsingError, MissingSectionHeaderError)
+                             ParsingError, MissingSectionHeaderError,
+                             ConfigParser, Interpolation, DuplicateOptionError,
+                             DuplicateSectionError, ResolveError,
+                             InterpolationCycleError, InterpolationSyntaxError,
+                             NoSectionError, NoOptionError, SectionProxy,
+                             iterparse, ReloadableConfig, FrozenConfig,
+                             SharedConfig, ConfigDocument, LayeredConfig,
+                             Schema, SchemaError, InterpolationDepthError,
+                             MAX_INTERPOLATION_DEPTH)
+
+
+def _configparser():
+    """ConfigParser with the same settings as StdConfigParser."""
+    return ConfigParser(comment_prefixes=("#", ), inline_comment_prefixes=None,
+                        interpolation=Interpolation())
 
 
 def test_init():
@@ -342,3 +365,1224 @@ not_invalid =
     assert [section.split()[1] for section in parser if section.startswith("my ")] ==\
            ["one", "two", "t3", "t4", "t5", "t6"]
 
+
+
+def test_tokenizer_like_configparser():
+    test = """
+    [DEFAULT]
+    base = /srv
+    [a]
+    key = value
+    empty =
+      # comment
+    multi = first
+        second
+
+      [not a section]
+    key2 : v : w
+    [b] trailing
+    x = [y]
+    [c]]
+    ok=1
+    """
+    parser = StdConfigParser()
+    parser.read_string(test)
+    expected = _configparser()
+    expected.read_string(test)
+    assert parser.sections() == expected.sections()
+    for section in expected:
+        assert dict(parser[section]) == dict(expected[section])
+    assert parser.get("a", "multi") == "first\nsecond\n\n[not a section]"
+    assert parser.get("a", "empty") == ""
+
+
+def test_tokenizer_errors():
+    test = """
+    [a]
+    = novalue
+    bogus
+    key = v
+    another bogus line
+    """
+    with pytest.raises(ParsingError) as exc_info:
+        StdConfigParser().read_string(test)
+    with pytest.raises(ParsingError) as expected_info:
+        _configparser().read_string(test)
+    assert exc_info.value.errors == expected_info.value.errors
+    assert [lineno for lineno, _ in exc_info.value.errors] == [3, 4, 6]
+    with pytest.raises(DuplicateOptionError) as exc_info:
+        StdConfigParser().read_string("[a]\nk = 1\nK = 2\n")
+    assert exc_info.value.lineno == 3
+    with pytest.raises(DuplicateSectionError) as exc_info:
+        StdConfigParser().read_string("[a]\n[b]\n[a]\n")
+    assert exc_info.value.lineno == 3
+
+
+def test_lazy():
+    test = """
+    # comment
+    [DEFAULT]
+    base = /srv
+    [a]
+    key = value
+    list = [1,
+      [2, 3]]
+    [b]
+    path = ${base}/b
+    [DEFAULT]
+    other = 1
+    """
+    parser = StdConfigParser(lazy=True, interpolate=True)
+    parser.read_string(test)
+    assert parser.sections() == ["a", "b"]
+    assert parser.defaults() == {"base": "/srv", "other": "1"}
+    assert sorted(parser._sections._pending) == ["a", "b"]
+    assert parser.get("b", "path") == "/srv/b"
+    assert sorted(parser._sections._pending) == ["a"]
+    assert parser["a"]["list"] == "[1,\n[2, 3]]"
+    assert not parser._sections._pending
+    expected = StdConfigParser(interpolate=True)
+    expected.read_string(test)
+    assert ([(s, parser.items(s)) for s in parser]
+            == [(s, expected.items(s)) for s in expected])
+
+
+def test_lazy_override():
+    parser = StdConfigParser(lazy=True)
+    parser.read_string("[a]\nx = 1\ny = 1\n")
+    parser.read_string("[a]\ny = 2\n[b]\n")
+    assert parser.items("a", raw=True) == [("x", "1"), ("y", "2")]
+    parser.remove_section("b")
+    assert parser.sections() == ["a"]
+
+
+def test_lazy_errors():
+    parser = StdConfigParser(lazy=True)
+    with pytest.raises(DuplicateSectionError) as exc_info:
+        parser.read_string("[a]\n[b]\n[a]\n")
+    assert exc_info.value.lineno == 3
+    parser = StdConfigParser(lazy=True)
+    with pytest.raises(MissingSectionHeaderError):
+        parser.read_string("key = value\n[a]\n")
+    parser = StdConfigParser(lazy=True)
+    parser.read_string("[a]\nk = 1\n[b]\nk = 1\nbogus\n")
+    assert parser.get("a", "k") == "1"
+    with pytest.raises(ParsingError) as exc_info:
+        parser.get("b", "k")
+    assert [lineno for lineno, _ in exc_info.value.errors] == [5]
+
+
+def test_interpolation_cache():
+    parser = StdConfigParser(interpolate=True)
+    test = """
+    [DEFAULT]
+    base = /srv
+    [a]
+    path = ${base}/a
+    [b]
+    path = ${a:path}/b
+    """
+    parser.read_string(test)
+    assert parser.get("b", "path") == "/srv/a/b"
+    assert parser._interpolation._cache
+    assert parser.get("b", "path", vars={"base": "x"}) == "/srv/a/b"
+    assert parser.get("a", "path", vars={"base": "/var"}) == "/var/a"
+    assert parser.get("a", "path") == "/srv/a"
+    parser.set("DEFAULT", "base", "/opt")
+    assert parser.get("b", "path") == "/opt/a/b"
+    parser["a"]["path"] = "/a"
+    assert parser.get("b", "path") == "/a/b"
+    parser.read_string("[a]\npath = /new\n")
+    assert parser.get("b", "path") == "/new/b"
+    parser.remove_option("a", "path")
+    with pytest.raises(InterpolationMissingOptionError):
+        parser.get("b", "path")
+    parser["a"] = {"path": "/dict"}
+    assert parser.get("b", "path") == "/dict/b"
+    parser.remove_section("a")
+    with pytest.raises(InterpolationMissingOptionError):
+        parser.get("b", "path")
+
+
+def test_resolve_all():
+    parser = StdConfigParser(interpolate=True)
+    test = """
+    [DEFAULT]
+    url = http://${host}/
+    [a]
+    host = a.example
+    api = ${url}api $$
+    [b:c]
+    host = ${a:host}
+    api = ${a:api}
+    """
+    parser.read_string(test)
+    resolved = parser.resolve_all()
+    assert list(resolved) == ["a", "b:c"]
+    for section in resolved:
+        assert list(resolved[section].items()) == parser.items(section)
+    assert resolved["b:c"]["api"] == "http://a.example/api $"
+    assert StdConfigParser().resolve_all() == {}
+
+
+def test_resolve_all_depth():
+    # get() interpolates o10 with the nested values of o9 ... o0
+    depth = MAX_INTERPOLATION_DEPTH
+    parser = StdConfigParser(interpolate=True)
+    parser.read_string("[a]\no0 = $$\n" + "".join(
+        "o%d = ${o%d}\n" % (i, i - 1) for i in range(1, depth + 5)))
+    assert parser.get("a", "o%d" % (depth - 1)) == "$"
+    with pytest.raises(InterpolationDepthError):
+        parser.get("a", "o%d" % depth)
+    resolved = parser.resolve_all()
+    assert set(resolved["a"].values()) == set(["$"])
+    # deeper values are resolved, but not cached for get()
+    assert parser.get("a", "o%d" % (depth - 1)) == "$"
+    with pytest.raises(InterpolationDepthError):
+        parser.get("a", "o%d" % depth)
+    with pytest.raises(InterpolationDepthError):
+        parser.getlisting("a", "o%d" % (depth + 4))
+
+
+def test_resolve_all_errors():
+    parser = StdConfigParser(interpolate=True)
+    test = """
+    [a]
+    self = ${self}
+    one = ${b:two}
+    missing = ${nothere}
+    syntax = $x
+    [b]
+    two = ${a:one}
+    bad = ${c:x}
+    """
+    parser.read_string(test)
+    with pytest.raises(ResolveError) as exc_info:
+        parser.resolve_all()
+    errors = exc_info.value.errors
+    assert [type(error) for error in errors] == [
+        InterpolationCycleError, InterpolationCycleError,
+        InterpolationMissingOptionError, InterpolationSyntaxError,
+        InterpolationMissingOptionError]
+    assert errors[1].cycle == [("a", "one"), ("b", "two")]
+    assert errors[4].reference == "c:x"
+
+
+def test_get():
+    parser = StdConfigParser(defaults={"d": "default"}, interpolate=True)
+    parser.read_string("[a]\nKey = ${d}\nint = 7\n")
+    assert parser.get("a", "key") == "default"
+    assert parser.get("a", "KEY", raw=True) == "${d}"
+    assert parser.get("a", "d") == "default"
+    assert parser.get("DEFAULT", "d") == "default"
+    assert parser.get("a", "key", vars={"d": "vars"}) == "vars"
+    assert parser.get("a", "nokey", fallback=None) is None
+    assert parser.get("nosection", "key", fallback=1) == 1
+    assert parser.getint("a", "int") == 7
+    assert parser.getint("a", "nokey", fallback=0) == 0
+    with pytest.raises(NoSectionError):
+        parser.get("nosection", "key")
+    with pytest.raises(NoOptionError):
+        parser.get("a", "nokey")
+    with pytest.raises(NoOptionError):
+        parser.getint("a", "nokey")
+    parser.remove_section("a")
+    parser.read_string("[a]\nkey = new ${d}\n")
+    assert parser.get("a", "key") == "new default"
+
+
+def test_converter_cache():
+    parser = StdConfigParser(cache_size=None,
+                             converters={"json": json.loads})
+    parser.read_string("[a]\nflags = a, b\nn = 1\nj = {\"x\": 1}\n")
+    flags = parser.getlisting("a", "flags")
+    assert flags == ("a", "b")
+    assert parser["a"].getlisting("FLAGS") is flags
+    assert parser.getint("a", "n") == 1
+    assert parser.getjson("a", "j") is parser.getjson("a", "j")
+    assert len(parser._converted) == 3
+    assert parser.getlisting("a", "flags", vars={"flags": "c"}) == ["c"]
+    parser.set("a", "flags", "c")
+    assert parser.getlisting("a", "flags") == ("c", )
+    assert parser.getlisting("a", "nokey", fallback=None) is None
+    assert StdConfigParser().getlisting("DEFAULT", "x", fallback=[]) == []
+
+
+def test_converter_cache_size():
+    parser = StdConfigParser(cache_size=2)
+    parser.read_string("[a]\nx = 1\ny = 2\nz = 3\n")
+    assert parser.getint("a", "x") == 1
+    assert parser.getint("a", "y") == 2
+    assert parser.getint("a", "x") == 1
+    assert parser.getint("a", "z") == 3
+    assert [key[1] for key in parser._converted._data] == ["x", "z"]
+    parser.remove_option("a", "x")
+    assert not parser._converted
+    assert StdConfigParser()._converted is None
+
+
+def test_cache_dir(tmpdir):
+    cache_dir = str(tmpdir.join("cache"))
+    ini = tmpdir.join("a.ini")
+    ini.write("[DEFAULT]\nbase = /srv\n[a]\nx = ${base}/x\nlines = 1\n  2\n")
+
+    parser = StdConfigParser(interpolate=True, cache_dir=cache_dir)
+    parser.read(str(ini))
+    assert len(tmpdir.join("cache").listdir()) == 1
+
+    def fail(*args):
+        raise AssertionError("parsed again")
+    cached = StdConfigParser(interpolate=True, cache_dir=cache_dir)
+    cached._parse_lines = fail
+    cached.read([str(ini), str(tmpdir.join("missing.ini"))])
+    assert cached.get("a", "x") == "/srv/x"
+    assert cached.getlines("a", "lines") == ["1", "2"]
+    assert cached.sections() == parser.sections()
+
+    # other parser settings or a changed file are parsed again
+    with pytest.raises(AssertionError):
+        other = StdConfigParser(lazy=True, cache_dir=cache_dir)
+        other.optionxform = lambda option: option.upper()
+        other._parse_lines = fail
+        other.read(str(ini))
+    ini.write("[b]\nx = 1\n")
+    parser = StdConfigParser(cache_dir=cache_dir)
+    parser.read(str(ini))
+    assert parser.sections() == ["b"]
+
+    ini.write("[b]\nx\n")
+    with pytest.raises(ParsingError):
+        StdConfigParser(cache_dir=cache_dir).read(str(ini))
+    with pytest.raises(ParsingError):
+        StdConfigParser(cache_dir=cache_dir).read(str(ini))
+
+
+def test_freeze():
+    parser = StdConfigParser(interpolate=True, converters={"json": json.loads})
+    parser.read_string("[DEFAULT]\nbase = /srv\n[a]\nPath = ${base}/a\n"
+                       "n = 1\nflag = yes\nj = [1]\nl = x, y\n[b]\n")
+    frozen = parser.freeze()
+    parser.set("a", "n", "2")
+    assert frozen.sections() == ["a", "b"]
+    assert list(frozen) == ["DEFAULT", "a", "b"]
+    assert "DEFAULT" in frozen and "a" in frozen and "c" not in frozen
+    assert not frozen.has_section("DEFAULT")
+    assert frozen.get("a", "path") == "/srv/a"
+    assert frozen.get("a", "path", raw=True) == "${base}/a"
+    assert frozen.get("b", "base") == "/srv"
+    assert frozen.get("a", "x", vars={"X": "1"}) == "1"
+    assert frozen.getint("a", "n") == 1
+    assert frozen.getboolean("a", "flag") is True
+    assert frozen.getjson("a", "j") == [1]
+    assert frozen.getlisting("a", "l") == ["x", "y"]
+    assert frozen.getint("a", "x", fallback=0) == 0
+    assert frozen.has_option("b", "BASE") and not frozen.has_option("c", "x")
+    assert frozen.options("b") == ["base"]
+    assert dict(frozen.items("a"))["path"] == "/srv/a"
+    assert frozen.defaults() == {"base": "/srv"}
+    section = frozen["a"]
+    assert section.name == "a" and section.parser is frozen
+    assert section["PATH"] == "/srv/a"
+    assert section.getint("n") == 1
+    assert section.getlisting("l") == ["x", "y"]
+    assert section.get("x", "default") == "default"
+    assert dict(frozen["b"]) == {"base": "/srv"}
+    with pytest.raises(NoSectionError):
+        frozen.get("c", "x")
+    with pytest.raises(NoOptionError):
+        frozen.get("a", "x")
+    with pytest.raises(KeyError):
+        section["x"]
+    with pytest.raises(ValueError) as ex:
+        frozen.getint("a", "path")
+    assert "with converter 'int'" in ex.value.args[-1]
+    with pytest.raises(TypeError):
+        section["x"] = "1"
+    with pytest.raises(AttributeError):
+        frozen.getnothing
+
+    parser.set("a", "n", "${missing}")
+    with pytest.raises(ResolveError):
+        parser.freeze()
+    assert StdConfigParser().freeze().getint("DEFAULT", "x", fallback=1) == 1
+
+    # the options in the order of the parser
+    for interpolate in (False, True):
+        parser = StdConfigParser(interpolate=interpolate)
+        parser.read_string("[DEFAULT]\nb = 1\nc = 2\n[a]\nz = 1\ny = 2\n"
+                           "x = 3\n")
+        frozen = parser.freeze()
+        assert frozen.options("a") == parser.options("a") == [
+            "z", "y", "x", "b", "c"]
+        assert frozen.items("a") == parser.items("a")
+        assert frozen.items("a", raw=True, vars={"y": "0"}) == parser.items(
+            "a", raw=True, vars={"y": "0"})
+        assert list(frozen.defaults()) == ["b", "c"]
+        if stdconfigparser.shared_memory is not None:
+            shared = parser.share()
+            try:
+                assert shared.options("a") == parser.options("a")
+                assert shared.items("a") == parser.items("a")
+                assert list(shared.defaults()) == ["b", "c"]
+            finally:
+                shared.close()
+                shared.unlink()
+
+
+def test_share_unsupported(monkeypatch):
+    # before Python 3.8 there is no multiprocessing.shared_memory
+    monkeypatch.setattr(stdconfigparser, "shared_memory", None)
+    parser = StdConfigParser()
+    parser.read_string("[a]\nx = 1\n")
+    with pytest.raises(NotImplementedError) as info:
+        parser.share()
+    assert "Python 3.8" in str(info.value)
+    with pytest.raises(NotImplementedError):
+        SharedConfig.attach("name")
+
+
+def test_share():
+    pytest.importorskip("multiprocessing.shared_memory")
+    parser = StdConfigParser(interpolate=True, converters={"json": json.loads})
+    parser.read_string("[DEFAULT]\nbase = /srv\n[a]\nPath = ${base}/a\n"
+                       "n = 1\nflag = yes\nj = [1]\nl = x, y\n[b]\n"
+                       "[\u00e4]\n\u00f6 = \u00fc\n[empty]\n")
+    frozen = parser.freeze()
+    shared = parser.share()
+    try:
+        parser.set("a", "n", "2")
+        assert isinstance(shared, FrozenConfig)
+        assert list(shared) == list(frozen) and len(shared) == len(frozen)
+        assert shared.sections() == frozen.sections()
+        assert shared.defaults() == frozen.defaults()
+        for section in frozen:
+            assert shared.items(section) == frozen.items(section)
+            assert (shared.items(section, raw=True)
+                    == frozen.items(section, raw=True))
+            assert dict(shared[section]) == dict(frozen[section])
+        assert "a" in shared and "c" not in shared and "a\0n" not in shared
+        assert not shared.has_section("DEFAULT")
+        assert shared.get("a", "PATH") == "/srv/a"
+        assert shared.get("a", "path", raw=True) == "${base}/a"
+        assert shared.get("\u00e4", "\u00f6") == "\u00fc"
+        assert shared.get("a", "x", vars={"X": "1"}) == "1"
+        assert shared.getint("a", "n") == 1
+        assert shared.getboolean("a", "flag") is True
+        assert shared.getjson("a", "j") == [1]
+        assert shared["a"].getlisting("l") == ["x", "y"]
+        assert shared.getint("c", "x", fallback=0) == 0
+        assert shared.has_option("b", "BASE") and not shared.has_option("c", "x")
+        with pytest.raises(NoSectionError):
+            shared.get("c", "x")
+        with pytest.raises(NoOptionError):
+            shared.get("a", "x")
+        with pytest.raises(KeyError):
+            shared["c"]
+
+        attached = SharedConfig.attach(shared.name)
+        assert attached.get("a", "path") == "/srv/a"
+        assert attached.getlines("a", "l") == ["x, y"]
+        with pytest.raises(AttributeError):
+            attached.getjson
+        attached.close()
+    finally:
+        shared.close()
+        shared.unlink()
+    with pytest.raises(ValueError):
+        SharedConfig(b"\0" * 64)
+
+
+def test_share_threadsafe():
+    pytest.importorskip("multiprocessing.shared_memory")
+    parser = StdConfigParser(threadsafe=True)
+    parser.read_string("[a]\nx = 1\n[b]\nx = 1\n")
+    raw_options = parser._raw_options
+    writers = []
+
+    def write():
+        with parser.writelock():
+            parser.set("a", "x", "2")
+            parser.set("b", "x", "2")
+
+    def snapshot(section):
+        # a writer between the sections of the snapshot waits for share()
+        if section == "b" and not writers:
+            writers.append(threading.Thread(target=write))
+            writers[0].start()
+            writers[0].join(0.2)
+        return raw_options(section)
+
+    parser._raw_options = snapshot
+    shared = parser.share()
+    writers[0].join()
+    try:
+        assert shared.get("a", "x") == shared.get("b", "x") == "1"
+    finally:
+        shared.close()
+        shared.unlink()
+    assert parser.get("a", "x") == parser.get("b", "x") == "2"
+
+
+def test_pickle(monkeypatch):
+    parser = StdConfigParser(interpolate=True, cache_size=None,
+                             converters={"json": json.loads})
+    parser.optionxform = str
+    parser.read_string("[DEFAULT]\nBase = /srv\n[a]\nPath = ${Base}/a\n"
+                       "j = [1]\n[b]\nx = 1\n")
+    parser.getint("b", "x")
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(parser, protocol))
+        assert loaded.sections() == ["a", "b"]
+        assert loaded.get("a", "Path") == "/srv/a"
+        assert loaded.get("a", "Path", raw=True) == "${Base}/a"
+        assert loaded.getjson("a", "j") == (1, )   # cached as tuple
+        assert loaded["b"].getint("x") == 1
+        assert loaded["a"].getlisting("Path") == ("/srv/a", )
+        assert loaded._converted._size is None
+    loaded.set("b", "x", "2")
+    assert parser.get("b", "x") == "1"
+    loaded.remove_section("a")
+    assert list(loaded) == ["DEFAULT", "b"]
+
+    parser = StdConfigParser(lazy=True)
+    parser.read_string("[a]\nx = 1\n[b]\nbad\n")
+    assert parser.get("a", "x") == "1"
+    loaded = copy.deepcopy(parser)
+    assert list(loaded._sections._pending) == ["b"]
+    assert loaded.get("a", "x") == "1"
+    with pytest.raises(ParsingError):
+        loaded.options("b")
+
+    parser = StdConfigParser(threadsafe=True)
+    parser.read_string("[a]\nx = 1\n")
+    loaded = pickle.loads(pickle.dumps(parser))
+    assert loaded.writelock() is not parser.writelock()
+    with loaded.writelock():
+        loaded.set("a", "x", "2")
+    assert loaded["a"]["x"] == "2"
+
+    parser = StdConfigParser()
+    parser.read_string("[a]\nport = 1\nhost = h\n")
+    parser.overlay_environ("APP", {"APP__A__PORT": "2"})
+    for loaded in (pickle.loads(pickle.dumps(parser)), copy.deepcopy(parser)):
+        assert loaded.get("a", "port") == "2"
+        assert loaded.items("a") == [("port", "2"), ("host", "h")]
+    monkeypatch.setitem(os.environ, "APP__A__HOST", "env")
+    parser.overlay_environ("APP")
+    data = pickle.dumps(parser)
+    assert b"APP__A__HOST" not in data
+    monkeypatch.setitem(os.environ, "APP__A__HOST", "other")
+    loaded = pickle.loads(data)
+    assert loaded._environ.environ is os.environ
+    assert loaded.get("a", "host") == "other"
+    parser.overlay_environ(None)
+    assert pickle.loads(pickle.dumps(parser)).get("a", "host") == "h"
+
+
+def test_pickle_threadsafe():
+    parser = StdConfigParser(threadsafe=True)
+    keys = ["k%d" % i for i in range(50)]
+    sections = ["s%d" % i for i in range(10)]
+    parser.read_dict(dict((s, dict((k, "0") for k in keys))
+                          for s in sections))
+    done = []
+
+    def write():
+        try:
+            for i in range(100):
+                parser.read_dict(dict((s, dict((k, str(i)) for k in keys))
+                                      for s in sections))
+        finally:
+            done.append(True)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        while not done:
+            for loaded in (pickle.loads(pickle.dumps(parser)),
+                           copy.deepcopy(parser)):
+                # never a half applied read_dict()
+                values = set(value for s in sections
+                             for _, value in loaded.items(s))
+                assert len(values) == 1, values
+    finally:
+        writer.join()
+
+
+def test_write_file(tmpdir):
+    parser = StdConfigParser(interpolate=True)
+    parser.read_string("[DEFAULT]\nd = 1\n[a]\nx = ${d}\nm = one\n  two\n"
+                       "\n  three\n[b]\n[\u00e4]\n\u00f6 = \u00fc\n")
+    expected = StringIO()
+    ConfigParser.write(parser, expected)
+    text = StringIO()
+    parser.write(text)
+    assert text.getvalue() == expected.getvalue()
+    assert "".join(parser._write_chunks(False, lines_per_chunk=2)) == \
+        expected.getvalue().replace(" = ", "=")
+
+    ini = tmpdir.join("a.ini")
+    ini.write("old")
+    ini.chmod(0o640)
+    parser.write_file(str(ini))
+    assert ini.read_text("utf-8") == expected.getvalue()
+    assert ini.stat().mode & 0o777 == 0o640
+    parser.write_file(str(ini), space_around_delimiters=False, fsync=False)
+    loaded = StdConfigParser()
+    loaded.read(str(ini))
+    assert loaded.get("\u00e4", "\u00f6") == "\u00fc"
+    assert loaded.get("a", "m") == "one\ntwo\n\nthree"
+
+    def failing(space_around_delimiters):
+        yield "[a]\n"
+        raise IOError("disk full")
+
+    parser._write_chunks = failing
+    with pytest.raises(IOError):
+        parser.write_file(str(ini))
+    del parser._write_chunks
+    if not stdconfigparser.PY2:     # Python 2 encodes lone surrogates
+        parser.set("b", "bad", "\udcff")   # not encodable
+        with pytest.raises(UnicodeEncodeError):
+            parser.write_file(str(ini))
+    assert ini.read_text("utf-8").startswith("[DEFAULT]\nd=1\n")
+    assert tmpdir.listdir() == [ini]
+
+
+def test_config_document(tmpdir):
+    text = ("# top\n"
+            "[a]\n"
+            "Key  =  one\n"
+            "  # inner\n"
+            "multi = x\n"
+            "\ty\n"
+            "\n"
+            "\tz\n"
+            "\n"
+            "# about b\n"
+            "[b]\n"
+            "q: 1")
+    ini = tmpdir.join("a.ini")
+    ini.write_binary(text.encode("utf-8"))
+    doc = ConfigDocument()
+    doc.read(str(ini))
+    assert doc.get("a", "multi") == "x\ny\n\nz"
+    assert doc.sections() == ["a", "b"]
+    with pytest.raises(AttributeError):
+        doc.read_dict
+
+    doc.set("a", "key", "two")
+    doc.set("a", "multi", "m1\nm2")
+    doc.set("a", "new", "n")
+    doc.set("b", "added", "yes")
+    doc.set("DEFAULT", "d", "1")
+    doc.add_section("c")
+    doc.set("c", "k", "v")
+    expected = ("# top\n"
+                "[DEFAULT]\n"
+                "d = 1\n"
+                "\n"
+                "[a]\n"
+                "Key  =  two\n"
+                "  # inner\n"
+                "multi = m1\n"
+                "\tm2\n"
+                "new = n\n"
+                "\n"
+                "# about b\n"
+                "[b]\n"
+                "q: 1\n"
+                "added = yes\n"
+                "\n"
+                "[c]\n"
+                "k = v\n")
+    text = StringIO()
+    doc.write(text)
+    assert text.getvalue() == expected
+    doc.save()
+    assert ini.read_binary().decode("utf-8") == expected
+    parser = StdConfigParser()
+    parser.read(str(ini))
+    assert parser.get("a", "multi") == "m1\nm2"
+    assert parser.get("c", "d") == "1"
+
+    assert doc.remove_option("a", "multi")
+    assert not doc.remove_option("a", "multi")
+    assert doc.remove_section("b")
+    with pytest.raises(NoSectionError):
+        doc.set("b", "x", "1")
+    doc.save()
+    loaded = ConfigDocument()
+    loaded.read(str(ini))
+    assert loaded.get("a", "new") == "n"
+    assert not loaded.has_section("b")
+    text = ini.read_binary().decode("utf-8")
+    assert "# about b\n[c]\n" in text and "# inner\nnew = n\n" in text
+
+    # only the changed lines are written if the file is unchanged
+    ini.write_binary(b"[a]\r\nx = 1\r\ny = 2\r\n")
+    doc = ConfigDocument()
+    doc.read(str(ini))
+    doc.set("a", "y", "3")
+    doc.set("a", "z", "4\n5")
+    doc.save(fsync=False)
+    assert ini.read_binary() == b"[a]\r\nx = 1\r\ny = 3\r\nz = 4\r\n    5\r\n"
+    ini.write_binary(b"[a]\nchanged = 1\n")
+    doc.set("a", "x", "2")
+    doc.save()
+    assert ini.read_binary() == b"[a]\r\nx = 2\r\ny = 3\r\nz = 4\r\n    5\r\n"
+    with pytest.raises(ValueError):
+        ConfigDocument().save()
+
+
+def test_layered_config():
+    texts = ["[DEFAULT]\nroot = /vendor\n[a]\nx = 1\npath = ${root}/a\n"
+             "[b]\ny = 2\n",
+             "[a]\nX = 3\n[c]\nz = 4\n",
+             "[DEFAULT]\nroot = /env\n"]
+    merged = StdConfigParser(interpolate=True)
+    layers = []
+    for text in texts:
+        merged.read_string(text)
+        layers.append(StdConfigParser())
+        layers[-1].read_string(text)
+    vendor, site, env = layers
+    config = LayeredConfig([("vendor", vendor), ("site", site),
+                            ("env", env)], interpolate=True)
+    assert config.layers == ["vendor", "site", "env"]
+    assert config.sections() == merged.sections() == ["a", "b", "c"]
+    for section in config.sections():
+        assert config.items(section) == merged.items(section)
+        assert config.options(section) == merged.options(section)
+    assert config.get("a", "path") == "/env/a"
+    assert config.getint("a", "x") == 3
+    assert config["c"]["root"] == "/env"
+    assert config.layer_of("a", "x") == "site"
+    assert config.layer_of("a", "root") == "env"
+    assert config.layer_of("DEFAULT", "root") == "env"
+    with pytest.raises(NoOptionError):
+        config.layer_of("a", "missing")
+    with pytest.raises(NoSectionError):
+        config.layer_of("missing", "x")
+    with pytest.raises(TypeError):
+        config.set("a", "x", "5")
+    with pytest.raises(TypeError):
+        config["d"] = {}
+    with pytest.raises(TypeError):
+        config["a"] = {}
+    with pytest.raises(TypeError):
+        del config["b"]
+    assert site.get("a", "x") == "3"
+
+    # replacing a layer keeps the others
+    env = StdConfigParser()
+    env.read_string("[a]\nx = 5\n[d]\nw = 6\n")
+    config.set_layer("env", env)
+    assert config.layer("site") is site
+    assert config.get("a", "path") == "/vendor/a"
+    assert config.getint("a", "x") == 5
+    assert config.layer_of("a", "x") == "env"
+    assert config.sections() == ["a", "b", "c", "d"]
+    copied = pickle.loads(pickle.dumps(config))
+    assert copied.layers == config.layers
+    assert copied.items("a") == config.items("a")
+
+
+def test_overlay_environ():
+    parser = StdConfigParser(interpolate=True)
+    parser.read_string("[DEFAULT]\nhost = file\n"
+                       "[service:db]\nport = 1\nurl = ${host}:${port}\n"
+                       "[other]\nref = ${service:db:port}\n")
+    environ = {"APP__SERVICE_DB__PORT": "5432", "APP__DEFAULT__HOST": "env",
+               "APP__OTHER__ADDED": "yes", "PATH": "/bin"}
+    parser.overlay_environ("APP", environ)
+    assert parser.get("service:db", "port") == "5432"
+    assert parser.getint("service:db", "PORT") == 5432
+    assert parser.get("service:db", "url") == "env:5432"
+    assert parser.get("other", "ref") == "5432"
+    assert parser["other"]["added"] == "yes"
+    assert parser.get("service:db", "port", raw=True) == "5432"
+    assert parser.get("service:db", "port", vars={"port": "2"}) == "2"
+    assert parser.items("service:db") == [("host", "env"), ("port", "5432"),
+                                          ("url", "env:5432")]
+    # the values are not copied into the parser
+    text = StringIO()
+    parser.write(text)
+    assert "5432" not in text.getvalue()
+
+    environ["APP__SERVICE_DB__PORT"] = "6543"
+    assert parser.get("service:db", "url") == "env:5432"
+    parser.refresh_environ()
+    assert parser.get("service:db", "url") == "env:6543"
+    parser.overlay_environ(None)
+    assert parser.get("service:db", "url") == "file:1"
+    assert parser.get("other", "added", fallback=None) is None
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+def test_overlay_environ_paths(interpolate):
+    # every read of the values uses the overlay, write() does not
+    parser = StdConfigParser(interpolate=interpolate)
+    parser.read_string("[DEFAULT]\nhost = file\n[a]\nport = 1\n"
+                       "url = ${host}:${port}\n")
+    parser.overlay_environ("APP", {"APP__A__PORT": "99",
+                                   "APP__DEFAULT__HOST": "env"})
+    url = "env:99" if interpolate else "${host}:${port}"
+    expected = {"host": "env", "port": "99", "url": url}
+    assert dict(parser.items("a")) == expected
+    assert dict(parser.resolve_all()["a"]) == expected
+    frozen = parser.freeze()
+    assert dict(frozen["a"]) == expected
+    assert frozen.get("a", "port") == "99"
+    assert frozen.get("a", "port", raw=True) == "99"
+    assert frozen.get("a", "url", raw=True) == "${host}:${port}"
+    assert frozen.defaults() == {"host": "env"}
+    text = StringIO()
+    parser.write(text)
+    assert "port = 1\n" in text.getvalue()
+    assert "env" not in text.getvalue() and "99" not in text.getvalue()
+
+
+def test_schema():
+    parser = StdConfigParser(interpolate=True)
+    parser.read_string("[server]\nhost = example.org\nport = 80\n"
+                       "tags = a, b\n[service:db]\nurl = ${server:host}\n"
+                       "max-size = 10\nhosts = x\n  y\n")
+    schema = Schema({"server": {"host": str, "port": "int",
+                                "tags": "listing",
+                                "debug": ("boolean", False)},
+                     "service:db": {"url": str, "max-size": ("int", 5),
+                                    "hosts": "lines"},
+                     "optional": {"retries": ("int", 3)}})
+    config = schema.validate(parser)
+    assert config.server.port == 80
+    assert config.server.tags == ["a", "b"]
+    assert config.server.debug is False
+    assert config.service_db.url == "example.org"
+    assert config.service_db.max_size == 10
+    assert config.service_db.hosts == ["x", "y"]
+    assert config.optional.retries == 3
+    assert not hasattr(config.server, "__dict__")
+    with pytest.raises(AttributeError):
+        config.server.other = 1
+
+    parser.set("server", "port", "http")
+    parser.remove_option("service:db", "hosts")
+    parser.set("service:db", "url", "${missing}")
+    # the errors in the order of the schema
+    schema = Schema(OrderedDict([
+        ("server", OrderedDict([("port", "int"), ("debug", "boolean")])),
+        ("service:db", OrderedDict([("url", str), ("hosts", "lines")])),
+        ("absent", {"a": "int", "b": "int"})]))
+    with pytest.raises(SchemaError) as info:
+        schema.validate(parser)
+    errors = info.value.errors
+    assert [type(error) for error in errors] == [
+        ValueError, NoOptionError, InterpolationMissingOptionError,
+        NoOptionError, NoSectionError]
+    with pytest.raises(ValueError):
+        Schema({"a": {"a-b": int, "a_b": int}})
+    parser.read_string("[\u00e4]\n\u00f6 = 1\n")
+    values = Schema({"\u00e4": {"\u00f6": "int"}}).validate(parser)
+    # the attribute names are "_" on Python 2
+    section = getattr(values, type(values).__slots__[0])
+    assert getattr(section, type(section).__slots__[0]) == 1
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_sections_under(lazy):
+    parser = StdConfigParser(lazy=lazy)
+    parser.read_string("[service:db:primary]\n[service:db]\n"
+                       "[service:db:replica:eu]\n[service:dbx]\n"
+                       "[service:cache:primary]\n[other]\n")
+    assert parser.sections_under("service:db") == [
+        "service:db:primary", "service:db:replica:eu"]
+    assert parser.sections_under("service:d") == []
+    assert parser.sections_matching("service:*:primary") == [
+        "service:db:primary", "service:cache:primary"]
+    assert parser.sections_matching("service:db?") == ["service:dbx"]
+    assert parser.sections_matching("*") == ["other"]
+
+    # the index follows the changes of the sections
+    parser.add_section("service:db:new")
+    parser.remove_section("service:db:replica:eu")
+    del parser["service:db:primary"]
+    parser.read_string("[service:db:read]\n")
+    parser["service:db:dict"] = {}
+    assert parser.sections_under("service:db") == [
+        "service:db:new", "service:db:read", "service:db:dict"]
+    assert parser.sections_matching("service:db:re*") == ["service:db:read"]
+    assert pickle.loads(pickle.dumps(parser)).sections_under(
+        "service:db") == parser.sections_under("service:db")
+    layer = StdConfigParser()
+    layer.read_string("[service:db:new]\n[service:db:layer]\n")
+    layered = LayeredConfig([("a", parser), ("b", layer)])
+    assert layered.sections_under("service:db") == [
+        "service:db:new", "service:db:read", "service:db:dict",
+        "service:db:layer"]
+
+
+def test_section_proxy():
+    parser = StdConfigParser()
+    parser.read_string("[a]\nn = 1\nl = x, y\n")
+    parser.add_section("b")
+    for name in ("DEFAULT", "a", "b"):
+        assert isinstance(parser[name], SectionProxy)
+        # the abstract base classes of Python 2 have no __slots__
+        if not stdconfigparser.PY2:
+            assert not hasattr(parser[name], "__dict__")
+    section = parser["a"]
+    assert section.getint("n") == 1
+    assert section.getlisting("l") == ["x", "y"]
+    assert section.getfloat("x", 1.5) == 1.5
+    parser.converters["json"] = json.loads
+    assert section.getjson("n") == 1
+    del parser.converters["json"]
+    with pytest.raises(AttributeError):
+        section.getjson
+    with pytest.raises(AttributeError):
+        section.nothing
+    section["m"] = "2"
+    assert dict(section) == {"n": "1", "l": "x, y", "m": "2"}
+    del section["m"]
+    with pytest.raises(KeyError):
+        del section["m"]
+    with pytest.raises(DuplicateSectionError):
+        parser.add_section("a")
+    with pytest.raises(ValueError):
+        parser.add_section("DEFAULT")
+
+
+def test_iterparse():
+    text = "# head\n[a]\nKey = v\n  more\n\n  # c\n  last\n\n[b]\nx:\n"
+    assert list(iterparse(StringIO(text))) == [
+        ("comment", 1, None, "# head"),
+        ("section", 2, "a", None),
+        ("option", 3, "Key", "v"),
+        ("continuation", 4, "Key", "more"),
+        ("continuation", 5, "Key", ""),
+        ("comment", 6, None, "# c"),
+        ("continuation", 7, "Key", "last"),
+        ("continuation", 8, "Key", ""),
+        ("section", 9, "b", None),
+        ("option", 10, "x", ""),
+    ]
+
+    def lines():
+        yield "[a]\n"
+        yield "x = 1\n"
+        raise AssertionError("read too far")
+    events = iterparse(lines())
+    assert next(events) == ("section", 1, "a", None)
+    assert next(events) == ("option", 2, "x", "1")
+
+    events = iterparse(StringIO("[a]\nx = 1\nbad\ny = 2\n"), "test.ini")
+    assert [event[2] for event in itertools.islice(events, 3)] == ["a", "x", "y"]
+    with pytest.raises(ParsingError) as ex:
+        next(events)
+    assert ex.value.source == "test.ini"
+    with pytest.raises(MissingSectionHeaderError):
+        list(iterparse(StringIO("x = 1\n")))
+
+
+def test_mmap(tmpdir):
+    ini = tmpdir.join("a.ini")
+    text = "[a]\r\nkey = vä\r\n  more　\r\n\r\n  # c\r\n  last\n[b]\nx:\n"
+    ini.write_binary(text.encode("utf-8"))
+    parser = StdConfigParser(mmap=True)
+    parser.read(str(ini))
+    expected = StdConfigParser()
+    expected.read(str(ini))
+    assert parser["a"]["key"] == "vä\nmore\n\nlast"
+    assert dict(parser["a"]) == dict(expected["a"])
+    assert dict(parser["b"]) == {"x": ""}
+
+    ini.write("[a]\nx = 1\nbad\n[a]\n")
+    with pytest.raises(DuplicateSectionError) as ex:
+        parser.read(str(ini))
+    assert ex.value.lineno == 4
+    ini.write("[a]\nx = 1\nbad\n")
+    with pytest.raises(ParsingError) as ex:
+        StdConfigParser(mmap=True).read(str(ini))
+    assert ex.value.errors == [(3, repr("bad\n"))]
+
+    ini.write("")
+    parser = StdConfigParser(mmap=True)
+    parser.read([str(ini), str(tmpdir.join("missing.ini"))])
+    assert parser.sections() == []
+
+
+@pytest.mark.parametrize("pool", ["ThreadPoolExecutor",
+                                  "ProcessPoolExecutor"])
+def test_read_executor(tmpdir, pool):
+    futures = pytest.importorskip("concurrent.futures")
+    names = []
+    for i, text in enumerate(["[a]\nx = 1\ny = 1\n", "[b]\nx = 2\n",
+                              "[a]\nx = 3\n[DEFAULT]\nd = 3\n"]):
+        ini = tmpdir.join("%d.ini" % i)
+        ini.write(text)
+        names.append(str(ini))
+    names.insert(1, str(tmpdir.join("missing.ini")))
+    with getattr(futures, pool)(2) as executor:
+        parser = StdConfigParser()
+        parser.read(names, executor=executor)
+        assert parser.sections() == ["a", "b"]
+        assert dict(parser["a"]) == {"x": "3", "y": "1", "d": "3"}
+
+        tmpdir.join("1.ini").write("[b]\nx = 2\n[b]\n")
+        tmpdir.join("0.ini").write("[a]\nx = 1\nbad\n")
+        parser = StdConfigParser()
+        with pytest.raises(ParsingError):
+            parser.read(names, executor=executor)
+        assert parser.sections() == ["a"]
+        parser = StdConfigParser()
+        with pytest.raises(DuplicateSectionError):
+            parser.read(names[1:], executor=executor)
+        assert parser.sections() == ["b"]
+
+
+def test_aread(tmpdir):
+    asyncio = pytest.importorskip("asyncio")
+    names = []
+    for i, text in enumerate(["[a]\nx = 1\ny = 1\n", "[b]\nx = 2\n",
+                              "[a]\nx = 3\n[DEFAULT]\nd = 3\n"]):
+        ini = tmpdir.join("%d.ini" % i)
+        ini.write(text)
+        names.append(str(ini))
+    names.insert(1, str(tmpdir.join("missing.ini")))
+    loop = asyncio.new_event_loop()
+
+    def run(func, *args):
+        # call func in the running loop and wait for the awaitable result
+        awaitable = []
+        loop.call_soon(lambda: awaitable.append(func(*args)))
+        loop.run_until_complete(asyncio.sleep(0))
+        return loop.run_until_complete(awaitable[0])
+    try:
+        parser = StdConfigParser()
+        assert run(parser.aread, names) is None
+        assert parser.sections() == ["a", "b"]
+        assert dict(parser["a"]) == {"x": "3", "y": "1", "d": "3"}
+        parser = StdConfigParser()
+        run(parser.aread, names[0])
+        assert parser.sections() == ["a"]
+
+        tmpdir.join("0.ini").write("[a]\nx = 1\nbad\n")
+        parser = StdConfigParser()
+        with pytest.raises(ParsingError):
+            run(parser.aread, names)
+        assert parser.sections() == ["a"]
+
+        # only the settings are sent to the processes of a pool
+        futures = pytest.importorskip("concurrent.futures")
+        tmpdir.join("0.ini").write("[a]\nx = 1\n")
+        with futures.ProcessPoolExecutor(2) as executor:
+            parser = StdConfigParser(converters={"len": len})
+            parser.optionxform = str
+            run(parser.aread, names, executor)
+        assert parser.sections() == ["a", "b"]
+        assert parser.getlen("a", "x") == 1 and parser.has_option("a", "d")
+
+        config = ReloadableConfig(names[1:])
+        assert not run(config.acheck)
+        tmpdir.join("1.ini").write("[b]\nx = 22\n")
+        assert run(config.acheck)
+        assert config.get("b", "x") == "22"
+        parser = config.parser
+        run(config.areload)
+        assert config.parser is not parser
+    finally:
+        loop.close()
+
+
+def test_read_dir(tmpdir):
+    tmpdir.join("10-a.ini").write("[a]\nx = 1\ny = 1\n")
+    tmpdir.join("20-b.ini").write("[b]\nx = 2\n[a]\nx = 2\n")
+    tmpdir.join("readme.txt").write("no ini")
+    tmpdir.mkdir("30-dir.ini")
+    parser = StdConfigParser()
+    parser.read_string("[base]\nx = 0\n")
+    parser._parse_lines = counted = CountCalls(parser._parse_lines)
+    assert parser.read_dir(str(tmpdir))
+    assert parser.sections() == ["base", "a", "b"]
+    assert parser["a"]["x"] == "2"
+    assert counted.calls == 2
+    assert not parser.read_dir(str(tmpdir))
+    assert counted.calls == 2
+
+    tmpdir.join("10-a.ini").write("[a]\nz = 3\n")
+    tmpdir.join("20-b.ini").remove()
+    tmpdir.join("15-c.ini").write("[c]\n")
+    assert parser.read_dir(str(tmpdir))
+    assert counted.calls == 4
+    assert parser.sections() == ["base", "a", "c"]
+    assert dict(parser["a"]) == {"z": "3"}
+
+    tmpdir.join("15-c.ini").write("[c]\nbad\n")
+    with pytest.raises(ParsingError):
+        parser.read_dir(str(tmpdir))
+    with pytest.raises(ParsingError):
+        parser.read_dir(str(tmpdir))
+    assert counted.calls == 6
+    tmpdir.join("15-c.ini").write("[c]\n")
+    assert parser.read_dir(str(tmpdir))
+    assert parser.sections() == ["base", "a", "c"]
+
+    # changes made after read_dir() are kept over the files
+    parser.set("a", "y", "edit")
+    parser.set("a", "z", "edit")
+    parser.read_string("[extra]\nw = 1\n")
+    parser.remove_section("c")
+    parser.remove_option("base", "x")
+    tmpdir.join("40-d.ini").write("[d]\n[a]\nz = 4\nv = 4\n")
+    assert parser.read_dir(str(tmpdir))
+    assert parser.sections() == ["base", "a", "d", "extra"]
+    assert dict(parser["a"]) == {"z": "edit", "y": "edit", "v": "4"}
+    assert dict(parser["base"]) == {}
+    tmpdir.join("40-d.ini").remove()
+    parser.set("d", "u", "5")
+    assert parser.read_dir(str(tmpdir))
+    assert parser.sections() == ["base", "a", "d", "extra"]
+    assert dict(parser["a"]) == {"z": "edit", "y": "edit"}
+    assert dict(parser["d"]) == {"u": "5"}
+    copied = pickle.loads(pickle.dumps(parser))
+    tmpdir.join("10-a.ini").write("[a]\nz = 3\nt = 6\n")
+    assert copied.read_dir(str(tmpdir))
+    assert dict(copied["a"]) == {"z": "edit", "y": "edit", "t": "6"}
+
+
+class CountCalls(object):
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.func(*args, **kwargs)
+
+
+def test_reloadable_config(tmpdir):
+    ini = tmpdir.join("a.ini")
+    ini.write("[a]\nx = 1\n")
+    config = ReloadableConfig(str(ini))
+    parser = config.parser
+    assert config["a"]["x"] == "1"
+    assert config.getint("a", "x") == 1
+    assert not config.check()
+
+    ini.write("[a]\nx = 22\n")
+    assert config.check()
+    assert config.parser is not parser
+    assert parser.get("a", "x") == "1"
+    assert config.get("a", "x") == "22"
+
+    ini.write("[a]\nbad\n")
+    with pytest.raises(ParsingError):
+        config.check()
+    assert config.get("a", "x") == "22"
+    assert not config.check()
+
+    def wait_for(condition):
+        for _ in range(500):
+            if condition():
+                return True
+            time.sleep(0.01)
+
+    ini.write("[a]\nx = 3\n")
+    config = ReloadableConfig([str(ini)], freeze=True, interval=0.01)
+    assert isinstance(config.parser, FrozenConfig)
+    config.start()
+    try:
+        ini.write("[a]\nx = 44\n")
+        assert wait_for(lambda: config.get("a", "x") == "44")
+        ini.write("[a]\nx = 5\nbad\n")
+        assert wait_for(lambda: config.error is not None)
+        assert isinstance(config.error, ParsingError)
+        assert config.get("a", "x") == "44"
+    finally:
+        config.stop()
+
+
+def test_threadsafe():
+    parser = StdConfigParser(threadsafe=True, cache_size=10)
+    parser.read_string("[a]\nx = 1\ny = 1\n")
+    assert parser.getint("a", "x") == 1
+    assert parser["a"]["y"] == "1"
+    assert list(parser) == ["DEFAULT", "a"]
+
+    keys = ["x", "y"] + ["k%d" % i for i in range(50)]
+    parser.read_dict({"a": dict((k, "1") for k in keys)})
+    errors = []
+    done = []
+
+    def read():
+        try:
+            while not done:
+                for name in parser:
+                    try:
+                        parser.options(name)
+                    except NoSectionError:  # removed while iterating
+                        pass
+                values = set(v for _, v in parser.items("a"))
+                assert len(values) == 1, values
+                assert parser.getint("a", "x") >= 0
+                # never a cleared section while __setitem__ reads it
+                assert parser.get("a", "k49")
+        except Exception as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for i in range(50):
+            parser.read_dict({"a": dict((k, str(i)) for k in keys),
+                              "s%d" % i: {"z": "1"}})
+            # set the values at once as writer
+            with parser.writelock():
+                for key in keys:
+                    parser.set("a", key, "-1")
+                for key in keys:
+                    parser.set("a", key, "0")
+            if i % 2:
+                parser.remove_section("s%d" % (i - 1))
+            else:
+                # replaces the whole section as one writer
+                parser["a"] = dict((k, str(i)) for k in keys)
+                del parser["s%d" % i]
+    finally:
+        done.append(True)
+        for thread in threads:
+            thread.join()
+    assert not errors
+
+
+def test_threadsafe_converter_cache():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(value):
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return int(value)
+
+    parser = StdConfigParser(threadsafe=True, cache_size=10,
+                             converters={"slow": slow})
+    parser.read_string("[a]\nx = 1\n")
+    reader = threading.Thread(target=parser.getslow, args=("a", "x"))
+    reader.start()
+    assert started.wait(5)
+    writer = threading.Thread(target=parser.set, args=("a", "x", "2"))
+    writer.start()
+    # the writer waits for the reader, the converted old value is not
+    # stored after the set()
+    writer.join(0.2)
+    release.set()
+    reader.join()
+    writer.join()
+    assert parser.get("a", "x") == "2"
+    assert parser.getslow("a", "x") == 2
+    assert parser["a"].getslow("x") == 2
+    assert parser.getint("a", "x") == 2